@@ -0,0 +1,296 @@
+"""
+Times each stage of the resume pipeline on synthetic resumes of increasing size.
+
+    python benchmarks/run_benchmarks.py --scales tiny small large --repeat 5 --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json
+
+Stages: load (JSON file to dict), validate, display (terminal text), flowables (platypus objects)
+and build (doc.build layout and serialization into memory). Wall times come from timed runs;
+peak memory comes from a separate tracemalloc pass, so tracing does not skew the timings.
+
+Each renderer backend (--backends reportlab fpdf) and each output profile (--profiles fast
+balanced archive) is also timed end to end, from resume dict to PDF bytes, together with the size
+of the PDF it produces.
+
+Memory per resume held in memory is measured for the plain dicts returned by json.loads and for
+the compact resume_model.ResumeModel built from them (--memory-count resumes per scale).
+
+Corpus validation compares validate_data called per resume with the column-wise validate_batch
+(--corpus-count resumes per scale).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import SCALES, generate_resume
+from file_handler import load_user_data
+from validator import validate_data, validate_batch
+from builder import display_resume
+from resume_model import to_model
+from pdf_generator import build_resume_flowables, create_document, render_resume_pdf, available_backends
+from profiles import available_profiles
+
+DEFAULT_SCALES = ["tiny", "small", "medium", "large"]
+STAGES = ["load", "validate", "display", "flowables", "build"]
+DEFAULT_BACKENDS = ["reportlab", "fpdf"]
+DEFAULT_PROFILES = ["fast", "balanced", "archive"]
+DEFAULT_MEMORY_COUNT = 1000
+DEFAULT_CORPUS_COUNT = 5000
+
+def _stage_runners(path, theme):
+    """
+    Returns one callable per stage. Each takes the output of the previous stage.
+    """
+    def load(_):
+        return load_user_data(path)
+
+    def validate(data):
+        validate_data(data)
+        return data
+
+    def display(data):
+        with contextlib.redirect_stdout(io.StringIO()):
+            display_resume(data)
+        return data
+
+    def flowables(data):
+        return data, build_resume_flowables(data, theme)
+
+    def build(previous):
+        data, elements = previous
+        stream = io.BytesIO()
+        create_document(stream, theme).build(elements)
+        return stream.getbuffer().nbytes
+
+    return [load, validate, display, flowables, build]
+
+def _time_render(data, repeat, **options):
+    pdf = render_resume_pdf(data, **options)  # warm-up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render_resume_pdf(data, **options)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "pdf_bytes": len(pdf),
+    }
+
+def _run_backends(data, backends, repeat, theme):
+    return {backend: _time_render(data, repeat, theme=theme, backend=backend) for backend in backends}
+
+def _run_profiles(data, profiles, repeat, theme):
+    return {profile: _time_render(data, repeat, theme=theme, profile=profile) for profile in profiles}
+
+def _retained_bytes(documents, convert):
+    tracemalloc.start()
+    held = [convert(json.loads(document)) for document in documents]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return retained
+
+def run_memory(scale, count=DEFAULT_MEMORY_COUNT):
+    """
+    Measures the memory held per resume as dicts and as ResumeModels.
+    :param count: Number of distinct synthetic resumes held at once.
+    :return: Dictionary with bytes per resume for each form and their ratio.
+    """
+    documents = [json.dumps(generate_resume(scale, seed=seed)) for seed in range(count)]
+    # The model pass runs last, so strings it interns are not already shared from an earlier pass
+    dict_bytes = _retained_bytes(documents, lambda data: data)
+    model_bytes = _retained_bytes(documents, to_model)
+    return {
+        "count": count,
+        "dict_bytes": dict_bytes / count,
+        "model_bytes": model_bytes / count,
+        "ratio": model_bytes / dict_bytes,
+    }
+
+def run_corpus_validation(scale, count=DEFAULT_CORPUS_COUNT, repeat=3):
+    """
+    Measures the validation throughput of validate_data per resume and of validate_batch.
+    :param count: Number of distinct synthetic resumes validated.
+    :return: Dictionary with resumes per second for each and their ratio (best of repeat runs).
+    """
+    corpus = [generate_resume(scale, seed=seed) for seed in range(count)]
+    now = (2024, 1)
+
+    def per_record():
+        for data in corpus:
+            validate_data(data, now=now)
+
+    def batch():
+        validate_batch(corpus, now=now)
+
+    seconds = {}
+    for name, runner in (("per_record", per_record), ("batch", batch)):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            runner()
+            samples.append(time.perf_counter() - started)
+        seconds[name] = min(samples)
+    return {
+        "count": count,
+        "per_record_rate": count / seconds["per_record"],
+        "batch_rate": count / seconds["batch"],
+        "speedup": seconds["per_record"] / seconds["batch"],
+    }
+
+def run_scale(scale, repeat=5, theme="default", seed=0, backends=None, memory_count=DEFAULT_MEMORY_COUNT,
+              corpus_count=DEFAULT_CORPUS_COUNT, profiles=None):
+    """
+    Benchmarks one synthetic scale.
+    :return: Dictionary of per-stage timings (ms), peak memory (KiB), the PDF size in bytes,
+             the end-to-end render time and PDF size of each backend and output profile, the memory
+             held per resume and the corpus validation throughput.
+    """
+    data = generate_resume(scale, seed=seed)
+    with tempfile.NamedTemporaryFile('w', suffix=".json", delete=False) as file:
+        json.dump(data, file)
+        path = file.name
+
+    try:
+        runners = _stage_runners(path, theme)
+        # Warm-up run so imports, theme styles and font metrics are not billed to the first sample
+        value = None
+        for runner in runners:
+            value = runner(value)
+        pdf_bytes = value
+
+        samples = {stage: [] for stage in STAGES}
+        for _ in range(repeat):
+            value = None
+            for stage, runner in zip(STAGES, runners):
+                started = time.perf_counter()
+                value = runner(value)
+                samples[stage].append((time.perf_counter() - started) * 1000)
+
+        peaks = {}
+        value = None
+        for stage, runner in zip(STAGES, runners):
+            tracemalloc.start()
+            value = runner(value)
+            peaks[stage] = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+    finally:
+        os.remove(path)
+
+    return {
+        "input_bytes": len(json.dumps(data)),
+        "pdf_bytes": pdf_bytes,
+        "stages": {
+            stage: {
+                "median_ms": statistics.median(samples[stage]),
+                "min_ms": min(samples[stage]),
+                "peak_kib": peaks[stage],
+            }
+            for stage in STAGES
+        },
+        "backends": _run_backends(data, backends or DEFAULT_BACKENDS, repeat, theme),
+        "profiles": _run_profiles(data, profiles or DEFAULT_PROFILES, repeat, theme),
+        "memory": run_memory(scale, memory_count) if memory_count else None,
+        "corpus_validation": run_corpus_validation(scale, corpus_count) if corpus_count else None,
+    }
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def run_benchmarks(scales=None, repeat=5, theme="default", backends=None, memory_count=DEFAULT_MEMORY_COUNT,
+                   corpus_count=DEFAULT_CORPUS_COUNT, profiles=None):
+    """
+    Runs every requested scale and returns machine-readable results.
+    """
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "theme": theme,
+        "scales": {scale: run_scale(scale, repeat, theme, backends=backends, memory_count=memory_count,
+                                    corpus_count=corpus_count, profiles=profiles)
+                   for scale in (scales or DEFAULT_SCALES)},
+    }
+
+def print_results(results, baseline=None):
+    header = f"{'scale':<13}{'stage':<11}{'median ms':>11}{'min ms':>10}{'peak KiB':>11}"
+    if baseline:
+        header += f"{'vs base':>10}"
+    print(header)
+    for scale, result in results["scales"].items():
+        for stage, numbers in result["stages"].items():
+            line = (f"{scale:<13}{stage:<11}{numbers['median_ms']:>11.2f}{numbers['min_ms']:>10.2f}"
+                    f"{numbers['peak_kib']:>11.1f}")
+            base = (baseline or {}).get("scales", {}).get(scale, {}).get("stages", {}).get(stage)
+            if base and base["median_ms"] > 0:
+                line += f"{(numbers['median_ms'] / base['median_ms'] - 1) * 100:>+9.1f}%"
+            print(line)
+        print(f"{scale:<13}{'pdf size':<11}{result['pdf_bytes']:>11} bytes")
+        for group in ("backends", "profiles"):
+            for name, numbers in result.get(group, {}).items():
+                line = (f"{scale:<13}{name:<11}{numbers['median_ms']:>11.2f}{numbers['min_ms']:>10.2f}"
+                        f"{numbers['pdf_bytes']:>11} bytes")
+                base = (baseline or {}).get("scales", {}).get(scale, {}).get(group, {}).get(name)
+                if base and base["median_ms"] > 0:
+                    line += f"{(numbers['median_ms'] / base['median_ms'] - 1) * 100:>+9.1f}%"
+                print(line)
+        memory = result.get("memory")
+        if memory:
+            print(f"{scale:<13}{'memory':<11}{memory['dict_bytes']:>11.0f} bytes/resume as dict, "
+                  f"{memory['model_bytes']:.0f} as model ({memory['ratio']:.0%})")
+        corpus = result.get("corpus_validation")
+        if corpus:
+            print(f"{scale:<13}{'corpus':<11}{corpus['per_record_rate']:>11.0f} resumes/s per resume, "
+                  f"{corpus['batch_rate']:.0f} in a batch ({corpus['speedup']:.1f}x)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume pipeline stage by stage.")
+    parser.add_argument("--scales", nargs="+", choices=sorted(SCALES), default=DEFAULT_SCALES)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per scale (default: 5).")
+    parser.add_argument("--theme", default="default")
+    parser.add_argument("--backends", nargs="+", choices=available_backends(), default=DEFAULT_BACKENDS,
+                        help="Renderer backends to compare end to end (default: all).")
+    parser.add_argument("--profiles", nargs="+", choices=available_profiles(), default=DEFAULT_PROFILES,
+                        help="Output profiles to compare end to end with the reportlab backend (default: all).")
+    parser.add_argument("--memory-count", type=int, default=DEFAULT_MEMORY_COUNT,
+                        help="Resumes held at once for the memory comparison, 0 to skip (default: 1000).")
+    parser.add_argument("--corpus-count", type=int, default=DEFAULT_CORPUS_COUNT,
+                        help="Resumes validated for the corpus validation comparison, 0 to skip (default: 5000).")
+    parser.add_argument("--output", metavar="PATH", help="Write the results as JSON to PATH.")
+    parser.add_argument("--compare", metavar="PATH", help="Show the change against an earlier results file.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scales, args.repeat, args.theme, args.backends, args.memory_count,
+                             args.corpus_count, args.profiles)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import random
+
+# Entry counts and text lengths per preset; "small" matches the shape of data/template.json
+SCALES = {
+    "tiny": dict(education=1, experience=1, projects=1, bullets=1, bullet_words=6, courses=2, skills=3),
+    "small": dict(education=1, experience=2, projects=2, bullets=2, bullet_words=12, courses=6, skills=10),
+    "medium": dict(education=2, experience=5, projects=4, bullets=4, bullet_words=20, courses=8, skills=15),
+    "large": dict(education=10, experience=20, projects=20, bullets=6, bullet_words=30, courses=10, skills=40),
+    "pathological": dict(education=100, experience=200, projects=200, bullets=10, bullet_words=120,
+                         courses=20, skills=200),
+}
+
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+
+WORDS = (
+    "designed built shipped scaled migrated automated reduced improved led mentored analysed integrated "
+    "distributed cloud platform pipeline service latency throughput dashboard api database cache queue "
+    "frontend backend mobile reporting billing search ranking model training deployment monitoring "
+    "customers teams stakeholders quarterly revenue cost reliability security compliance accessibility"
+).split()
+
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "Go", "Rust", "Java", "Kotlin", "Swift", "C++", "SQL",
+    "React.js", "Node.js", "Django", "Flask", "FastAPI", "Spring", "Docker", "Kubernetes", "Terraform",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Kafka", "Spark", "TensorFlow", "PyTorch", "Git", "Linux", "AWS",
+]
+
+SOFT_SKILLS = ["Communication", "Leadership", "Problem Solving", "Time Management", "Adaptability",
+               "Collaboration", "Mentoring", "Negotiation", "Presentation", "Critical Thinking"]
+
+def _sentence(rng, words):
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+def _date_range(rng, present=False):
+    start_year = rng.randint(2000, 2020)
+    start = f"{rng.choice(MONTHS)} {start_year}"
+    if present:
+        return f"{start} - Present"
+    return f"{start} - {rng.choice(MONTHS)} {start_year + rng.randint(1, 4)}"
+
+def generate_resume(scale="small", seed=0, **overrides):
+    """
+    Generates a valid resume following the data/template.json shape.
+    :param scale: Name of a preset in SCALES.
+    :param seed: Random seed; the same seed and sizes always give the same resume.
+    :param overrides: Replace any preset size (education, experience, projects, bullets, bullet_words, courses, skills).
+    :return: Resume dictionary.
+    """
+    sizes = dict(SCALES[scale], **overrides)
+    rng = random.Random(seed)
+    bullet_words = sizes["bullet_words"]
+
+    return {
+        "name": f"Candidate {seed}",
+        "contact": {
+            "phone": f"+1 {rng.randint(10**9, 10**10 - 1)}",
+            "email": f"candidate{seed}@example.com",
+            "location": "New York, USA",
+            "linkedin": f"https://www.linkedin.com/in/candidate-{seed}",
+        },
+        "education": [
+            {
+                "institution": f"University {rng.randint(1, 500)} - Example City",
+                "degree": f"Degree in {rng.choice(WORDS).title()} {rng.choice(WORDS).title()}",
+                "dates": _date_range(rng),
+                "relevant_courses": [_sentence(rng, 3)[:-1] for _ in range(sizes["courses"])],
+            }
+            for _ in range(sizes["education"])
+        ],
+        "professional_experience": [
+            {
+                "role": f"{rng.choice(WORDS).title()} Engineer",
+                "organization": f"Company {rng.randint(1, 5000)} Inc.",
+                "location": "Remote",
+                "dates": _date_range(rng, present=index == 0),
+                "responsibilities": [_sentence(rng, bullet_words) for _ in range(sizes["bullets"])],
+            }
+            for index in range(sizes["experience"])
+        ],
+        "projects": [
+            {
+                "name": f"Project {index}",
+                "description": _sentence(rng, bullet_words),
+                "tech_stack": rng.sample(SKILLS, 3),
+            }
+            for index in range(sizes["projects"])
+        ],
+        "skills": {
+            "programming_languages_and_frameworks": [rng.choice(SKILLS) for _ in range(sizes["skills"])],
+            "soft_skills": rng.sample(SOFT_SKILLS, min(5, len(SOFT_SKILLS))),
+        },
+    }
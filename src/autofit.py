@@ -0,0 +1,140 @@
+"""
+Fits a resume onto a target number of pages by scaling the theme's fonts and spacing.
+
+Candidates are tried from the original size downwards: spacing shrinks first, then the font.
+Each font scale's flowables are built and measured (wrapped) once. Every spacing step is then
+estimated from those cached heights with a little arithmetic, because spacing does not change
+how a paragraph wraps. Only a candidate the estimate says fits gets a real doc.build, in memory,
+which confirms the page count. A fit therefore costs about one measuring pass per font scale tried
+plus one or two builds.
+"""
+import io
+from collections import namedtuple
+from functools import lru_cache
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Spacer
+
+from themes import get_theme
+from profiles import DEFAULT_PROFILE
+from resume_ir import as_resume
+from instrumentation import stage
+
+# Tried in order; spacing is given up before font size
+FONT_SCALES = (1, 0.95, 0.9, 0.85, 0.8)
+SPACE_SCALES = (1, 0.75, 0.5, 0.25)
+
+# Confirming builds allowed before settling for the smallest candidate
+MAX_BUILDS = 3
+
+# SimpleDocTemplate's frame keeps 6pt of padding inside the margins on every side
+FRAME_PADDING = 6
+
+FitResult = namedtuple("FitResult", ["theme", "pages", "fits", "font_scale", "space_scale", "builds"])
+
+
+def fit_document(data, target, theme="default", pages=1, profile=DEFAULT_PROFILE):
+    """
+    Renders a resume with the largest font and spacing that keep it within the given page count.
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
+    :param target: File path or writable binary stream.
+    :param theme: Theme name or Theme instance to scale.
+    :param pages: Target page count.
+    :param profile: Output profile name or OutputProfile used for the builds.
+    :return: FitResult with the theme used, the page count and whether it fits. If even the smallest
+             candidate does not fit, that candidate is written anyway.
+    """
+    from pdf_generator import render_document
+
+    theme = get_theme(theme)
+    resume = as_resume(data)
+    builds = 0
+    with stage("render.fit"):
+        for font_scale, space_scale in _candidates(resume, theme, pages):
+            candidate = theme.scaled(font_scale, space_scale)
+            buffer = io.BytesIO()
+            page_count = render_document(resume, buffer, candidate, profile=profile)
+            builds += 1
+            if page_count <= pages:
+                _write(buffer.getvalue(), target)
+                return FitResult(candidate, page_count, True, font_scale, space_scale, builds)
+            if builds >= MAX_BUILDS:
+                break
+
+    font_scale, space_scale = FONT_SCALES[-1], SPACE_SCALES[-1]
+    candidate = theme.scaled(font_scale, space_scale)
+    page_count = render_document(resume, target, candidate, profile=profile)
+    return FitResult(candidate, page_count, page_count <= pages, font_scale, space_scale, builds + 1)
+
+
+def estimate_pages(data, theme="default"):
+    """
+    Estimates the page count of a resume from measured flowable heights, without a doc.build.
+    :return: Estimated number of pages.
+    """
+    theme = get_theme(theme)
+    return _estimate_pages(_measure(as_resume(data), theme), 1, theme)
+
+
+def _candidates(resume, theme, pages):
+    # Scale pairs the estimate says fit, largest first; each font scale is measured only when reached
+    for font_scale in FONT_SCALES:
+        measured = _measure(resume, theme.scaled(font_scale))
+        for space_scale in SPACE_SCALES:
+            if _estimate_pages(measured, space_scale, theme) <= pages:
+                yield font_scale, space_scale
+
+
+def _measure(resume, theme):
+    """
+    Wraps each flowable once at the frame width.
+    :return: List of (height, gap, splittable) tuples. gap is the vertical space that scales with
+             spacing: a spacer's height, or a paragraph's spaceBefore plus spaceAfter.
+    """
+    from pdf_generator import build_resume_flowables
+
+    width = theme.frame_width - 2 * FRAME_PADDING
+    height = theme.pagesize[1] - 2 * theme.margin - 2 * FRAME_PADDING
+    canvas = _measuring_canvas()
+    measured = []
+    for flowable in build_resume_flowables(resume, theme):
+        if isinstance(flowable, Spacer):
+            measured.append((0, flowable.height, False))
+            continue
+        _, flowable_height = flowable.wrapOn(canvas, width, height)
+        gap = flowable.getSpaceBefore() + flowable.getSpaceAfter()
+        measured.append((flowable_height, gap, True))
+    return measured
+
+
+@lru_cache(maxsize=None)
+def _measuring_canvas():
+    # Lists need a canvas to wrap on; nothing is ever drawn on this one
+    return Canvas(io.BytesIO())
+
+
+def _estimate_pages(measured, space_scale, theme):
+    frame_height = theme.pagesize[1] - 2 * theme.margin - 2 * FRAME_PADDING
+    pages = 1
+    used = 0
+    for height, gap, splittable in measured:
+        total = height + gap * space_scale
+        if used + total <= frame_height:
+            used += total
+        elif splittable:
+            # Paragraphs, lists and tables split across the page break
+            overflow = used + total - frame_height
+            pages += 1 + int(overflow // frame_height)
+            used = overflow % frame_height
+        else:
+            pages += 1
+            used = 0
+    return pages
+
+
+def _write(pdf, target):
+    if isinstance(target, str):
+        with open(target, 'wb') as file:
+            file.write(pdf)
+    else:
+        target.write(pdf)
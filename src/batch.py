@@ -0,0 +1,348 @@
+import glob
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import instrumentation
+from instrumentation import stage
+from file_handler import load_user_data, iter_user_data, iter_user_records, RecordError, JSONL_EXTENSIONS
+from date_parser import reference_month
+from render_cache import RenderCache
+from resume_ir import normalize
+from profiles import get_profile
+from themes import get_theme
+from validator import validate_data
+
+# Items handed to the pool ahead of the oldest unfinished one, per worker
+SUBMIT_AHEAD = 4
+
+# Per-process state filled in by the pool initializer
+_worker = {}
+
+# Returned by next() once the items of _map_bounded run out; None is a valid item
+_END = object()
+
+
+def collect_inputs(source):
+    """
+    Expands a batch source into work items.
+    :param source: A directory of JSON files, a glob pattern, a JSONL file or a file holding a JSON array of resumes.
+    :return: List of (item_id, path, record) tuples. record is None when the worker should load the file itself.
+    """
+    return list(iter_inputs(source))
+
+
+def iter_inputs(source):
+    """
+    Streams the work items of a batch source; multi-record files are read one record at a time.
+    :param source: Same forms as collect_inputs.
+    :return: Iterator of (item_id, path, record) tuples, see collect_inputs.
+    """
+    for path in expand_source(source):
+        if path.endswith(JSONL_EXTENSIONS) or is_json_array(path):
+            yield from _iter_records(path)
+        else:
+            yield path, path, None
+
+
+def iter_resumes(source):
+    """
+    Streams the resume dictionaries of a batch source in order, without collecting them first.
+    Bad records are reported and skipped.
+    :param source: Same forms as collect_inputs.
+    :return: Iterator of resume dictionaries.
+    """
+    for path in expand_source(source):
+        if path.endswith(JSONL_EXTENSIONS) or is_json_array(path):
+            yield from iter_user_data(path)
+        else:
+            yield load_user_data(path)
+
+
+def expand_source(source):
+    """
+    Lists the input files of a batch source.
+    :param source: A directory (its .json and JSONL files), a single file or a glob pattern.
+    :return: Sorted list of file paths.
+    """
+    if os.path.isdir(source):
+        return sorted(
+            path for pattern in ("*.json",) + tuple(f"*{ext}" for ext in JSONL_EXTENSIONS)
+            for path in glob.glob(os.path.join(source, pattern))
+        )
+    if os.path.isfile(source):
+        return [source]
+    return sorted(glob.glob(source))
+
+
+def is_json_array(path):
+    """
+    Tells whether a file holds a JSON array of resumes rather than a single resume, from its first bytes.
+    """
+    with open(path, 'rb') as file:
+        head = file.read(64)
+    # Drops a byte order mark and the zero bytes of UTF-16 and UTF-32 text
+    return head.replace(b"\0", b"").lstrip(b"\xef\xbb\xbf\xff\xfe \t\r\n")[:1] == b"["
+
+
+def _iter_records(path):
+    # Bad records are kept as items so they show up in the summary, in file order
+    errors = []
+    for record in iter_user_records(path, on_error=errors.append):
+        yield from _error_items(path, errors)
+        yield f"{path}:{record.line}", path, record.data
+    yield from _error_items(path, errors)
+
+
+def _error_items(path, errors):
+    items = [(f"{path}:{error.line}", path, error) for error in errors]
+    errors.clear()
+    return items
+
+
+def _init_worker(output_folder, theme, now, use_cache, metrics=False, backend="reportlab", fit_pages=None,
+                 profile="balanced", claims=None):
+    """
+    Pool initializer: imports reportlab once per worker process and keeps the renderer around.
+    :param claims: Folder shared by the workers of one run to claim output file names in, see _claim_file.
+    """
+    if metrics:
+        instrumentation.enable()
+    from pdf_generator import generate_resume_pdf, render_cache_key, resume_pdf_path, get_backend
+    _worker["generate"] = generate_resume_pdf
+    _worker["output_path"] = resume_pdf_path
+    _worker["cache_key"] = render_cache_key
+    # Workers only read the manifest; the parent process records new renders and saves it
+    _worker["cache"] = RenderCache(output_folder) if use_cache else None
+    _worker["output_folder"] = output_folder
+    # Resolve the theme up front so its styles are shared by every resume this worker renders
+    _worker["theme"] = get_theme(theme)
+    _worker["now"] = now
+    _worker["backend"] = get_backend(backend)
+    _worker["fit_pages"] = fit_pages
+    _worker["profile"] = profile
+    _worker["claims"] = claims
+
+
+def _render_item(item):
+    result = _render_one(item)
+    if instrumentation.is_enabled():
+        # Ship this item's stage timings back so the parent can aggregate them
+        result["metrics"] = instrumentation.drain()
+    return result
+
+
+def _render_one(item):
+    item_id, path, record = item
+    started = time.perf_counter()
+    result = {"id": item_id, "status": "ok", "output": None, "errors": []}
+
+    if isinstance(record, RecordError):
+        result["status"] = "error"
+        result["errors"] = [f"Bad record at byte {record.offset}: {record.message}"]
+        result["seconds"] = time.perf_counter() - started
+        return result
+
+    if record is not None:
+        user_data = record
+    else:
+        with stage("load"):
+            user_data = load_user_data(path)
+
+    if not user_data:
+        result["status"] = "error"
+        result["errors"] = ["No user data found."]
+    else:
+        with stage("validate"):
+            is_valid, errors = validate_data(user_data, now=_worker["now"])
+        if not is_valid:
+            result["status"] = "invalid"
+            result["errors"] = errors
+        else:
+            _render_valid(user_data, result)
+
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _render_valid(user_data, result):
+    # Normalize once; the cache key and the renderer both work from the same IR
+    resume = normalize(user_data)
+    cache = _worker["cache"]
+    if cache is not None:
+        result["cache_key"] = _worker["cache_key"](resume, _worker["theme"], _worker["backend"], _worker["fit_pages"],
+                                                   _worker["profile"])
+        cached_path = cache.lookup(result["cache_key"])
+        # Another item of this run may already have claimed the cached file's name
+        if cached_path and _claim_file(cached_path):
+            result["output"] = cached_path
+            result["cached"] = True
+            return
+
+    output_path = unique_output_path(_worker["output_path"](resume, _worker["output_folder"]), _claim_file)
+    try:
+        with stage("render"):
+            result["output"] = _worker["generate"](
+                resume, _worker["output_folder"], _worker["theme"], backend=_worker["backend"],
+                fit_pages=_worker["fit_pages"], profile=_worker["profile"], output_path=output_path
+            )
+        result["bytes"] = os.path.getsize(result["output"])
+    except Exception as exc:  # one broken resume must not stop the batch
+        result["status"] = "error"
+        result["errors"] = [f"{type(exc).__name__}: {exc}"]
+
+
+def unique_output_path(path, claim):
+    """
+    Picks the output path of one item of a run, so resumes with the same name never overwrite each other.
+    :param path: Path the resume would be saved to on its own, e.g. output/John_Doe_resume.pdf.
+    :param claim: Callable taking a path and returning True if the item got it, False if another item has it.
+    :return: path, or the first free one of output/John_Doe_resume_2.pdf, output/John_Doe_resume_3.pdf and so on.
+    """
+    stem, extension = os.path.splitext(path)
+    candidate, number = path, 1
+    while not claim(candidate):
+        number += 1
+        candidate = f"{stem}_{number}{extension}"
+    return candidate
+
+
+def _claim_file(path):
+    # Workers are separate processes; creating an empty marker file with O_EXCL lets exactly one of them win
+    if _worker["claims"] is None:
+        return True
+    try:
+        os.close(os.open(os.path.join(_worker["claims"], os.path.basename(path)), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
+def run_batch(source, output_folder="output", workers=None, summary_path=None, theme="default", use_cache=True,
+              metrics=None, backend="reportlab", fit_pages=None, profile="balanced"):
+    """
+    Renders every resume in a batch source across a pool of worker processes.
+    :param source: A directory, a glob pattern, or a JSONL file.
+    :param output_folder: The folder where the resume PDFs will be saved.
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param summary_path: Optional path to write the per-item summary as JSON.
+    :param theme: Name of the theme used for every resume in the batch.
+    :param use_cache: Skip resumes whose content, theme and renderer version match a previous render.
+    :param metrics: Collect per-stage timings from the workers (defaults to whether instrumentation is enabled).
+    :param backend: Renderer backend used for every resume in the batch ("reportlab" or "fpdf").
+    :param fit_pages: Shrink every resume to fit on this many pages (reportlab only).
+    :param profile: Output profile used for every resume ("fast", "balanced" or "archive").
+    :return: Summary dictionary with per-item results and totals.
+    """
+    # Fail here on an unknown theme or profile rather than in every pool initializer (a BrokenProcessPool)
+    get_theme(theme)
+    get_profile(profile)
+    if metrics is None:
+        metrics = instrumentation.is_enabled()
+    workers = workers or os.cpu_count() or 1
+    # One "now" for the whole batch so every "Present" date is checked against the same month
+    now = reference_month()
+
+    # Created here once; workers creating it themselves could race and fail an item with FileExistsError
+    os.makedirs(output_folder, exist_ok=True)
+
+    started = time.perf_counter()
+    # The pool starts its processes on the first submit, so an empty source costs nothing
+    with tempfile.TemporaryDirectory(prefix="resume-claims-") as claims, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(output_folder, theme, now, use_cache, metrics, backend, fit_pages, profile, claims)) as pool:
+        results = _map_bounded(pool, _render_item, iter_inputs(source), workers * SUBMIT_AHEAD)
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        worker_metrics = result.pop("metrics", None)
+        if worker_metrics:
+            instrumentation.merge(worker_metrics)
+
+    if use_cache:
+        cache = RenderCache(output_folder)
+        for result in results:
+            if result["status"] != "ok" or "cache_key" not in result:
+                continue
+            if result.get("cached"):
+                cache.lookup(result["cache_key"])  # refreshes last_used
+            else:
+                cache.store(result["cache_key"], result["output"])
+        cache.save()
+
+    summary = summarize(source, workers, results, elapsed, profile)
+
+    if summary_path:
+        with open(summary_path, 'w') as file:
+            json.dump(summary, file, indent=2)
+
+    return summary
+
+
+def _map_bounded(pool, function, items, limit):
+    """
+    Like pool.map, but reads the next item only when fewer than limit are unfinished, so the records
+    of a large source are never all in memory at once.
+    :param pool: Executor to submit to.
+    :param function: Callable run on each item in the pool.
+    :param items: Iterator of items; consumed lazily.
+    :param limit: Most items submitted but not yet collected.
+    :return: List of results in item order.
+    """
+    pending = deque()
+    results = []
+    exhausted = False
+    while True:
+        while not exhausted and len(pending) < limit:
+            with stage("collect"):
+                item = next(items, _END)
+            if item is _END:
+                exhausted = True
+                break
+            pending.append(pool.submit(function, item))
+        if not pending:
+            return results
+        results.append(pending.popleft().result())
+
+
+def summarize(source, workers, results, elapsed, profile="balanced"):
+    """
+    Builds the summary of a batch run from its per-item results.
+    :return: Summary dictionary with the totals, including the bytes written with the output profile.
+    """
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    return {
+        "source": source,
+        "workers": workers,
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "cached": sum(1 for result in results if result.get("cached")),
+        "seconds": elapsed,
+        "throughput": len(results) / elapsed if elapsed > 0 else 0.0,
+        "profile": getattr(profile, "name", profile),
+        "bytes": sum(result.get("bytes", 0) for result in results),
+        "items": results,
+    }
+
+
+def print_summary(summary):
+    """
+    Prints the failures of a batch followed by a one-line total.
+    :param summary: Summary dictionary returned by run_batch.
+    """
+    for result in summary["items"]:
+        if result["status"] != "ok":
+            print(f"[{result['status'].upper()}] {result['id']}")
+            for error in result["errors"]:
+                print(f"  - {error}")
+
+    print(
+        f"Rendered {summary['succeeded']}/{summary['total']} resumes ({summary['cached']} unchanged) "
+        f"in {summary['seconds']:.2f}s ({summary['throughput']:.1f} resumes/s, {summary['workers']} workers)"
+    )
+    written = sum(1 for result in summary["items"] if "bytes" in result)
+    if written:
+        print(f"Wrote {summary['bytes']:,} bytes ({summary['bytes'] // written:,} per PDF, {summary['profile']} profile)")
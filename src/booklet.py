@@ -0,0 +1,125 @@
+"""
+Lays out many resumes into one PDF (a booklet) in a single reportlab build.
+
+Every resume starts on a new page and gets an entry in the PDF outline (the bookmarks panel).
+Fonts and other resources are written once for the whole booklet instead of once per resume,
+and no per-resume PDFs are written and merged afterwards. The flowables are built while the
+booklet is laid out (see lazy_flowables), so memory does not grow with the number of resumes.
+
+    render_booklet(resumes, "output/committee.pdf")
+"""
+import os
+from itertools import chain
+
+from reportlab.platypus import Flowable, PageBreak
+
+from themes import get_theme
+from resume_ir import as_resume, normalize
+from instrumentation import stage
+from lazy_flowables import LazyFlowables
+from date_parser import reference_month
+from validator import validate_data
+
+
+class Bookmark(Flowable):
+    """
+    Zero-size flowable that marks the page it lands on and adds it to the outline.
+    """
+
+    def __init__(self, title, key, entries):
+        Flowable.__init__(self)
+        self.title = title
+        self.key = key
+        self.entries = entries
+
+    def wrap(self, available_width, available_height):
+        return 0, 0
+
+    def draw(self):
+        canvas = self.canv
+        canvas.bookmarkPage(self.key)
+        canvas.addOutlineEntry(self.title, self.key, level=0)
+        if not self.entries:
+            canvas.showOutline()  # open the bookmarks panel when the booklet is opened
+        self.entries.append((self.title, canvas.getPageNumber()))
+
+
+def render_booklet(resumes, target, theme="default", profile="balanced"):
+    """
+    Renders several resumes into one PDF, each starting on a new page with its own bookmark.
+    :param resumes: Iterable of resume dictionaries or resume_ir.Resume objects; consumed as the layout reaches them.
+    :param target: File path or writable binary stream.
+    :param theme: Theme name or Theme instance controlling layout and styles.
+    :param profile: Output profile name controlling compression and image quality.
+    :return: Tuple of the bookmarks as (title, first page number) pairs, one per resume, and the page count.
+    """
+    from pdf_generator import create_document
+    from profiles import applied
+
+    theme = get_theme(theme)
+    doc = create_document(target, theme, profile)
+    entries = []
+    # Building the flowables is counted in render.build, as for a lazily built resume
+    with stage("render.build"), applied(profile):
+        doc.build(LazyFlowables(_iter_flowables(resumes, theme, profile, entries)))
+    return entries, doc.page
+
+
+def _iter_flowables(resumes, theme, profile, entries):
+    from pdf_generator import iter_resume_flowables
+
+    for index, data in enumerate(resumes):
+        resume = as_resume(data)
+        if index:
+            yield PageBreak()
+        yield Bookmark(resume.name or "Unnamed", f"resume-{index}", entries)
+        yield from iter_resume_flowables(resume, theme, profile)
+
+
+def write_booklet(source, output_path, theme="default", profile="balanced"):
+    """
+    Validates every resume in a batch source and writes the valid ones into one booklet PDF.
+    Invalid resumes are reported and left out.
+    :param source: A directory, glob pattern, JSONL file or JSON array file (see batch.collect_inputs).
+    :param output_path: Path of the booklet PDF.
+    :param theme: Theme name used for every resume.
+    :param profile: Output profile name.
+    :return: Summary dictionary with the included resumes, the skipped ones and the page count.
+    """
+    from batch import iter_resumes
+
+    # One "now" for the whole booklet so every "Present" date is checked against the same month
+    now = reference_month()
+    skipped = 0
+
+    def valid_resumes():
+        # Read and validated one at a time, as the layout reaches each resume
+        nonlocal skipped
+        for index, user_data in enumerate(iter_resumes(source), 1):
+            if not user_data:
+                print(f"[ERROR] Resume {index}: No user data found.")
+                skipped += 1
+                continue
+            with stage("validate"):
+                is_valid, errors = validate_data(user_data, now=now)
+            if not is_valid:
+                print(f"[INVALID] Resume {index} ({user_data.get('name') or 'Unnamed'})")
+                for error in errors:
+                    print(f"  - {error}")
+                skipped += 1
+                continue
+            yield normalize(user_data)
+
+    resumes = valid_resumes()
+    # Nothing is written unless at least one resume is valid
+    first = next(resumes, None)
+    if first is None:
+        print(f"No valid resumes found, booklet not written ({skipped} skipped)")
+        return {"output": None, "included": [], "skipped": skipped, "pages": 0}
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with stage("render"):
+        entries, pages = render_booklet(chain([first], resumes), output_path, theme, profile)
+    print(f"Booklet saved to: {output_path} ({len(entries)} resumes, {pages} pages, {skipped} skipped, "
+          f"{os.path.getsize(output_path):,} bytes)")
+    return {"output": output_path, "included": entries, "skipped": skipped, "pages": pages}
@@ -1,40 +1,94 @@
+import sys
+
 from file_handler import load_user_data
+from resume_ir import as_resume, SEPARATOR
+
+# display_resumes writes to the stream once this many characters have accumulated
+STREAM_BUFFER_SIZE = 64 * 1024
+
+def render_text(user_data):
+    """
+    Renders a resume as plain text for the terminal. Missing fields are shown as empty.
+    :param user_data: Dictionary containing resume information, or its resume_ir.Resume.
+    :return: The text, ending with a newline.
+    """
+    if not user_data:
+        return "Error: No user data found\n"
+
+    resume = as_resume(user_data)
+    contact = resume.contact
 
-def display_resume(user_data):
-    if not(user_data):
-        print("Error: No user data found")
-        return
-    
     # Basic info
-    print("Name:", user_data.get("name"))
-    print("Phone:", user_data.get("contact", {}).get("phone"))
-    print("Email:", user_data.get("contact", {}).get("email"))
-    print("Location:", user_data.get("contact", {}).get("Location"))
-    print("Linkedin:", user_data.get("contact", {}).get("linkedin"))
+    lines = [
+        f"Name: {resume.name}",
+        f"Phone: {contact.phone}",
+        f"Email: {contact.email}",
+        f"Location: {contact.location}",
+        f"Linkedin: {contact.linkedin}",
+    ]
+    append = lines.append
 
     # Education
-    print("\nEducation:")
-    for edu in user_data.get("education", []):
-        print(f"  - {edu['degree']} from {edu['institution']} ({edu['dates']})")
-        print(f"  Relevant Courses: {', '.join(edu['relevant_courses'])}")
-    
+    append("\nEducation:")
+    for edu in resume.education:
+        append(f"  - {edu.degree} from {edu.institution} ({edu.dates})")
+        append(f"  Relevant Courses: {edu.courses or ''}")
+
     # Professional Experience
-    print("\nProfessional Experience:")
-    for exp in user_data.get("professional_experience", []):
-        print(f"  - {exp['role']} at {exp['organization']} ({exp['dates']})")
-        print(f"    Location: {exp['location']}")
-        print(f"    Responsibilities: {', '.join(exp['responsibilities'])}")
+    append("\nProfessional Experience:")
+    for exp in resume.experience:
+        append(f"  - {exp.role} at {exp.organization} ({exp.dates})")
+        append(f"    Location: {exp.location}")
+        append(f"    Responsibilities: {SEPARATOR.join(exp.responsibilities)}")
 
     # Projects
-    print("\nProjects:")
-    for proj in user_data.get("projects", []):
-        print(f"  - {proj['name']}: {proj['description']}")
-        print(f"    Tech Stack: {', '.join(proj['tech_stack'])}")
+    append("\nProjects:")
+    for proj in resume.projects:
+        append(f"  - {proj.name}: {proj.description}")
+        append(f"    Tech Stack: {proj.tech_stack}")
 
     # Skills
-    print("\nSkills:")
-    print("  Programming Languages & Frameworks:", ", ".join(user_data.get("skills", {}).get("programming_languages_and_frameworks", [])))
-    print("  Soft Skills:", ", ".join(user_data.get("skills", {}).get("soft_skills", [])))
+    append("\nSkills:")
+    append(f"  Programming Languages & Frameworks: {resume.programming_skills}")
+    append(f"  Soft Skills: {resume.soft_skills}")
+
+    append("")
+    return "\n".join(lines)
+
+def display_resume(user_data, stream=None):
+    """
+    Prints a resume to the terminal with a single write.
+    :param user_data: Dictionary containing resume information.
+    :param stream: Text stream to write to (default: sys.stdout).
+    """
+    (stream or sys.stdout).write(render_text(user_data))
+
+def display_resumes(resumes, stream=None, buffer_size=STREAM_BUFFER_SIZE):
+    """
+    Writes many resumes, separated by a blank line, buffering at most about buffer_size characters.
+    :param resumes: Iterable of resume dictionaries; it is consumed lazily.
+    :param stream: Text stream to write to (default: sys.stdout).
+    :param buffer_size: Number of characters collected before each write.
+    :return: Number of resumes written.
+    """
+    stream = stream or sys.stdout
+    pending = []
+    pending_size = 0
+    count = 0
+    for user_data in resumes:
+        text = render_text(user_data)
+        if count:
+            text = "\n" + text
+        pending.append(text)
+        pending_size += len(text)
+        count += 1
+        if pending_size >= buffer_size:
+            stream.write("".join(pending))
+            pending.clear()
+            pending_size = 0
+    if pending:
+        stream.write("".join(pending))
+    return count
 
 def main():
     user_data = load_user_data("data/user_data.json")
@@ -42,4 +96,4 @@ def main():
     display_resume(user_data)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
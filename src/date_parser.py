@@ -0,0 +1,123 @@
+import re
+from collections import namedtuple
+from datetime import date, datetime
+from functools import lru_cache
+
+# Parsed '<Start> - <End>' range. start and end are (year, month) tuples; present is True for '... - Present'.
+DateRange = namedtuple("DateRange", ["start", "end", "present"])
+
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
+
+# Full names, three-letter abbreviations and a few common variants, independent of the locale
+MONTHS = {}
+for _number, _name in enumerate(MONTH_NAMES, start=1):
+    MONTHS[_name.lower()] = _number
+    MONTHS[_name[:3].lower()] = _number
+MONTHS["sept"] = 9
+
+_RANGE_SEPARATOR = re.compile(r"\s+(?:-|–|—|to)\s+|\s*[–—]\s*")
+_NAMED_MONTH = re.compile(r"([A-Za-z]+)\.?,?\s+(\d{4})")
+_NUMERIC_MONTH = re.compile(r"(\d{1,2})[/.](\d{4})")
+
+def reference_month(now=None):
+    """
+    Normalizes a "now" reference to a (year, month) tuple.
+    Take it once per batch and pass it to parse_date_range so "Present" entries share one clock reading.
+    :param now: A datetime, date, (year, month) tuple, or None for the current month.
+    :return: (year, month) tuple.
+    """
+    if now is None:
+        now = datetime.now()
+    if isinstance(now, (datetime, date)):
+        return (now.year, now.month)
+    return now
+
+def parse_month_year(text):
+    """
+    Parses 'August 2023', 'Aug 2023', 'Aug. 2023' or '08/2023'.
+    :param text: Month-year string.
+    :return: (year, month) tuple, or None if the text is not a month and year.
+    """
+    text = text.strip()
+    match = _NAMED_MONTH.fullmatch(text)
+    if match:
+        month = MONTHS.get(match.group(1).lower())
+    else:
+        match = _NUMERIC_MONTH.fullmatch(text)
+        if not match:
+            return None
+        month = int(match.group(1))
+        if not 1 <= month <= 12:
+            return None
+    if month is None:
+        return None
+    return (int(match.group(2)), month)
+
+@lru_cache(maxsize=4096)
+def _parse_range_text(date_range):
+    parts = _RANGE_SEPARATOR.split(date_range.strip(), maxsplit=1)
+    if len(parts) != 2:
+        return None
+    start = parse_month_year(parts[0])
+    if start is None:
+        return None
+    if parts[1].strip().lower() == "present":
+        return (start, None)
+    end = parse_month_year(parts[1])
+    if end is None:
+        return None
+    return (start, end)
+
+def parse_date_range(date_range, now=None):
+    """
+    Parses '<Start Month Year> - <End Month Year>' or '<Start Month Year> - Present'.
+    Results are memoized per string; "Present" is resolved against now after the cache lookup.
+    :param date_range: String containing the date range.
+    :param now: Reference for "Present", as accepted by reference_month.
+    :return: DateRange, or None if the string cannot be parsed.
+    """
+    parsed = _parse_range_text(date_range)
+    if parsed is None:
+        return None
+    start, end = parsed
+    if end is None:
+        return DateRange(start, reference_month(now), True)
+    return DateRange(start, end, False)
+
+def parse_date_ranges(date_ranges, now=None):
+    """
+    Parses many date ranges at once, e.g. a whole column of a corpus. Each distinct month-year text
+    is parsed only once, however many ranges it appears in.
+    :param date_ranges: Iterable of date range strings.
+    :param now: Reference for "Present", as accepted by reference_month.
+    :return: Dictionary mapping each date range to its DateRange, or None if it cannot be parsed.
+    """
+    now = reference_month(now)
+    months = {}
+
+    def month(text):
+        if text not in months:
+            months[text] = parse_month_year(text)
+        return months[text]
+
+    parsed = {}
+    for date_range in date_ranges:
+        parts = _RANGE_SEPARATOR.split(date_range.strip(), maxsplit=1)
+        start = month(parts[0]) if len(parts) == 2 else None
+        if start is None:
+            parsed[date_range] = None
+        elif parts[1].strip().lower() == "present":
+            parsed[date_range] = DateRange(start, now, True)
+        else:
+            end = month(parts[1])
+            parsed[date_range] = DateRange(start, end, False) if end is not None else None
+    return parsed
+
+def format_month(year_month, abbreviate=False):
+    """
+    Formats a (year, month) tuple as 'August 2023', or 'Aug 2023' when abbreviate is True.
+    """
+    year, month = year_month
+    name = MONTH_NAMES[month - 1]
+    return f"{name[:3] if abbreviate else name} {year}"
@@ -0,0 +1,193 @@
+"""
+Renders one resume to several output formats from a single normalized IR (see resume_ir).
+
+    outputs = render_formats(user_data, ["html", "markdown", "text"])
+    paths = export_resume(user_data, "output", ["pdf", "html"])
+"""
+import html
+import os
+import re
+
+from builder import render_text
+from resume_ir import as_resume
+
+# Output format -> file extension
+FORMATS = {
+    "pdf": ".pdf",
+    "html": ".html",
+    "markdown": ".md",
+    "text": ".txt",
+}
+
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]<>#|])")
+
+HTML_STYLE = (
+    "body{font-family:Helvetica,Arial,sans-serif;max-width:46em;margin:2em auto;font-size:11pt}"
+    "h1,.contact{text-align:center}h2{border-bottom:1px solid #000;font-size:14pt}"
+    ".entry{display:flex;justify-content:space-between}"
+)
+
+
+def to_markdown(resume):
+    """
+    :param resume: Resume dictionary or resume_ir.Resume.
+    :return: The resume as Markdown.
+    """
+    resume = as_resume(resume)
+    md = _escape_markdown
+    contact = resume.contact
+    contact_fields = [md(contact.phone), md(contact.email), md(contact.location)]
+    if contact.linkedin:
+        contact_fields.append(f"<{contact.linkedin}>")
+    lines = [f"# {md(resume.name)}", "", " | ".join(field for field in contact_fields if field), ""]
+
+    lines += ["## Education", ""]
+    for edu in resume.education:
+        lines.append(f"**{md(edu.institution)}** — {md(edu.dates)}  ")
+        lines.append(f"*{md(edu.degree)}*  ")
+        if edu.courses is not None:
+            lines.append(f"Relevant Courses: {md(edu.courses)}")
+        lines.append("")
+
+    lines += ["## Professional Experience", ""]
+    for exp in resume.experience:
+        lines.append(f"**{md(exp.organization)}** — {md(exp.dates)}  ")
+        lines.append(f"*{md(exp.role)}*" + (f", {md(exp.location)}" if exp.location else ""))
+        lines.append("")
+        if exp.responsibilities:
+            lines += [f"- {md(item)}" for item in exp.responsibilities]
+            lines.append("")
+
+    lines += ["## Projects", ""]
+    for proj in resume.projects:
+        lines += [f"**{md(proj.name)}**", "", f"- {md(proj.description)}", f"- Tech Stack: {md(proj.tech_stack)}", ""]
+
+    lines += [
+        "## Skills",
+        "",
+        f"**Programming Languages & Frameworks:** {md(resume.programming_skills)}  ",
+        f"**Soft Skills:** {md(resume.soft_skills)}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def to_html(resume):
+    """
+    :param resume: Resume dictionary or resume_ir.Resume.
+    :return: The resume as a standalone HTML document.
+    """
+    resume = as_resume(resume)
+    esc = html.escape
+    contact = resume.contact
+    contact_fields = [esc(contact.phone), esc(contact.email), esc(contact.location)]
+    if contact.linkedin:
+        contact_fields.append(f'<a href="{esc(contact.linkedin)}">{esc(contact.linkedin)}</a>')
+
+    parts = [
+        '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n',
+        f"<title>{esc(resume.name)}</title>\n<style>{HTML_STYLE}</style>\n</head>\n<body>\n",
+        f'<header>\n<h1>{esc(resume.name)}</h1>\n<p class="contact">{" | ".join(field for field in contact_fields if field)}</p>\n</header>\n',
+        "<section>\n<h2>Education</h2>\n",
+    ]
+    for edu in resume.education:
+        parts.append(f'<div class="entry"><strong>{esc(edu.institution)}</strong>{_html_dates(edu)}</div>\n'
+                     f"<p><em>{esc(edu.degree)}</em></p>\n")
+        if edu.courses is not None:
+            parts.append(f"<p>Relevant Courses: {esc(edu.courses)}</p>\n")
+    parts.append("</section>\n<section>\n<h2>Professional Experience</h2>\n")
+    for exp in resume.experience:
+        location = f", {esc(exp.location)}" if exp.location else ""
+        parts.append(f'<div class="entry"><strong>{esc(exp.organization)}</strong>{_html_dates(exp)}</div>\n'
+                     f"<p><em>{esc(exp.role)}</em>{location}</p>\n")
+        if exp.responsibilities:
+            parts.append("<ul>" + "".join(f"<li>{esc(item)}</li>" for item in exp.responsibilities) + "</ul>\n")
+    parts.append("</section>\n<section>\n<h2>Projects</h2>\n")
+    for proj in resume.projects:
+        parts.append(f"<p><strong>{esc(proj.name)}</strong></p>\n"
+                     f"<ul><li>{esc(proj.description)}</li><li>Tech Stack: {esc(proj.tech_stack)}</li></ul>\n")
+    parts.append(
+        "</section>\n<section>\n<h2>Skills</h2>\n"
+        f"<p><strong>Programming Languages &amp; Frameworks:</strong> {esc(resume.programming_skills)}</p>\n"
+        f"<p><strong>Soft Skills:</strong> {esc(resume.soft_skills)}</p>\n"
+        "</section>\n</body>\n</html>\n"
+    )
+    return "".join(parts)
+
+
+def render_formats(data, formats=tuple(FORMATS), theme="default", backend="reportlab", profile="balanced"):
+    """
+    Renders a resume to several formats in memory, normalizing it only once.
+    :param data: Resume dictionary or resume_ir.Resume.
+    :param formats: Format names from FORMATS.
+    :param theme: Theme for the PDF.
+    :param backend: Renderer backend for the PDF.
+    :param profile: Output profile for the PDF.
+    :return: Dictionary of format name -> bytes for "pdf", str otherwise.
+    """
+    resume = as_resume(data)
+    outputs = {}
+    for name in formats:
+        if name == "pdf":
+            from pdf_generator import render_resume_pdf
+            outputs[name] = render_resume_pdf(resume, theme=theme, backend=backend, profile=profile)
+        else:
+            outputs[name] = _emitter(name)(resume)
+    return outputs
+
+
+def export_resume(data, output_folder="output", formats=("pdf",), theme="default", cache=None, backend="reportlab",
+                  fit_pages=None, profile="balanced"):
+    """
+    Writes a resume in each requested format next to each other, e.g. John_Doe_resume.pdf and John_Doe_resume.html.
+    :param data: Resume dictionary or resume_ir.Resume.
+    :param output_folder: The folder where the files will be saved.
+    :param formats: Format names from FORMATS.
+    :param theme: Theme for the PDF.
+    :param cache: Optional RenderCache used for the PDF.
+    :param backend: Renderer backend for the PDF.
+    :param fit_pages: Page count the PDF is shrunk to fit, if any.
+    :param profile: Output profile for the PDF.
+    :return: Dictionary of format name -> path.
+    """
+    resume = as_resume(data)
+    paths = {}
+    for name in formats:
+        if name == "pdf":
+            # pdf_generator (and reportlab) is only imported when a PDF is requested
+            from pdf_generator import generate_resume_pdf
+            paths[name] = generate_resume_pdf(resume, output_folder, theme=theme, cache=cache, backend=backend,
+                                              fit_pages=fit_pages, profile=profile)
+            continue
+        text = _emitter(name)(resume)
+        os.makedirs(output_folder, exist_ok=True)
+        full_name = (resume.name or "Unnamed").replace(" ", "_")
+        path = os.path.join(output_folder, f"{full_name}_resume{FORMATS[name]}")
+        with open(path, 'w', encoding="utf-8") as file:
+            file.write(text)
+        print(f"Resume saved to: {path}")
+        paths[name] = path
+    return paths
+
+
+def _emitter(name):
+    if name == "html":
+        return to_html
+    if name == "markdown":
+        return to_markdown
+    if name == "text":
+        return render_text
+    raise ValueError(f"Unknown format '{name}'. Available formats: {', '.join(FORMATS)}")
+
+
+def _escape_markdown(text):
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", text)
+
+
+def _html_dates(entry):
+    # The parsed range goes into data attributes so pages can sort or filter entries without re-parsing
+    if entry.period is None:
+        return f'<span class="dates">{html.escape(entry.dates)}</span>'
+    start = "%04d-%02d" % entry.period.start
+    end = "present" if entry.period.present else "%04d-%02d" % entry.period.end
+    return f'<span class="dates" data-start="{start}" data-end="{end}">{html.escape(entry.dates)}</span>'
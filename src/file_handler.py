@@ -1,12 +1,324 @@
+import codecs
+import io
 import json
+import mmap
+import os
+import re
+import tempfile
+from collections import namedtuple
+
+from instrumentation import stage
+
+# A record read from a multi-record source, with where it started in the file
+Record = namedtuple("Record", ["source", "offset", "line", "data"])
+# A record that could not be decoded; reported instead of aborting the whole load
+RecordError = namedtuple("RecordError", ["source", "offset", "line", "message"])
+
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+# The encoding of a source file; bom is the length in bytes of the byte order mark to skip
+SourceEncoding = namedtuple("SourceEncoding", ["name", "bom"])
+
+# Bytes read from the start of a file to pick its encoding, and the part of them handed to chardet.
+# chardet takes about a second per 300 KB, so it never sees a whole large file.
+SNIFF_BYTES = 64 * 1024
+CHARDET_BYTES = 16 * 1024
+ENCODING_CACHE_SIZE = 4096
+
+# Longest first: the UTF-32 LE mark starts with the UTF-16 LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+_TRANSCODE_CHUNK = 64 * 1024
+
+_encodings = {}
+
+_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb'[,\]}\s]')
 
 def load_user_data(file_path):
     try:
-        with open(file_path, 'r') as file:
-            return json.load(file)
+        with open(file_path, 'rb') as file:
+            encoding = _source_encoding(file, file_path)
+            return json.load(io.TextIOWrapper(file, encoding=encoding.name))
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}")
         return {}
+    except UnicodeDecodeError as e:
+        print(f"Error: {file_path} is not valid {encoding.name} text: {e.reason}")
+        return {}
     except json.JSONDecodeError:
         print(f"Error: Failed to decode JSON from {file_path}")
-        return {}
\ No newline at end of file
+        return {}
+
+def detect_encoding(file_path):
+    """
+    Picks the text encoding of a source file: a byte order mark if there is one, UTF-16 or UTF-32
+    from the zero bytes around the first character, UTF-8 if the first SNIFF_BYTES decode as UTF-8,
+    and otherwise chardet's guess from a bounded sample of them.
+    The result is remembered by path, modification time and size, so each source is sniffed once.
+    :param file_path: Path to the source file.
+    :return: SourceEncoding with a Python codec name.
+    :raises OSError: If the file cannot be read.
+    """
+    with open(file_path, 'rb') as file:
+        return _source_encoding(file, file_path)
+
+def clear_encoding_cache():
+    _encodings.clear()
+
+def iter_user_data(file_path, on_error=None):
+    """
+    Streams resume dictionaries one at a time from a JSONL file, a top-level JSON array or a single JSON object.
+    :param file_path: Path to the source file.
+    :param on_error: Callable receiving a RecordError for each bad record (default: print it).
+    :return: Iterator of resume dictionaries.
+    """
+    for record in iter_user_records(file_path, on_error):
+        yield record.data
+
+def iter_user_records(file_path, on_error=None):
+    """
+    Streams Record tuples (source, byte offset, line number, data) from a multi-record source.
+    The file is memory-mapped where possible so memory stays flat regardless of its size.
+    Bad records are passed to on_error and skipped; loading continues with the next record.
+    :param file_path: Path to the source file.
+    :param on_error: Callable receiving a RecordError for each bad record (default: print it).
+    :return: Iterator of Record tuples.
+    """
+    report = on_error or _print_record_error
+    try:
+        file = open(file_path, 'rb')
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        return
+
+    with file:
+        with stage("load"):
+            encoding = _source_encoding(file, file_path)
+        if encoding.name != "utf-8":
+            yield from _iter_transcoded(file_path, file, encoding, report)
+            return
+
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and pipes cannot be mapped
+            buffer = None
+
+        if buffer is None:
+            if file_path.endswith(JSONL_EXTENSIONS):
+                yield from _iter_lines(file_path, file, report, encoding.bom)
+            else:
+                yield from _iter_document(file_path, file.read(), report)
+            return
+
+        with buffer:
+            if file_path.endswith(JSONL_EXTENSIONS):
+                yield from _iter_lines(file_path, _mapped_lines(buffer, encoding.bom), report, encoding.bom)
+            else:
+                yield from _iter_document(file_path, buffer, report, encoding.bom)
+
+def _source_encoding(file, file_path):
+    # Leaves the file positioned just past the byte order mark
+    stat = os.fstat(file.fileno())
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    encoding = _encodings.get(key)
+    if encoding is None:
+        encoding = _sniff(file.read(SNIFF_BYTES), stat.st_size > SNIFF_BYTES)
+        if len(_encodings) >= ENCODING_CACHE_SIZE:
+            del _encodings[next(iter(_encodings))]
+        _encodings[key] = encoding
+    file.seek(encoding.bom)
+    return encoding
+
+def _sniff(head, truncated):
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return SourceEncoding(name, len(bom))
+
+    name = _zero_pattern(head[:4])
+    if name:
+        return SourceEncoding(name, 0)
+
+    try:
+        # The head may end in the middle of a character when the file goes on
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=not truncated)
+        return SourceEncoding("utf-8", 0)
+    except UnicodeDecodeError:
+        pass
+    return SourceEncoding(_guess_legacy(head), 0)
+
+def _zero_pattern(start):
+    # A JSON text starts with an ASCII character, so without a byte order mark the zero bytes
+    # around it give UTF-16 and UTF-32 away (RFC 4627, section 3)
+    zeros = tuple(byte == 0 for byte in start)
+    if zeros == (True, True, True, False):
+        return "utf-32-be"
+    if zeros == (False, True, True, True):
+        return "utf-32-le"
+    if zeros[:2] == (True, False):
+        return "utf-16-be"
+    if zeros[:2] == (False, True):
+        return "utf-16-le"
+    return None
+
+def _guess_legacy(head):
+    import chardet
+
+    # Only lines with non-ASCII bytes tell encodings apart, and chardet's cost grows with its input
+    sample = b"\n".join(line for line in head.splitlines() if not line.isascii())[:CHARDET_BYTES]
+    name = chardet.detect(sample)["encoding"]
+    try:
+        name = codecs.lookup(name).name if name else None
+    except LookupError:
+        name = None
+    if name in (None, "ascii", "utf-8", "iso8859-1"):
+        # Files labelled Latin-1 are nearly always Windows-1252, which adds the curly quotes and dashes
+        try:
+            head.decode("cp1252")
+            return "cp1252"
+        except UnicodeDecodeError:
+            return "latin-1"
+    return name
+
+def _iter_transcoded(source, file, encoding, report):
+    # Text in any other encoding is decoded as it is read. JSONL offsets still count bytes of the
+    # source; array offsets count bytes of a UTF-8 copy the byte scanner runs over.
+    text = io.TextIOWrapper(file, encoding=encoding.name, newline="")
+    try:
+        if source.endswith(JSONL_EXTENSIONS):
+            size = lambda line: len(line.encode(encoding.name))
+            yield from _iter_lines(source, text, report, encoding.bom, size)
+            return
+        with tempfile.TemporaryFile() as copy:
+            while chunk := text.read(_TRANSCODE_CHUNK):
+                copy.write(chunk.encode("utf-8"))
+            copy.flush()
+            if not copy.tell():
+                return
+            with mmap.mmap(copy.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from _iter_document(source, buffer, report)
+    except UnicodeDecodeError as e:
+        report(RecordError(source, None, None, f"Not valid {encoding.name} text: {e.reason}"))
+    finally:
+        text.detach()
+
+def _print_record_error(error):
+    if error.line is None:
+        print(f"Error: Stopped reading {error.source}: {error.message}")
+        return
+    print(f"Error: Skipping bad record in {error.source} at line {error.line} (byte {error.offset}): {error.message}")
+
+def _mapped_lines(buffer, pos=0):
+    size = len(buffer)
+    while pos < size:
+        end = buffer.find(b"\n", pos)
+        end = size if end == -1 else end + 1
+        yield buffer[pos:end]
+        pos = end
+
+def _iter_lines(source, lines, report, offset=0, size=len):
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip():
+            record = _decode_record(source, line, offset, line_number, report)
+            if record is not None:
+                yield record
+        offset += size(line)
+
+def _iter_document(source, buffer, report, start=0):
+    pos = _WHITESPACE.match(buffer, start).end()
+    if pos >= len(buffer):
+        return
+
+    if buffer[pos:pos + 1] != b"[":
+        # A single resume object
+        record = _decode_record(source, buffer[pos:], pos, _line_at(buffer, 0, pos, 1), report)
+        if record is not None:
+            yield record
+        return
+
+    line, line_pos = _line_at(buffer, 0, pos, 1), pos
+    pos += 1
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        next_byte = buffer[pos:pos + 1]
+        if next_byte == b"]":
+            return
+
+        line, line_pos = _line_at(buffer, line_pos, pos, line), pos
+        end = _value_end(buffer, pos) if next_byte else -1
+        if end < 0:
+            report(RecordError(source, pos, line, "Unterminated JSON array"))
+            return
+
+        record = _decode_record(source, buffer[pos:end], pos, line, report)
+        if record is not None:
+            yield record
+
+        pos = _WHITESPACE.match(buffer, end).end()
+        separator = buffer[pos:pos + 1]
+        if separator == b",":
+            pos += 1
+        elif separator != b"]":
+            line = _line_at(buffer, line_pos, pos, line)
+            report(RecordError(source, pos, line, "Expected ',' or ']' between records"))
+            return
+
+def _decode_record(source, raw, offset, line, report):
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        report(RecordError(source, offset, line, str(exc)))
+        return None
+    if not isinstance(data, dict):
+        report(RecordError(source, offset, line, f"Expected a JSON object, got {type(data).__name__}"))
+        return None
+    return Record(source, offset, line, data)
+
+def _line_at(buffer, start, end, line):
+    return line + buffer[start:end].count(b"\n")
+
+def _value_end(buffer, pos):
+    """
+    Finds where the JSON value starting at pos ends without decoding it.
+    :return: Offset just past the value, or -1 if the value is unterminated.
+    """
+    first = buffer[pos:pos + 1]
+    if first == b'"':
+        return _string_end(buffer, pos + 1)
+    if first not in (b"{", b"["):
+        match = _SCALAR_END.search(buffer, pos)
+        return match.start() if match else len(buffer)
+
+    depth = 0
+    while True:
+        match = _STRUCTURAL.search(buffer, pos)
+        if match is None:
+            return -1
+        char = match.group()
+        if char == b'"':
+            pos = _string_end(buffer, match.end())
+            if pos < 0:
+                return -1
+            continue
+        depth += 1 if char in (b"{", b"[") else -1
+        pos = match.end()
+        if depth == 0:
+            return pos
+
+def _string_end(buffer, pos):
+    while True:
+        match = _STRING_END.search(buffer, pos)
+        if match is None:
+            return -1
+        if match.group() == b"\\":
+            pos = match.end() + 1  # skip the escaped character
+            continue
+        return match.end()
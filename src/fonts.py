@@ -0,0 +1,288 @@
+"""
+TrueType fonts and glyph fallback for the reportlab renderer.
+
+The PDF core fonts (Helvetica, Times, ...) only cover the Western European (cp1252) character
+set. Text the theme's font cannot show is wrapped in <font face="..."> runs using the first
+fallback font that has the glyph, e.g. DejaVu Sans for Cyrillic or Greek names:
+
+    fallback_markup("Иван Petrov", "Helvetica", ("DejaVuSans",))
+    # -> '<font face="DejaVuSans">Иван</font> Petrov'
+
+Everything expensive is done once per process and shared by every document rendered in it:
+parsing a font file, its glyph coverage, the fallback markup of a string and the font subsets
+embedded in each PDF (the same characters in the same order give the same subset bytes).
+"""
+import importlib.util
+import os
+import zlib
+from functools import lru_cache
+
+# reportlab itself is imported on first use, so themes (and the fpdf backend) can use the names below without it
+_REPORTLAB = importlib.util.find_spec("reportlab")
+
+# Directories searched for font files, in order. RESUME_FONT_PATH (os.pathsep separated) comes first.
+FONT_DIRS = [
+    *filter(None, os.environ.get("RESUME_FONT_PATH", "").split(os.pathsep)),
+    *([os.path.join(os.path.dirname(_REPORTLAB.origin), "fonts")] if _REPORTLAB and _REPORTLAB.origin else []),
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "C:\\Windows\\Fonts",
+]
+
+# Family -> font files for regular, bold, italic and bold italic; missing styles use the regular file
+FONT_FAMILIES = {
+    "Vera": ("Vera.ttf", "VeraBd.ttf", "VeraIt.ttf", "VeraBI.ttf"),
+    "DejaVuSans": ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf", "DejaVuSans-Oblique.ttf", "DejaVuSans-BoldOblique.ttf"),
+    "DejaVuSerif": ("DejaVuSerif.ttf", "DejaVuSerif-Bold.ttf", "DejaVuSerif-Italic.ttf", "DejaVuSerif-BoldItalic.ttf"),
+    "NotoSans": ("NotoSans-Regular.ttf", "NotoSans-Bold.ttf", "NotoSans-Italic.ttf", "NotoSans-BoldItalic.ttf"),
+    "FreeSans": ("FreeSans.ttf", "FreeSansBold.ttf", "FreeSansOblique.ttf", "FreeSansBoldOblique.ttf"),
+    "DroidSansFallback": ("DroidSansFallbackFull.ttf",),
+}
+
+# Tried in order for characters the theme's font does not cover; families not installed are skipped
+DEFAULT_FALLBACK_FONTS = ("DejaVuSans", "NotoSans", "FreeSans", "DroidSansFallback")
+
+# Suffix of the registered font name for each style, e.g. "DejaVuSans-Bold"
+STYLE_SUFFIXES = ("", "-Bold", "-Italic", "-BoldItalic")
+
+# Subset bytes kept per font file
+SUBSET_CACHE_SIZE = 256
+
+# reportlab major versions whose TrueType subsetting _cache_subsets hooks into; with any other version
+# the fonts are embedded by reportlab's own code, uncached
+SUBSET_CACHE_REPORTLAB = ("4",)
+
+# zlib level of the embedded subsets while a profile is applied (see set_subset_compression)
+_subset_compression = None
+
+# The core fonts are written with WinAnsiEncoding, so they cover exactly the cp1252 characters
+_CP1252 = frozenset(
+    ord(char) for char in bytes(range(256)).decode("cp1252", errors="replace") if char != "\ufffd"
+)
+
+# Font name -> name it is registered under (the regular style for styles the family lacks), None if not installed
+_registered = {}
+
+
+def register_family(family, regular, bold=None, italic=None, bold_italic=None):
+    """
+    Makes a TrueType family available by name, e.g. as a theme font or fallback font.
+    The files are only parsed when the family is first used.
+    :param family: Name used for the regular style; the others are "<family>-Bold", "-Italic" and "-BoldItalic".
+    :param regular: Path or file name (looked up in FONT_DIRS) of the regular style.
+    :return: The family name.
+    """
+    FONT_FAMILIES[family] = (regular, bold, italic, bold_italic)
+    for suffix in STYLE_SUFFIXES:
+        _registered.pop(family + suffix, None)
+    coverage.cache_clear()
+    _fallback_for.cache_clear()
+    fallback_markup.cache_clear()
+    return family
+
+
+def ensure_font(name):
+    """
+    Registers a font with reportlab the first time it is needed.
+    :param name: Core font name (e.g. "Helvetica-Bold"), or a family/style name from FONT_FAMILIES.
+    :return: True if the font can be used, False if its family is unknown or its files are not installed.
+    """
+    from reportlab.pdfbase import pdfmetrics
+
+    if name in pdfmetrics.standardFonts:
+        return True
+    family = _family_of(name)
+    if family is None:
+        # Registered directly with reportlab by the caller
+        return name in pdfmetrics.getRegisteredFontNames()
+    if name not in _registered:
+        _register(family)
+    return _registered[name] == name
+
+
+@lru_cache(maxsize=None)
+def coverage(name):
+    """
+    :param name: Font name.
+    :return: Frozen set of the code points the font has glyphs for; empty if the font is unavailable.
+    """
+    from reportlab.pdfbase import pdfmetrics
+
+    if not ensure_font(name):
+        return frozenset()
+    font = pdfmetrics.getFont(name)
+    face = getattr(font, "face", None)
+    if getattr(face, "charToGlyph", None) is None:
+        return _CP1252
+    return frozenset(face.charToGlyph)
+
+
+@lru_cache(maxsize=4096)
+def fallback_markup(text, font_name, fallback_fonts=DEFAULT_FALLBACK_FONTS, style=""):
+    """
+    Wraps the characters font_name cannot show in <font face="..."> runs of the first fallback that can.
+    Characters no font covers are left to font_name.
+    :param text: Text (or paragraph markup) to print in font_name.
+    :param font_name: Font of the surrounding paragraph.
+    :param fallback_fonts: Tuple of font names to try in order.
+    :param style: Style suffix of the surrounding text, one of STYLE_SUFFIXES. A face attribute resets
+                  <b> and <i>, so the fallback face has to name the style itself, e.g. "DejaVuSans-Bold".
+    :return: Paragraph markup.
+    """
+    primary = coverage(font_name)
+    parts = []
+    run = []
+    run_face = None
+    for char in text:
+        code = ord(char)
+        face = None if code in primary or char.isspace() else _fallback_for(code, fallback_fonts, style)
+        if face != run_face and run:
+            parts.append(_run(run, run_face))
+            run = []
+        run_face = face
+        run.append(char)
+    if run:
+        parts.append(_run(run, run_face))
+    return "".join(parts)
+
+
+def _run(chars, face):
+    text = "".join(chars)
+    return text if face is None else f'<font face="{face}">{text}</font>'
+
+
+@lru_cache(maxsize=8192)
+def _fallback_for(code, fallback_fonts, style):
+    for name in fallback_fonts:
+        if name in FONT_FAMILIES and ensure_font(name):
+            name = _registered[name + style]
+        if code in coverage(name):
+            return name
+    return None
+
+
+def _family_of(name):
+    for suffix in reversed(STYLE_SUFFIXES):
+        if name.endswith(suffix) and name[:len(name) - len(suffix)] in FONT_FAMILIES:
+            return name[:len(name) - len(suffix)]
+    return None
+
+
+def _register(family):
+    from reportlab.pdfbase import pdfmetrics
+
+    files = FONT_FAMILIES[family]
+    files += (None,) * (len(STYLE_SUFFIXES) - len(files))
+    if find_font_file(files[0]) is None:
+        for suffix in STYLE_SUFFIXES:
+            _registered[family + suffix] = None
+        return
+
+    names = []
+    for suffix, file_name in zip(STYLE_SUFFIXES, files):
+        path = find_font_file(file_name) if file_name else None
+        if path is None:
+            # e.g. no oblique file: the style is printed with the regular font
+            names.append(family)
+            continue
+        names.append(family + suffix)
+        pdfmetrics.registerFont(_load_ttf(family + suffix, path))
+    for suffix, name in zip(STYLE_SUFFIXES, names):
+        _registered[family + suffix] = name
+    # Lets <b> and <i> inside a <font face="family"> run pick the matching style
+    pdfmetrics.registerFontFamily(family, normal=names[0], bold=names[1], italic=names[2], boldItalic=names[3])
+
+
+def _load_ttf(name, path):
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    font = TTFont(name, path)
+    _cache_subsets(font.face)
+    return font
+
+
+def _cache_subsets(face):
+    # reportlab rebuilds and recompresses the embedded subset for every document; reuse both when the
+    # characters repeat. Byte for byte the PDF is the same as without the cache.
+    # This wraps internals of reportlab's TTFontFace, so it is only done for the versions it was written against.
+    import reportlab
+    from reportlab.pdfbase.pdfdoc import PDFArray, PDFName
+
+    make_subset = getattr(face, "makeSubset", None)
+    add_subset_objects = getattr(face, "addSubsetObjects", None)
+    if reportlab.Version.split(".")[0] not in SUBSET_CACHE_REPORTLAB or make_subset is None or add_subset_objects is None:
+        return False
+    subsets = {}
+
+    def cached_subset(subset):
+        key = tuple(subset)
+        entry = subsets.get(key)
+        if entry is None:
+            if len(subsets) >= SUBSET_CACHE_SIZE:
+                del subsets[next(iter(subsets))]
+            content = make_subset(subset)
+            # The subset bytes and their compressed forms by zlib level
+            entry = subsets[key] = (content, {})
+        return entry
+
+    def cached_make_subset(subset):
+        return cached_subset(subset)[0]
+
+    def cached_add_subset_objects(doc, fontname, subset):
+        reference = add_subset_objects(doc, fontname, subset)
+        level = _subset_compression if _subset_compression is not None else 6 if doc.compression else 0
+        if level:
+            content, compressed = cached_subset(subset)
+            if level not in compressed:
+                compressed[level] = zlib.compress(content, level)
+            try:
+                font_file = doc.idToObject["fontFile:%s(%s)" % (face.filename, fontname)]
+                dictionary = font_file.dictionary
+            except (AttributeError, KeyError):
+                # The stream is not where this reportlab was expected to put it; keep it as reportlab built it
+                return reference
+            font_file.content = compressed[level]
+            # Marks the content as already compressed, so the stream is not compressed again
+            dictionary["Filter"] = PDFArray([PDFName("FlateDecode")])
+        return reference
+
+    face.makeSubset = cached_make_subset
+    face.addSubsetObjects = cached_add_subset_objects
+    return True
+
+
+def set_subset_compression(level):
+    """
+    Sets how the font subsets embedded from now on are compressed (see profiles.applied).
+    :param level: zlib level, 0 to embed them uncompressed, or None to compress them at the
+                  default level whenever the document compresses its pages.
+    :return: The previous setting.
+    """
+    global _subset_compression
+    previous, _subset_compression = _subset_compression, level
+    return previous
+
+
+def find_font_file(file_name):
+    """
+    :param file_name: Font file name (looked up in FONT_DIRS) or path.
+    :return: Path of the file, or None if it is not installed.
+    """
+    if os.path.isfile(file_name):
+        return file_name
+    return _font_index().get(os.path.basename(file_name))
+
+
+@lru_cache(maxsize=None)
+def _font_index():
+    # One walk of the font directories per process: file name -> first path found
+    index = {}
+    for directory in FONT_DIRS:
+        for root, _, files in os.walk(directory):
+            for file_name in files:
+                index.setdefault(file_name, os.path.join(root, file_name))
+    return index
@@ -0,0 +1,204 @@
+"""
+Lightweight PDF backend built on fpdf.
+
+It draws the same sections as the reportlab backend in pdf_generator straight onto the page:
+no flowables and no table layout passes, only the PDF core fonts. Select it with
+backend="fpdf" on generate_resume_pdf / render_resume_pdf, or --backend fpdf on the command line.
+"""
+from fpdf import FPDF
+
+from themes import get_theme
+from profiles import DEFAULT_PROFILE, get_profile
+from resume_ir import as_resume
+from instrumentation import stage
+
+# Bump whenever a layout change should invalidate previously rendered PDFs
+RENDERER_VERSION = "fpdf-1"
+
+# Body text metrics, matching reportlab's Normal style
+BODY_SIZE = 10
+LEADING = 12
+# Left/right padding of the entry tables in the reportlab layout
+CELL_PADDING = 5
+# Bullet glyph in the WinAnsi encoding of the core fonts
+BULLET = "\x95"
+
+_CORE_FAMILIES = {"Helvetica": "helvetica", "Times": "times", "Courier": "courier"}
+# 0-255 RGB of the color names themes usually use; other names are looked up in reportlab's table
+_NAMED_COLORS = {"black": (0, 0, 0), "white": (255, 255, 255), "gray": (128, 128, 128), "grey": (128, 128, 128),
+                 "darkgray": (169, 169, 169), "darkgrey": (169, 169, 169), "lightgrey": (211, 211, 211)}
+
+
+def render_document(data, target, theme="default", profile=DEFAULT_PROFILE):
+    """
+    Renders a resume with fpdf.
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
+    :param target: File path or writable binary stream.
+    :param theme: Theme name or Theme instance; its page metrics, font family and spacing are used.
+    :param profile: Output profile name or OutputProfile; fpdf only uses its page compression.
+    """
+    theme = get_theme(theme)
+    resume = as_resume(data)
+    page = _Page(theme)
+    page.pdf.set_compression(get_profile(profile).page_compression)
+
+    with stage("render.header"):
+        page.header(resume)
+    with stage("render.education"):
+        page.education(resume.education)
+    with stage("render.experience"):
+        page.experience(resume.experience)
+    with stage("render.projects"):
+        page.projects(resume.projects)
+    with stage("render.skills"):
+        page.skills(resume)
+
+    with stage("render.build"):
+        # fpdf keeps the document as a latin-1 str
+        output = page.pdf.output(dest="S").encode("latin-1")
+    if isinstance(target, str):
+        with open(target, 'wb') as file:
+            file.write(output)
+    else:
+        target.write(output)
+
+
+def _rgb(color):
+    """
+    :param color: Color name, "#rrggbb" or a tuple of 0-1 floats, as in a theme's rule_color.
+    :return: Tuple of 0-255 ints for fpdf.
+    """
+    if isinstance(color, tuple):
+        return tuple(round(channel * 255) for channel in color)
+    if color.startswith("#") and len(color) == 7:
+        return tuple(int(color[index:index + 2], 16) for index in (1, 3, 5))
+    rgb = _NAMED_COLORS.get(color.lower())
+    if rgb is None:
+        from reportlab.lib import colors
+        rgb = _rgb(colors.toColor(color).rgb())
+    return rgb
+
+
+def _text(value):
+    """
+    Core fonts only cover the WinAnsi (cp1252) character set: curly quotes and dashes survive,
+    anything else becomes '?'. fpdf expects that byte range as a latin-1 str.
+    """
+    return value.encode("cp1252", "replace").decode("latin-1")
+
+
+class _Page:
+    """
+    Cursor over an fpdf document laid out with a theme's metrics.
+    """
+
+    def __init__(self, theme):
+        self.theme = theme
+        self.family = _CORE_FAMILIES.get(theme.font_name.split("-")[0], "helvetica")
+        self.width = theme.frame_width
+        self.left_width, self.right_width = theme.entry_col_widths
+
+        pdf = self.pdf = FPDF(unit="pt", format=tuple(theme.pagesize))
+        pdf.set_margins(theme.margin, theme.margin, theme.margin)
+        pdf.set_auto_page_break(True, theme.margin)
+        pdf.set_draw_color(*_rgb(theme.rule_color))
+        pdf.set_line_width(theme.rule_width)
+        pdf.add_page()
+
+    def font(self, style="", size=BODY_SIZE):
+        self.pdf.set_font(self.family, style, size)
+
+    def keep_lines(self, height):
+        # Start a new page up front so the two columns of an entry row stay together
+        if self.pdf.get_y() + height > self.pdf.page_break_trigger:
+            self.pdf.add_page()
+
+    def header(self, resume):
+        pdf, theme = self.pdf, self.theme
+
+        self.font("B", theme.name_font_size)
+        pdf.cell(0, theme.name_font_size * 1.2, _text(resume.name), ln=1, align="C")
+        pdf.ln(6)
+
+        self.font()
+        pdf.multi_cell(0, LEADING, _text(" | ".join(resume.contact)), align="C")
+        pdf.ln(theme.section_space)
+
+    def section_header(self, title):
+        pdf, theme = self.pdf, self.theme
+        self.keep_lines(theme.heading_font_size * 1.2 + 6 + LEADING * 2)
+        self.font("B", theme.heading_font_size)
+        pdf.cell(0, theme.heading_font_size * 1.2, title, ln=1)
+        pdf.ln(6)
+        y = pdf.get_y()
+        pdf.line(pdf.l_margin, y, pdf.l_margin + self.width, y)
+        pdf.ln(6)
+
+    def entry_row(self, left, right="", left_style="", right_style=""):
+        pdf = self.pdf
+        self.keep_lines(LEADING)
+        x, y = pdf.l_margin, pdf.get_y()
+        if right:
+            self.font(right_style)
+            pdf.set_xy(x + self.left_width, y)
+            pdf.cell(self.right_width - CELL_PADDING, LEADING, right, align="R")
+        self.font(left_style)
+        pdf.set_xy(x + CELL_PADDING, y)
+        pdf.multi_cell(self.left_width - 2 * CELL_PADDING, LEADING, left, align="L")
+
+    def bullet(self, text):
+        pdf, theme = self.pdf, self.theme
+        self.keep_lines(LEADING)
+        y = pdf.get_y()
+        self.font("", theme.bullet_font_size)
+        pdf.set_xy(pdf.l_margin + CELL_PADDING, y)
+        pdf.cell(theme.bullet_indent - CELL_PADDING, LEADING, BULLET)
+        self.font()
+        pdf.set_xy(pdf.l_margin + theme.bullet_indent, y)
+        pdf.multi_cell(self.width - theme.bullet_indent, LEADING, text, align="L")
+
+    def education(self, entries):
+        self.section_header("EDUCATION")
+        for edu in entries:
+            self.entry_row(_text(edu.institution), _text(edu.dates), "B", "B")
+            self.entry_row(_text(edu.degree), left_style="I")
+            if edu.courses is not None:
+                self.entry_row(_text(f"Relevant Courses: {edu.courses}"))
+            self.pdf.ln(self.theme.entry_space)
+
+    def experience(self, entries):
+        self.pdf.ln(self.theme.section_space)
+        self.section_header("PROFESSIONAL EXPERIENCE")
+        for exp in entries:
+            self.entry_row(_text(exp.organization), _text(exp.dates), "B", "B")
+            self.entry_row(_text(exp.role), left_style="I")
+            for responsibility in exp.responsibilities:
+                self.bullet(_text(responsibility))
+            self.pdf.ln(self.theme.entry_space)
+
+    def projects(self, entries):
+        pdf = self.pdf
+        pdf.ln(self.theme.section_space)
+        self.section_header("PROJECTS")
+        for proj in entries:
+            self.keep_lines(LEADING * 2)
+            self.font("B")
+            pdf.multi_cell(0, LEADING, _text(proj.name), align="L")
+            self.bullet(_text(proj.description))
+            self.bullet(_text(f"Tech Stack: {proj.tech_stack}"))
+            pdf.ln(self.theme.entry_space)
+
+    def skills(self, resume):
+        self.pdf.ln(self.theme.section_space)
+        self.section_header("SKILLS")
+        self.labelled_line("Programming Languages & Frameworks:", _text(resume.programming_skills))
+        self.pdf.ln(self.theme.skills_space)
+        self.labelled_line("Soft Skills:", _text(resume.soft_skills))
+
+    def labelled_line(self, label, text):
+        # write() flows text inline, so the bold label and the plain list share lines
+        self.font("B")
+        self.pdf.write(LEADING, label + " ")
+        self.font()
+        self.pdf.write(LEADING, text)
+        self.pdf.ln(LEADING)
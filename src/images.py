@@ -0,0 +1,146 @@
+"""
+Profile photos and company logos, downsampled to the size they are printed at.
+
+Phone photos are often 12 megapixels or more. Embedding them as they are makes every render
+decode and compress megabytes of pixels that end up about an inch wide on the page. prepare_image
+decodes each image at the lowest resolution that still covers its display size (JPEGs are
+decoded at 1/2 to 1/8 scale with Pillow's draft mode), resamples it to the target resolution and
+recompresses it:
+
+    image = prepare_image("photos/jane.jpg", 72, 72, crop=True)
+    Image(io.BytesIO(image.data), image.width, image.height)
+
+Results are kept per process, keyed by the hash of the file content and the target size, so a
+logo shared by thousands of resumes in a batch is decoded and resampled once per worker. File
+hashes are remembered by path, modification time and size, so an unchanged file is read once.
+"""
+import hashlib
+import io
+import math
+import os
+from collections import namedtuple
+
+from PIL import Image, ImageOps
+
+# Resolution images are resampled to, in pixels per inch of the printed size
+IMAGE_DPI = 150
+JPEG_QUALITY = 80
+
+# Processed images kept per process; an entry is a few KB to a few tens of KB
+IMAGE_CACHE_SIZE = 512
+DIGEST_CACHE_SIZE = 4096
+# Bytes read at a time while hashing an image file
+_HASH_CHUNK = 256 * 1024
+
+# EXIF orientations that turn the image by 90 degrees, swapping its width and height
+_TRANSPOSED = {5, 6, 7, 8}
+_EXIF_ORIENTATION = 0x0112
+
+# data is a PNG or JPEG file; width and height are the printed size in points
+ProcessedImage = namedtuple("ProcessedImage", ["data", "format", "width", "height", "pixels"])
+
+_digests = {}
+_images = {}
+
+
+def prepare_image(path, width, height, crop=False, dpi=IMAGE_DPI, quality=JPEG_QUALITY):
+    """
+    Downsamples an image file to the size it is printed at.
+    :param path: Path of the image file.
+    :param width: Width of the box the image is printed in, in points.
+    :param height: Height of the box, in points.
+    :param crop: Fill the whole box, cropping the image around its center (photos), instead of
+                 fitting the whole image inside it (logos).
+    :param dpi: Resolution of the result in pixels per inch.
+    :param quality: JPEG quality of the result. Images with transparency are stored as PNG.
+    :return: ProcessedImage.
+    :raises OSError: If the file cannot be read or is not an image Pillow can decode.
+    """
+    key = (source_digest(path), round(width, 2), round(height, 2), crop, dpi, quality)
+    image = _images.pop(key, None)
+    if image is None:
+        image = _process(path, width, height, crop, dpi, quality)
+        if len(_images) >= IMAGE_CACHE_SIZE:
+            del _images[next(iter(_images))]
+    # Re-inserted last, so the least recently used entry is the first one
+    _images[key] = image
+    return image
+
+
+def source_digest(path):
+    """
+    :param path: Path of the image file.
+    :return: SHA-256 hex digest of the file content, remembered until the file changes.
+    :raises OSError: If the file cannot be read.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(key)
+    if digest is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            while chunk := file.read(_HASH_CHUNK):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+        if len(_digests) >= DIGEST_CACHE_SIZE:
+            del _digests[next(iter(_digests))]
+        _digests[key] = digest
+    return digest
+
+
+def clear_cache():
+    _digests.clear()
+    _images.clear()
+
+
+def _process(path, width, height, crop, dpi, quality):
+    box = (max(1, math.ceil(width * dpi / 72)), max(1, math.ceil(height * dpi / 72)))
+    try:
+        with Image.open(path) as source:
+            orientation = source.getexif().get(_EXIF_ORIENTATION)
+            # draft() works on the stored (unrotated) pixels and only ever picks a scale that
+            # still covers the requested size, so cropping to fill the box stays sharp
+            draft_box = box[::-1] if orientation in _TRANSPOSED else box
+            if crop:
+                scale = max(draft_box[0] / source.width, draft_box[1] / source.height)
+                draft_box = (math.ceil(source.width * scale), math.ceil(source.height * scale))
+            source.draft(source.mode if source.mode in ("RGB", "L") else "RGB", draft_box)
+            image = ImageOps.exif_transpose(source)
+            image.load()
+    except (Image.DecompressionBombError, SyntaxError, ValueError) as e:
+        raise OSError(f"Cannot read image {path}: {e}") from e
+
+    if crop:
+        scale = max(box[0] / image.width, box[1] / image.height)
+        size = box
+        # Centered region of the image with the aspect ratio of the box
+        crop_width, crop_height = box[0] / scale, box[1] / scale
+        left, top = (image.width - crop_width) / 2, (image.height - crop_height) / 2
+        region = (left, top, left + crop_width, top + crop_height)
+    else:
+        scale = min(box[0] / image.width, box[1] / image.height)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        region = None
+    if scale < 1 or crop:
+        image = image.resize(size, Image.LANCZOS, box=region, reducing_gap=3.0)
+    # Never upsample a small logo; it is printed at its box size either way
+    printed = (size[0] * 72 / dpi, size[1] * 72 / dpi) if scale < 1 or crop else _fitted(image.size, width, height)
+
+    output = io.BytesIO()
+    if _has_alpha(image):
+        image.convert("RGBA").save(output, "PNG")
+        image_format = "PNG"
+    else:
+        image.convert("L" if image.mode in ("1", "L") else "RGB").save(output, "JPEG", quality=quality, optimize=True)
+        image_format = "JPEG"
+    return ProcessedImage(output.getvalue(), image_format, printed[0], printed[1], image.size)
+
+
+def _fitted(pixels, width, height):
+    # Printed size of an image kept at its own resolution, scaled to fit the box
+    scale = min(width / pixels[0], height / pixels[1])
+    return pixels[0] * scale, pixels[1] * scale
+
+
+def _has_alpha(image):
+    return image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
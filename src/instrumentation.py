@@ -0,0 +1,155 @@
+"""
+Opt-in per-stage timing for the resume pipeline.
+
+    with stage("validate"):
+        validate_data(user_data)
+
+While disabled (the default), stage() returns a shared no-op context manager, so the hooks
+cost one function call each. Once enabled, every stage feeds a histogram that can be
+exported as JSON or in the Prometheus text format, and merged across worker processes.
+"""
+import contextlib
+import json
+import time
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_NAME = "resume_stage_seconds"
+
+_enabled = False
+_histograms = {}
+_NOOP = contextlib.nullcontext()
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        index = 0
+        for bound in BUCKETS:
+            if seconds <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self):
+        return {"counts": list(self.counts), "count": self.count, "sum": self.sum, "max": self.max}
+
+    def merge(self, other):
+        for index, value in enumerate(other["counts"]):
+            self.counts[index] += value
+        self.count += other["count"]
+        self.sum += other["sum"]
+        self.max = max(self.max, other["max"])
+
+
+class _Timer:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        observe(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+def stage(name):
+    """
+    Times the enclosed block under the given stage name when instrumentation is enabled.
+    :param name: Stage name, e.g. "validate" or "render.education".
+    :return: Context manager.
+    """
+    if not _enabled:
+        return _NOOP
+    return _Timer(name)
+
+def observe(name, seconds):
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+    histogram.observe(seconds)
+
+def snapshot():
+    """
+    :return: Picklable copy of every histogram, keyed by stage name.
+    """
+    return {name: histogram.as_dict() for name, histogram in _histograms.items()}
+
+def drain():
+    """
+    Returns a snapshot and clears the histograms; workers use it to ship their timings to the parent.
+    """
+    data = snapshot()
+    _histograms.clear()
+    return data
+
+def merge(data):
+    """
+    Adds a snapshot (e.g. from a worker process) into this process's histograms.
+    """
+    for name, histogram in data.items():
+        target = _histograms.get(name)
+        if target is None:
+            target = _histograms[name] = Histogram()
+        target.merge(histogram)
+
+def reset():
+    _histograms.clear()
+
+def export_json():
+    return {"buckets": list(BUCKETS), "stages": snapshot()}
+
+def export_prometheus():
+    """
+    :return: The histograms in the Prometheus text exposition format.
+    """
+    lines = [
+        f"# HELP {METRIC_NAME} Time spent in each resume pipeline stage.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    for name in sorted(_histograms):
+        histogram = _histograms[name]
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts):
+            cumulative += count
+            lines.append(f'{METRIC_NAME}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_sum{{stage="{name}"}} {histogram.sum}')
+        lines.append(f'{METRIC_NAME}_count{{stage="{name}"}} {histogram.count}')
+    return "\n".join(lines) + "\n"
+
+def write_metrics(path):
+    """
+    Writes the histograms to path: Prometheus text for .prom/.txt files, JSON otherwise.
+    """
+    with open(path, 'w') as file:
+        if path.endswith((".prom", ".txt")):
+            file.write(export_prometheus())
+        else:
+            json.dump(export_json(), file, indent=2)
@@ -0,0 +1,73 @@
+"""
+A list stand-in that lets doc.build lay out flowables while they are still being built.
+
+doc.build only works at the front of its flowables list: it reads [0], looks a few items ahead
+for keepWithNext chains, deletes from the front, and pushes split remainders back with
+[0:0] = ... or insert(0, ...). LazyFlowables supports exactly that. It pulls flowables from an
+iterator as layout reaches them, so only the flowables near the layout position are held in
+memory instead of every flowable of the document.
+
+    doc.build(LazyFlowables(iter_resume_flowables(resume, theme)))
+"""
+
+# Flowables buffered ahead of the layout position; keepWithNext chains longer than this are cut
+LOOKAHEAD = 8
+
+
+class LazyFlowables:
+    """
+    Sequence over an iterator of flowables, materialized from the front as it is indexed.
+    len() counts the buffered flowables, which is at least the lookahead until the iterator runs out.
+    """
+
+    def __init__(self, flowables, lookahead=LOOKAHEAD):
+        self._pending = iter(flowables)
+        self._buffer = []
+        self._lookahead = lookahead
+        self._exhausted = False
+
+    def _fill(self, count=None):
+        # Buffers flowables until count are held, or all of them when count is None
+        buffer = self._buffer
+        while not self._exhausted and (count is None or len(buffer) < count):
+            try:
+                buffer.append(next(self._pending))
+            except StopIteration:
+                self._exhausted = True
+
+    def _fill_for(self, key):
+        if isinstance(key, slice):
+            stop = key.stop
+            self._fill(None if stop is None or stop < 0 or (key.start or 0) < 0 else stop)
+        else:
+            self._fill(key + 1 if key >= 0 else None)
+
+    def __len__(self):
+        self._fill(self._lookahead)
+        return len(self._buffer)
+
+    def __bool__(self):
+        self._fill(1)
+        return bool(self._buffer)
+
+    def __getitem__(self, key):
+        self._fill_for(key)
+        return self._buffer[key]
+
+    def __setitem__(self, key, value):
+        self._fill_for(key)
+        self._buffer[key] = value
+
+    def __delitem__(self, key):
+        self._fill_for(key)
+        del self._buffer[key]
+
+    def insert(self, index, value):
+        self._fill(index)
+        self._buffer.insert(index, value)
+
+    def buffered(self):
+        """
+        :return: Number of flowables currently held in memory.
+        """
+        return len(self._buffer)
@@ -1,29 +1,256 @@
+import argparse
+import contextlib
+import sys
+import time
+from itertools import islice
+
+import instrumentation
+from instrumentation import stage
 from file_handler import load_user_data
-from pdf_generator import generate_resume_pdf
-from builder import display_resume
+from builder import display_resume, display_resumes
+from exporters import FORMATS, export_resume
+from resume_ir import normalize
 from validator import validate_data
+from themes import available_themes
+from profiles import available_profiles
+
+# pdf_generator (and with it reportlab) is imported only on the paths that render a PDF,
+# so validation and terminal display start in tens of milliseconds.
+
+# Errors listed by --batch --validate-only before it only counts them
+MAX_LISTED_ERRORS = 20
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate resumes from JSON data.")
+    parser.add_argument("input", nargs="?", default="data/user_data.json",
+                        help="Path to the resume JSON file (default: data/user_data.json).")
+    parser.add_argument("--output", default="output",
+                        help="Folder where the resume PDFs are saved (default: output).")
+    parser.add_argument("--theme", default="default", choices=available_themes(),
+                        help="Name of the PDF theme to use (default, compact, serif).")
+    parser.add_argument("--formats", nargs="+", choices=list(FORMATS), default=["pdf"],
+                        help="Output formats to write next to each other (default: pdf).")
+    parser.add_argument("--backend", default="reportlab",
+                        help="PDF renderer backend: reportlab (default) or fpdf, a lighter engine for the same layout.")
+    parser.add_argument("--profile", default="balanced", choices=available_profiles(),
+                        help="Output profile: fast (quickest to write, e.g. previews), balanced (default) "
+                             "or archive (smallest files). The size and render time of each PDF are reported.")
+    parser.add_argument("--fit-pages", type=int, metavar="N",
+                        help="Shrink font size and spacing as little as needed to fit each PDF on N pages (reportlab backend).")
+    parser.add_argument("--batch", metavar="SOURCE",
+                        help="Render every resume in a directory, glob pattern or JSONL file.")
+    parser.add_argument("--booklet", metavar="PATH",
+                        help="With --batch, lay out every valid resume into one PDF at PATH, "
+                             "each starting on a new page with its own bookmark (reportlab backend).")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Run --batch as overlapping read, validate, render and write stages and report "
+                             "how busy each stage was.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes for --batch and --serve (default: CPU count).")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="Re-render every resume even if it is unchanged since the last run.")
+    parser.add_argument("--summary", metavar="PATH",
+                        help="Write the per-item batch summary as JSON to PATH.")
+    parser.add_argument("--stdout", action="store_true",
+                        help="Write the PDF to standard output instead of a file; messages go to stderr.")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Only validate the input; exit status 0 if it is valid. "
+                             "With --batch, validate the whole source and print the error counts per rule.")
+    parser.add_argument("--display-only", action="store_true",
+                        help="Validate and display the resume in the terminal without generating a PDF. "
+                             "With --batch, print every resume in the source (without validation).")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run the HTTP render service (POST /render, GET /health).")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-render the input (or the --batch source) whenever a file is saved.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface for --serve (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8000, help="Port for --serve (default: 8000).")
+    parser.add_argument("--max-queue", type=int, default=64,
+                        help="Renders admitted at once by --serve before answering 503 (default: 64).")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="Per-request render timeout in seconds for --serve (default: 30).")
+    parser.add_argument("--image-root", metavar="DIR",
+                        help="Folder the photo and logo paths of --serve requests are looked up in "
+                             "(default: requests naming images are refused).")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="Record per-stage timings and write the histograms to PATH "
+                             "(Prometheus text for .prom/.txt, JSON otherwise). With --serve, also enables GET /metrics.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.metrics:
+        return _run(args)
+
+    instrumentation.enable()
+    try:
+        return _run(args)
+    finally:
+        instrumentation.write_metrics(args.metrics)
+
+def _run(args):
+    if _writes_pdf(args):
+        # Checked here rather than with argparse choices, which would import reportlab on every run
+        from pdf_generator import available_backends
+        if args.backend not in available_backends():
+            print(f"Error: unknown backend '{args.backend}'. Available backends: {', '.join(available_backends())}.")
+            return 1
+        if args.fit_pages and args.backend != "reportlab":
+            print("Error: --fit-pages is only supported by the reportlab backend.")
+            return 1
+
+    if args.serve:
+        from server import run_server
+        run_server(args.host, args.port, workers=args.workers, max_queue=args.max_queue,
+                   timeout=args.timeout, theme=args.theme, backend=args.backend, profile=args.profile,
+                   image_root=args.image_root)
+        return 0
+
+    if args.watch:
+        from watcher import run_watch
+        run_watch(args.batch or args.input, output_folder=args.output, formats=args.formats, theme=args.theme,
+                  use_cache=args.use_cache, backend=args.backend, fit_pages=args.fit_pages, profile=args.profile)
+        return 0
+
+    if args.batch and args.display_only:
+        # Stream every resume's text with bounded buffering instead of rendering PDFs
+        from batch import iter_resumes
+        with stage("display"):
+            display_resumes(iter_resumes(args.batch))
+        return 0
+
+    if args.batch and args.validate_only:
+        return _validate_corpus(args.batch)
+
+    if args.batch and args.booklet:
+        if args.backend != "reportlab":
+            print("Error: --booklet is only supported by the reportlab backend.")
+            return 1
+        from booklet import write_booklet
+        summary = write_booklet(args.batch, args.booklet, theme=args.theme, profile=args.profile)
+        return 0 if summary["output"] and summary["skipped"] == 0 else 1
+
+    if args.batch:
+        from batch import run_batch, print_summary
+        run = run_batch
+        if args.pipeline:
+            from pipeline import run_pipeline as run
+        summary = run(args.batch, output_folder=args.output, workers=args.workers, summary_path=args.summary,
+                      theme=args.theme, use_cache=args.use_cache, backend=args.backend, fit_pages=args.fit_pages,
+                      profile=args.profile)
+        print_summary(summary)
+        if args.pipeline:
+            from pipeline import print_stages
+            print_stages(summary)
+        return 0 if summary["failed"] == 0 else 1
+
+    if args.validate_only:
+        if not _load_and_validate(args.input):
+            return 1
+        print("Data is valid.")
+        return 0
 
-def main():
+    if args.stdout:
+        # Keep stdout clean for the PDF bytes; every message goes to stderr instead
+        pdf_stream = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr):
+            user_data = _load_and_validate(args.input)
+        if not user_data:
+            return 1
+        from pdf_generator import render_resume_pdf, render_report
+        started = time.perf_counter()
+        with stage("render"):
+            pdf = render_resume_pdf(user_data, theme=args.theme, backend=args.backend, fit_pages=args.fit_pages,
+                                    profile=args.profile)
+        elapsed = time.perf_counter() - started
+        pdf_stream.write(pdf)
+        pdf_stream.flush()
+        print(f"Resume written to stdout ({render_report(len(pdf), elapsed, args.profile)})", file=sys.stderr)
+        return 0
+
+    user_data = _load_and_validate(args.input)
+    if not user_data:
+        return 1
+
+    # Normalize once; the terminal display and every output format render from the same IR
+    resume = normalize(user_data)
+
+    # Display the resume in the terminal
+    with stage("display"):
+        display_resume(resume)
+    if args.display_only:
+        return 0
+
+    # Write each output format; the PDF is skipped if nothing changed since the last render
+    cache = None
+    if args.use_cache and "pdf" in args.formats:
+        from render_cache import RenderCache
+        cache = RenderCache(args.output)
+    with stage("render"):
+        export_resume(resume, args.output, args.formats, theme=args.theme, cache=cache, backend=args.backend,
+                      fit_pages=args.fit_pages, profile=args.profile)
+    if cache is not None:
+        cache.save()
+    return 0
+
+def _writes_pdf(args):
+    """
+    Tells whether a run renders PDFs, i.e. uses the --backend renderer.
+    """
+    if args.serve or args.watch:
+        return True
+    if args.validate_only or args.display_only:
+        return False
+    return bool(args.batch or args.stdout or "pdf" in args.formats)
+
+def _load_and_validate(input_path):
+    """
+    Loads and validates a resume, printing any problems.
+    :return: The resume dictionary, or None if it is missing or invalid.
+    """
     # Load user data from JSON file
-    user_data = load_user_data("data/user_data.json")
-    
+    with stage("load"):
+        user_data = load_user_data(input_path)
+
     if not user_data:
         print("Error: No user data found.")
-        return
+        return None
 
     # Validate the user data
-    is_valid, errors = validate_data(user_data)
+    with stage("validate"):
+        is_valid, errors = validate_data(user_data)
     if not is_valid:
         print("Data validation errors:")
         for error in errors:
             print(f"- {error}")
-        return
+        return None
 
-    # Display the resume in the terminal
-    display_resume(user_data)
+    return user_data
+
+def _validate_corpus(source):
+    """
+    Validates every resume in a batch source column by column and prints the failures per rule.
+    :return: Exit status, 0 if every resume is valid.
+    """
+    from batch import iter_resumes
+    from validator import validate_batch
+
+    started = time.perf_counter()
+    with stage("validate"):
+        result = validate_batch(iter_resumes(source))
+    elapsed = time.perf_counter() - started
+
+    for record, code, path in islice(zip(result.records, result.codes, result.paths), MAX_LISTED_ERRORS):
+        print(f"[{code.upper()}] Resume {record + 1}: {path or '(resume)'}")
+    if len(result.codes) > MAX_LISTED_ERRORS:
+        print(f"... and {len(result.codes) - MAX_LISTED_ERRORS} more")
+    for (rule, code), count in result.counts.most_common():
+        print(f"{count:>8}  {rule or '(resume)'} [{code}]")
 
-    # Generate the PDF resume
-    generate_resume_pdf(user_data)
+    invalid = len(set(result.records))
+    rate = result.count / elapsed if elapsed > 0 else 0.0
+    print(f"Checked {result.count} resumes in {elapsed:.2f}s ({rate:.0f} resumes/s): {invalid} invalid")
+    return 0 if invalid == 0 else 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
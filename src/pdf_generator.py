@@ -1,204 +1,436 @@
+import importlib
+import io
 import os
 import json
-from reportlab.lib.pagesizes import letter
+import sys
+import time
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListFlowable, ListItem
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, ListFlowable, ListItem, Image
+
+from themes import get_theme
+from profiles import DEFAULT_PROFILE, get_profile, applied
+from resume_ir import as_resume
+from lazy_flowables import LazyFlowables
+import instrumentation
+from instrumentation import stage
+
+# Bump whenever a layout change should invalidate previously rendered PDFs
+RENDERER_VERSION = 1
+
+# Resumes with more entries and bullet points than this are built lazily during layout (see render_document).
+# Below it, building every flowable up front is as fast or faster and the memory saved is small.
+LAZY_MIN_ENTRIES = 100
+
+# Renderer backends: name -> module exposing RENDERER_VERSION and render_document(data, target, theme, profile=...).
+# A backend module is imported the first time it is used.
+BACKENDS = {
+    "reportlab": "pdf_generator",
+    "fpdf": "fpdf_renderer",
+}
+
+def get_backend(backend="reportlab"):
+    """
+    Looks up a renderer backend.
+    :param backend: Backend name, or a backend module/object which is returned unchanged.
+    :return: Object with RENDERER_VERSION and render_document(data, target, theme, profile=...).
+    """
+    if not isinstance(backend, str):
+        return backend
+    try:
+        module_name = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown backend '{backend}'. Available backends: {', '.join(sorted(BACKENDS))}") from None
+    return importlib.import_module(module_name)
 
-def generate_resume_pdf(data, output_folder="output"):
+def available_backends():
+    return sorted(BACKENDS)
+
+def render_cache_key(data, theme="default", backend="reportlab", fit_pages=None, profile=DEFAULT_PROFILE):
+    """
+    Returns the render-cache key for a resume rendered with the given theme, backend and output profile.
+    The key hashes the normalized resume, so fields that are never rendered do not affect it.
+    """
+    from render_cache import RenderCache
+    resume = as_resume(data)
+    theme_key = get_theme(theme).cache_key
+    if fit_pages:
+        theme_key += f" fit={fit_pages}"
+    profile = get_profile(profile)
+    if profile != get_profile(DEFAULT_PROFILE):
+        theme_key += f" profile={profile}"
+    # The resume only holds image paths, so a replaced photo or logo must change the key as well
+    image_paths = [resume.photo, *(exp.logo for exp in resume.experience)]
+    if any(image_paths):
+        theme_key += " images=" + ",".join(_image_digest(path) for path in image_paths if path)
+    return RenderCache.key(resume, theme_key, get_backend(backend).RENDERER_VERSION)
+
+def _image_digest(path):
+    from images import source_digest
+    try:
+        return source_digest(path)
+    except OSError:
+        return "missing"
+
+def generate_resume_pdf(data, output_folder="output", theme="default", cache=None, backend="reportlab",
+                        fit_pages=None, profile=DEFAULT_PROFILE, output_path=None):
     """
     Generates a PDF resume and saves it with the user's full name in the filename.
-    :param data: Dictionary containing resume information.
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
     :param output_folder: The folder where the resume PDF will be saved.
+    :param theme: Theme name or Theme instance controlling layout and styles.
+    :param cache: Optional RenderCache; unchanged resumes are skipped instead of re-rendered.
+    :param backend: Renderer backend name ("reportlab" or "fpdf").
+    :param fit_pages: Shrink fonts and spacing so the resume fits on this many pages (reportlab only, see autofit).
+    :param profile: Output profile name ("fast", "balanced" or "archive"), see profiles.
+    :param output_path: Save to this path instead of the one named after the user (batch runs pick unique names).
+    :return: Path of the generated PDF.
     """
-    # Extract the user's full name from the data (default to 'Unnamed' if missing)
-    full_name = data.get("name", "Unnamed").replace(" ", "_")  # Replace spaces with underscores for the filename
-    
-    # Construct the output filename
-    output_filename = f"{full_name}_resume.pdf"
-    
+    theme = get_theme(theme)
+    backend = get_backend(backend)
+    profile = get_profile(profile)
+    data = as_resume(data)
+
+    if cache is not None:
+        cache_key = render_cache_key(data, theme, backend, fit_pages, profile)
+        cached_path = cache.lookup(cache_key)
+        if cached_path:
+            print(f"Resume unchanged, skipped: {cached_path}")
+            return cached_path
+
     # Create the output folder if it doesn't exist
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
+    output_filepath = output_path or resume_pdf_path(data, output_folder)
+
+    started = time.perf_counter()
+    if fit_pages:
+        fit = _fit(data, output_filepath, theme, backend, fit_pages, profile)
+        if not fit.fits:
+            print(f"Warning: resume needs {fit.pages} pages even at the smallest size (target: {fit_pages})")
+        elif fit.theme is not theme:
+            print(f"Fitted to {fit.pages} page(s): font {fit.font_scale:.0%}, spacing {fit.space_scale:.0%}")
+    else:
+        backend.render_document(data, output_filepath, theme, profile=profile)
+    elapsed = time.perf_counter() - started
+    if cache is not None:
+        cache.store(cache_key, output_filepath)
+    print(f"Resume saved to: {output_filepath} ({render_report(_file_size(output_filepath), elapsed, profile)})")
+    return output_filepath
+
+def resume_pdf_path(data, output_folder="output"):
+    """
+    Returns the path generate_resume_pdf saves a resume to, named after the user's full name.
+    """
+    # Extract the user's full name from the data (default to 'Unnamed' if missing)
+    full_name = (as_resume(data).name or "Unnamed").replace(" ", "_")  # Replace spaces with underscores for the filename
+
+    # Construct the output filename
+    output_filename = f"{full_name}_resume.pdf"
+
     # Specify the path for the output file inside the specified folder
-    output_filepath = os.path.join(output_folder, output_filename)
-    
-    # Create the PDF document
+    return os.path.join(output_folder, output_filename)
+
+def render_report(size, seconds, profile=DEFAULT_PROFILE):
+    """
+    :param size: Size of the PDF in bytes, or None if it is unknown.
+    :param seconds: Render time.
+    :return: One-line report of a render, e.g. "48,210 bytes in 35 ms, balanced profile".
+    """
+    size = "" if size is None else f"{size:,} bytes "
+    return f"{size}in {seconds * 1000:.0f} ms, {get_profile(profile).name} profile"
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+def render_resume_pdf(data, stream=None, theme="default", backend="reportlab", fit_pages=None,
+                      profile=DEFAULT_PROFILE):
+    """
+    Renders a resume in memory, without touching the filesystem or printing anything.
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
+    :param stream: Optional writable binary stream (e.g. sys.stdout.buffer or a socket file) to write the PDF to.
+    :param theme: Theme name or Theme instance controlling layout and styles.
+    :param backend: Renderer backend name ("reportlab" or "fpdf").
+    :param fit_pages: Shrink fonts and spacing so the resume fits on this many pages (reportlab only, see autofit).
+    :param profile: Output profile name ("fast", "balanced" or "archive"), see profiles.
+    :return: The PDF as bytes when no stream is given, otherwise None.
+    """
+    theme = get_theme(theme)
+    target = stream if stream is not None else io.BytesIO()
+    if fit_pages:
+        _fit(data, target, theme, get_backend(backend), fit_pages, profile)
+    else:
+        get_backend(backend).render_document(data, target, theme, profile=profile)
+    if stream is None:
+        return target.getvalue()
+
+def _fit(data, target, theme, backend, pages, profile):
+    if backend.render_document is not render_document:
+        raise ValueError("Fitting to a page count is only supported by the reportlab backend")
+    from autofit import fit_document
+    return fit_document(data, target, theme, pages, profile)
+
+def render_document(data, target, theme="default", lazy=None, profile=DEFAULT_PROFILE):
+    """
+    Renders a resume with reportlab platypus (the "reportlab" backend).
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
+    :param target: File path or writable binary stream.
+    :param theme: Theme name or Theme instance controlling layout and styles.
+    :param lazy: Build the flowables while doc.build lays them out, so only a few are held in memory
+                 at once (their building then also counts towards render.build). None (the default)
+                 does so for resumes with more than LAZY_MIN_ENTRIES entries and bullet points.
+    :param profile: Output profile name or OutputProfile controlling compression and image quality.
+    :return: Number of pages.
+    """
+    theme = get_theme(theme)
+    profile = get_profile(profile)
+    resume = as_resume(data)
+    if lazy is None:
+        lazy = _entry_count(resume) > LAZY_MIN_ENTRIES
+    doc = create_document(target, theme, profile)
+    if lazy:
+        elements = LazyFlowables(iter_resume_flowables(resume, theme, profile))
+    else:
+        elements = build_resume_flowables(resume, theme, profile)
+    with stage("render.build"), applied(profile):
+        doc.build(elements)
+    return doc.page
+
+def _entry_count(resume):
+    return (len(resume.education) + len(resume.experience) + len(resume.projects)
+            + sum(len(exp.responsibilities or ()) for exp in resume.experience))
+
+def create_document(target, theme="default", profile=DEFAULT_PROFILE):
+    """
+    Creates the PDF document template for a theme.
+    :param target: File path or writable binary stream.
+    :param theme: Theme name or Theme instance controlling page size and margins.
+    :param profile: Output profile name or OutputProfile; build the document inside profiles.applied(profile).
+    :return: SimpleDocTemplate ready for build().
+    """
+    theme = get_theme(theme)
     doc = SimpleDocTemplate(
-        output_filepath,
-        pagesize=letter,
-        topMargin=36,  # Reduced top margin (0.5 inch)
-        bottomMargin=36,
-        leftMargin=36,
-        rightMargin=36
+        target,
+        pagesize=theme.pagesize,
+        topMargin=theme.margin,  # Reduced top margin (0.5 inch)
+        bottomMargin=theme.margin,
+        leftMargin=theme.margin,
+        rightMargin=theme.margin
     )
-    elements = []
+    doc.pageCompression = int(get_profile(profile).page_compression)
+    return doc
+
+def build_resume_flowables(data, theme="default", profile=DEFAULT_PROFILE):
+    """
+    Builds the platypus flowables for a resume.
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
+    :param theme: Theme name or Theme instance controlling layout and styles.
+    :param profile: Output profile name or OutputProfile; sets the resolution and quality of images.
+    :return: List of flowables ready for doc.build.
+    """
+    return list(iter_resume_flowables(data, theme, profile))
+
+def iter_resume_flowables(data, theme="default", profile=DEFAULT_PROFILE):
+    """
+    Builds the platypus flowables for a resume lazily, section by section and entry by entry.
+    Wrapped in lazy_flowables.LazyFlowables, doc.build lays each one out while later ones are not built yet.
+    :param data: Dictionary containing resume information, or its resume_ir.Resume.
+    :param theme: Theme name or Theme instance controlling layout and styles.
+    :param profile: Output profile name or OutputProfile; sets the resolution and quality of images.
+    :return: Iterator of flowables.
+    """
+    theme = get_theme(theme)
+    profile = get_profile(profile)
+    resume = as_resume(data)
+    yield from _timed("render.header", _header_flowables(resume, theme, profile))
+    yield from _timed("render.education", _education_flowables(resume, theme))
+    yield from _timed("render.experience", _experience_flowables(resume, theme, profile))
+    yield from _timed("render.projects", _project_flowables(resume, theme))
+    yield from _timed("render.skills", _skills_flowables(resume, theme))
+
+def _timed(name, flowables):
+    # Like stage(name) around a whole section, but only the time spent building its flowables
+    # counts, not whatever the consumer (e.g. doc.build) does between them
+    if not instrumentation.is_enabled():
+        yield from flowables
+        return
+    spent = 0.0
+    flowables = iter(flowables)
+    while True:
+        started = time.perf_counter()
+        flowable = next(flowables, None)
+        spent += time.perf_counter() - started
+        if flowable is None:
+            break
+        yield flowable
+    instrumentation.observe(name, spent)
+
+def _header_flowables(resume, theme, profile):
+    # Styles are built once per theme and shared across renders
+    styles = theme.styles
+    title_style = styles['title']
+    # Switches to a fallback font for characters the theme's font has no glyph for
+    mk = theme.markup
 
-    # Set up styles
-    styles = getSampleStyleSheet()
-    title_style = styles['Title']
-    normal_style = styles['Normal']
-    heading_style = ParagraphStyle(
-        'Heading1', fontName='Helvetica-Bold', fontSize=14, spaceAfter=6)
-    subheading_style = ParagraphStyle(
-        'Heading2', fontName='Helvetica-Bold', fontSize=12, spaceAfter=6)
-    
     # Header - Name
-    name = Paragraph(f"<font size=24><b>{data['name']}</b></font>", title_style)
-    elements.append(name)
+    name = Paragraph(f"<font size={theme.name_font_size}><b>{mk(resume.name, bold=True)}</b></font>", title_style)
 
     # Contact Info - Phone, Email, Location, LinkedIn
-    contact_style = ParagraphStyle(name="CenterAlign", alignment=1)  # 1 is for center alignment
-    contact_info = f"{data['contact'].get('phone', '')} | {data['contact'].get('email', '')} | {data['contact'].get('location', '')} | {data['contact'].get('linkedin', '')}"
-    contact_paragraph = Paragraph(contact_info, contact_style)
-    elements.append(contact_paragraph)
+    contact = resume.contact
+    contact_info = mk(f"{contact.phone} | {contact.email} | {contact.location} | {contact.linkedin}")
+    contact_paragraph = Paragraph(contact_info, styles['contact'])
+
+    photo = _image(resume.photo, theme.photo_size, theme.photo_size, profile, crop=True)
+    if photo is None:
+        yield name
+        yield contact_paragraph
+    else:
+        # Photo on the left, name and contact details next to it
+        header_table = Table([[photo, [name, contact_paragraph], ""]], colWidths=theme.photo_col_widths)
+        header_table.setStyle(theme.photo_table_style)
+        yield header_table
 
     # Add space after contact details
-    elements.append(Spacer(1, 12))
+    yield theme.spacer(theme.section_space)
 
-    # EDUCATION
-    elements.append(Paragraph("<b>EDUCATION</b>", heading_style))
+def _education_flowables(resume, theme):
+    styles = theme.styles
+    normal_style = styles['normal']
+    right_style = styles['right']
+    mk = theme.markup
 
-    # Add a horizontal rule after the "EDUCATION" heading
-    line_table = Table([[Paragraph("")]], colWidths=[doc.width])  # Empty cell for a full-width line
-    line_table.setStyle(TableStyle([
-        ('LINEABOVE', (0, 0), (-1, 0), 1, colors.black),  # Horizontal line
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    elements.append(line_table)
+    # EDUCATION
+    yield from theme.section_header("EDUCATION")
 
-    for edu in data.get('education', []):
+    for edu in resume.education:
         edu_data = [
             [
-                Paragraph(f"<b>{edu.get('institution', '')}</b>", normal_style),
-                Paragraph(f"<b>{edu.get('dates', '')}</b>", ParagraphStyle(name='RightAlign', alignment=2))
+                Paragraph(f"<b>{mk(edu.institution, bold=True)}</b>", normal_style),
+                Paragraph(f"<b>{mk(edu.dates, bold=True)}</b>", right_style)
             ],
             [
-                Paragraph(f"<i>{edu.get('degree', '')}</i>", normal_style),
+                Paragraph(f"<i>{mk(edu.degree, italic=True)}</i>", normal_style),
                 ""
             ],
             [
-                Paragraph(f"Relevant Courses: {', '.join(edu.get('relevant_courses', []))}", normal_style) if 'relevant_courses' in edu else "",
+                Paragraph(f"Relevant Courses: {mk(edu.courses)}", normal_style) if edu.courses is not None else "",
                 ""
             ]
         ]
-        
-        edu_table = Table(edu_data, colWidths=[doc.width * 0.7, doc.width * 0.3])
-        edu_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-        ]))
-        
-        elements.append(edu_table)
-        elements.append(Spacer(1, 10))  # Space between education entries
 
-    # PROFESSIONAL EXPERIENCE
-    elements.append(Spacer(1, 12))
-    elements.append(Paragraph("<b>PROFESSIONAL EXPERIENCE</b>", heading_style))
+        edu_table = Table(edu_data, colWidths=theme.entry_col_widths)
+        edu_table.setStyle(theme.entry_table_style)
 
-    # Add a horizontal rule after the "PROFESSIONAL EXPERIENCE" heading
-    line_table = Table([[Paragraph("")]], colWidths=[doc.width])  # Empty cell for a full-width line
-    line_table.setStyle(TableStyle([
-        ('LINEABOVE', (0, 0), (-1, 0), 1, colors.black),  # Horizontal line
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    elements.append(line_table)
+        yield edu_table
+        yield theme.spacer(theme.entry_space)  # Space between education entries
 
-    for exp in data.get('professional_experience', []):
+def _experience_flowables(resume, theme, profile):
+    styles = theme.styles
+    normal_style = styles['normal']
+    right_style = styles['right']
+    mk = theme.markup
+
+    # PROFESSIONAL EXPERIENCE
+    yield theme.spacer(theme.section_space)
+    yield from theme.section_header("PROFESSIONAL EXPERIENCE")
+
+    for exp in resume.experience:
         exp_data = [
             [
-                Paragraph(f"<b>{exp.get('organization', '')}</b>", normal_style),
-                Paragraph(f"<b>{exp.get('dates', '')}</b>", ParagraphStyle(name='RightAlign', alignment=2))
+                Paragraph(f"<b>{mk(exp.organization, bold=True)}</b>", normal_style),
+                Paragraph(f"<b>{mk(exp.dates, bold=True)}</b>", right_style)
             ],
             [
-                Paragraph(f"<i>{exp.get('role', '')}</i>", normal_style),
+                Paragraph(f"<i>{mk(exp.role, italic=True)}</i>", normal_style),
                 ""
             ]
         ]
-        
-        exp_table = Table(exp_data, colWidths=[doc.width * 0.7, doc.width * 0.3])
-        exp_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-        ]))
-        
-        elements.append(exp_table)
-        
+
+        logo = _image(exp.logo, theme.logo_size, theme.logo_size, profile)
+        if logo is None:
+            exp_table = Table(exp_data, colWidths=theme.entry_col_widths)
+            exp_table.setStyle(theme.entry_table_style)
+        else:
+            # Company logo in front of the organization and role
+            exp_table = Table([[logo, *exp_data[0]], ["", *exp_data[1]]], colWidths=theme.logo_col_widths)
+            exp_table.setStyle(theme.logo_table_style)
+
+        yield exp_table
+
         # Add responsibilities below as bullet points
-        if exp.get('responsibilities', []):
+        if exp.responsibilities:
             bullet_points = ListFlowable(
-                [ListItem(Paragraph(resp, normal_style), bulletColor=colors.black) for resp in exp['responsibilities']],
+                [ListItem(Paragraph(mk(resp), normal_style), bulletColor=colors.black) for resp in exp.responsibilities],
                 bulletType='bullet',
-                bulletFontName='Helvetica',
-                bulletFontSize=10,
-                leftIndent=20
+                bulletFontName=theme.font_name,
+                bulletFontSize=theme.bullet_font_size,
+                leftIndent=theme.bullet_indent
             )
-            elements.append(bullet_points)
-        
-        elements.append(Spacer(1, 10))  # Space between professional experience entries
+            yield bullet_points
+
+        yield theme.spacer(theme.entry_space)  # Space between professional experience entries
+
+def _project_flowables(resume, theme):
+    normal_style = theme.styles['normal']
+    mk = theme.markup
 
     # PROJECTS
-    elements.append(Spacer(1, 12))
-    elements.append(Paragraph("<b>PROJECTS</b>", heading_style))
+    yield theme.spacer(theme.section_space)
+    yield from theme.section_header("PROJECTS")
 
-    # Add a horizontal rule after the "PROJECTS" heading
-    line_table = Table([[Paragraph("")]], colWidths=[doc.width])  # Empty cell for a full-width line
-    line_table.setStyle(TableStyle([
-        ('LINEABOVE', (0, 0), (-1, 0), 1, colors.black),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    elements.append(line_table)
+    for proj in resume.projects:
+        yield Paragraph(f"<b>{mk(proj.name, bold=True)}</b>", normal_style)
 
-    for proj in data.get('projects', []):
-        elements.append(Paragraph(f"<b>{proj.get('name', '')}</b>", normal_style))
-        
         project_bullets = ListFlowable(
             [
-                ListItem(Paragraph(proj.get('description', ''), normal_style), bulletColor=colors.black),
-                ListItem(Paragraph(f"Tech Stack: {', '.join(proj.get('tech_stack', []))}", normal_style), bulletColor=colors.black),
+                ListItem(Paragraph(mk(proj.description), normal_style), bulletColor=colors.black),
+                ListItem(Paragraph(f"Tech Stack: {mk(proj.tech_stack)}", normal_style), bulletColor=colors.black),
             ],
             bulletType='bullet',
-            bulletFontName='Helvetica',
-            bulletFontSize=10,
-            leftIndent=20
+            bulletFontName=theme.font_name,
+            bulletFontSize=theme.bullet_font_size,
+            leftIndent=theme.bullet_indent
         )
-        elements.append(project_bullets)
-        elements.append(Spacer(1, 10))  # Space between project entries
+        yield project_bullets
+        yield theme.spacer(theme.entry_space)  # Space between project entries
 
-    # SKILLS
-    elements.append(Spacer(1, 12))
-    elements.append(Paragraph("<b>SKILLS</b>", heading_style))
+def _skills_flowables(resume, theme):
+    normal_style = theme.styles['normal']
+    mk = theme.markup
 
-    # Add a horizontal rule after the "SKILLS" heading
-    line_table = Table([[Paragraph("")]], colWidths=[doc.width])  # Empty cell for a full-width line
-    line_table.setStyle(TableStyle([
-        ('LINEABOVE', (0, 0), (-1, 0), 1, colors.black),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    elements.append(line_table)
+    # SKILLS
+    yield theme.spacer(theme.section_space)
+    yield from theme.section_header("SKILLS")
 
     # Programming Languages & Frameworks
-    programming_skills = f"<b>Programming Languages & Frameworks:</b> {', '.join(data.get('skills', {}).get('programming_languages_and_frameworks', []))}"
-    elements.append(Paragraph(programming_skills, normal_style))
+    programming_skills = f"<b>Programming Languages & Frameworks:</b> {mk(resume.programming_skills)}"
+    yield Paragraph(programming_skills, normal_style)
 
-    elements.append(Spacer(1, 6))
+    yield theme.spacer(theme.skills_space)
 
     # Soft Skills
-    soft_skills = f"<b>Soft Skills:</b> {', '.join(data.get('skills', {}).get('soft_skills', []))}"
-    elements.append(Paragraph(soft_skills, normal_style))
+    soft_skills = f"<b>Soft Skills:</b> {mk(resume.soft_skills)}"
+    yield Paragraph(soft_skills, normal_style)
 
-    # Build the PDF
-    doc.build(elements)
-    print(f"Resume saved to: {output_filepath}")
+def _image(path, width, height, profile, crop=False):
+    """
+    Returns an image flowable downsampled to its printed size (see images.prepare_image).
+    A photo or logo that cannot be read is left out with a warning instead of failing the render.
+    :return: Image flowable, or None when there is no image.
+    """
+    if path is None:
+        return None
+    # Pillow is only imported by resumes that have images
+    from images import prepare_image
+    try:
+        image = prepare_image(path, width, height, crop=crop, dpi=profile.image_dpi, quality=profile.jpeg_quality)
+    except OSError as e:
+        print(f"Warning: image left out: {e}", file=sys.stderr)
+        return None
+    return Image(io.BytesIO(image.data), image.width, image.height)
 
 def load_user_data(file_path):
     """
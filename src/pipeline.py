@@ -0,0 +1,328 @@
+"""
+Batch rendering as a pipeline of concurrent stages connected by bounded queues:
+
+    read -> validate -> render -> write
+
+read      streams the source and parses each resume, in a thread (asyncio has no file API)
+validate  validates each resume and checks the render cache, in the event loop
+render    lays out the PDFs in a pool of worker processes, which send back the bytes
+write     writes the finished PDFs to disk, in threads
+
+Each queue holds only a few items per worker. When a queue is full, the stage feeding it waits
+(backpressure), so memory stays flat however large the source is, while reads and writes overlap
+with rendering. Every stage records how long it was busy and how long it was blocked on a full
+queue; print_stages shows which stage is the bottleneck.
+"""
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import instrumentation
+from instrumentation import stage
+from batch import expand_source, is_json_array, summarize, unique_output_path
+from file_handler import load_user_data, iter_user_records, RecordError, JSONL_EXTENSIONS
+from date_parser import reference_month
+from render_cache import RenderCache
+from resume_ir import normalize
+from validator import validate_data
+
+# Queue slots per render worker between two stages
+QUEUE_DEPTH = 2
+
+# Renders submitted per worker process, so a worker never waits on the event loop for its next resume
+IN_FLIGHT = 2
+
+# Threads writing PDFs to disk
+WRITERS = 2
+
+STAGES = ("read", "validate", "render", "write")
+
+# Sent down a queue once per consumer when its producer is done
+_DONE = None
+
+# Per-process state filled in by the pool initializer
+_worker = {}
+
+
+class StageStats:
+    """
+    Busy and blocked time of one pipeline stage.
+    """
+
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+
+    def as_dict(self, elapsed):
+        capacity = self.workers * elapsed
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy": self.busy,
+            "blocked": self.blocked,
+            "utilization": self.busy / capacity if capacity > 0 else 0.0,
+        }
+
+
+def run_pipeline(source, output_folder="output", workers=None, summary_path=None, theme="default", use_cache=True,
+                 metrics=None, backend="reportlab", fit_pages=None, profile="balanced"):
+    """
+    Renders every resume in a batch source with overlapping read, validate, render and write stages.
+    Takes the same arguments as batch.run_batch.
+    :return: Summary dictionary like run_batch's, plus "stages" with the utilization of each stage.
+    """
+    if metrics is None:
+        metrics = instrumentation.is_enabled()
+    workers = workers or os.cpu_count() or 1
+    # One "now" for the whole batch so every "Present" date is checked against the same month
+    now = reference_month()
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(theme, metrics, backend, fit_pages, profile)) as pool:
+        results, stats = asyncio.run(_run(source, output_folder, workers, pool, now, theme, use_cache, backend,
+                                          fit_pages, profile))
+    elapsed = time.perf_counter() - started
+
+    summary = summarize(source, workers, results, elapsed, profile)
+    summary["stages"] = {name: stats[name].as_dict(elapsed) for name in STAGES}
+
+    if summary_path:
+        with open(summary_path, 'w') as file:
+            json.dump(summary, file, indent=2)
+
+    return summary
+
+
+async def _run(source, output_folder, workers, pool, now, theme, use_cache, backend, fit_pages, profile):
+    from pdf_generator import render_cache_key, resume_pdf_path, get_backend
+    from themes import get_theme
+
+    theme = get_theme(theme)
+    backend = get_backend(backend)
+    cache = RenderCache(output_folder) if use_cache else None
+    os.makedirs(output_folder, exist_ok=True)
+
+    stats = {
+        "read": StageStats("read", 1),
+        "validate": StageStats("validate", 1),
+        "render": StageStats("render", workers),
+        "write": StageStats("write", WRITERS),
+    }
+    parsed = asyncio.Queue(QUEUE_DEPTH * workers)
+    valid = asyncio.Queue(QUEUE_DEPTH * workers)
+    rendered = asyncio.Queue(QUEUE_DEPTH * workers)
+    results = []
+    loop = asyncio.get_running_loop()
+    # Output paths taken by items of this run; every stage runs on this thread, so a set is enough
+    claimed = set()
+
+    def claim(path):
+        if path in claimed:
+            return False
+        claimed.add(path)
+        return True
+
+    def cache_key(resume):
+        return render_cache_key(resume, theme, backend, fit_pages, profile)
+
+    def output_path(resume):
+        return unique_output_path(resume_pdf_path(resume, output_folder), claim)
+
+    async def render():
+        await asyncio.gather(*(_render(valid, rendered, pool, stats["render"])
+                               for _ in range(IN_FLIGHT * workers)))
+        for _ in range(WRITERS):
+            await rendered.put(_DONE)
+
+    await asyncio.gather(
+        asyncio.to_thread(_read, source, parsed, loop, stats["read"]),
+        _validate(parsed, valid, results, now, cache, cache_key, claim, output_path, IN_FLIGHT * workers, stats["validate"]),
+        render(),
+        *(_write(rendered, cache, stats["write"]) for _ in range(WRITERS)),
+    )
+    if cache is not None:
+        cache.save()
+    return results, stats
+
+
+def _read(source, queue, loop, stats):
+    # Runs in a thread; put() blocks while the queue is full
+    def put(item):
+        waited = time.perf_counter()
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        stats.blocked += time.perf_counter() - waited
+
+    started = time.perf_counter()
+    for item in _iter_items(source, put):
+        stats.items += 1
+        put(item)
+    put(_DONE)
+    stats.busy = time.perf_counter() - started - stats.blocked
+
+
+def _iter_items(source, put):
+    # Same items as batch.collect_inputs, but produced one at a time with single files already loaded
+    for path in expand_source(source):
+        if path.endswith(JSONL_EXTENSIONS) or is_json_array(path):
+            # Bad records go straight downstream so they show up in the summary
+            report = lambda error: put((f"{path}:{error.line}", error))
+            for record in iter_user_records(path, on_error=report):
+                yield f"{path}:{record.line}", record.data
+        else:
+            with stage("load"):
+                user_data = load_user_data(path)
+            yield path, user_data
+
+
+async def _validate(source, queue, results, now, cache, cache_key, claim, output_path, consumers, stats):
+    while True:
+        item = await source.get()
+        if item is _DONE:
+            break
+        started = time.perf_counter()
+        item_id, user_data = item
+        result = {"id": item_id, "status": "ok", "output": None, "errors": []}
+        results.append(result)
+        resume = _check(user_data, result, now, cache, cache_key, claim, output_path)
+        stats.items += 1
+        stats.busy += time.perf_counter() - started
+        if resume is not None:
+            waited = time.perf_counter()
+            await queue.put((resume, result))
+            stats.blocked += time.perf_counter() - waited
+
+    for _ in range(consumers):
+        await queue.put(_DONE)
+
+
+def _check(user_data, result, now, cache, cache_key, claim, output_path):
+    # Fills in a failed or cached result; returns the resume when it still needs rendering
+    if isinstance(user_data, RecordError):
+        result["status"] = "error"
+        result["errors"] = [f"Bad record at byte {user_data.offset}: {user_data.message}"]
+        return None
+    if not user_data:
+        result["status"] = "error"
+        result["errors"] = ["No user data found."]
+        return None
+
+    with stage("validate"):
+        is_valid, errors = validate_data(user_data, now=now)
+    if not is_valid:
+        result["status"] = "invalid"
+        result["errors"] = errors
+        return None
+
+    resume = normalize(user_data)
+    if cache is not None:
+        result["cache_key"] = cache_key(resume)
+        cached_path = cache.lookup(result["cache_key"])
+        # Another item of this run may already have claimed the cached file's name
+        if cached_path and claim(cached_path):
+            result["output"] = cached_path
+            result["cached"] = True
+            return None
+    # Claimed here, in item order, so same-name resumes are numbered the way they appear in the source
+    result["output"] = output_path(resume)
+    return resume
+
+
+async def _render(source, queue, pool, stats):
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await source.get()
+        if item is _DONE:
+            break
+        resume, result = item
+        pdf, error, seconds, worker_metrics = await loop.run_in_executor(pool, _render_pdf, resume)
+        # Time spent inside the worker, so renders waiting in the pool's own queue do not count as busy
+        stats.items += 1
+        stats.busy += seconds
+        if worker_metrics:
+            instrumentation.merge(worker_metrics)
+        if error:
+            result["status"] = "error"
+            result["output"] = None
+            result["errors"] = [error]
+            continue
+        result["bytes"] = len(pdf)
+        waited = time.perf_counter()
+        await queue.put((pdf, result))
+        stats.blocked += time.perf_counter() - waited
+
+
+def _init_worker(theme, metrics=False, backend="reportlab", fit_pages=None, profile="balanced"):
+    """
+    Pool initializer: imports reportlab once per worker process and resolves the render settings.
+    Workers only lay out PDFs; validation, the render cache and the output files stay in the parent.
+    """
+    if metrics:
+        instrumentation.enable()
+    from pdf_generator import render_resume_pdf, get_backend
+    from themes import get_theme
+    _worker["render"] = render_resume_pdf
+    _worker["theme"] = get_theme(theme)
+    _worker["backend"] = get_backend(backend)
+    _worker["fit_pages"] = fit_pages
+    _worker["profile"] = profile
+
+
+def _render_pdf(resume):
+    # Runs in a worker process set up by _init_worker
+    started = time.perf_counter()
+    pdf = error = None
+    try:
+        with stage("render"):
+            pdf = _worker["render"](resume, None, _worker["theme"], backend=_worker["backend"],
+                                    fit_pages=_worker["fit_pages"], profile=_worker["profile"])
+    except Exception as exc:  # one broken resume must not stop the batch
+        error = f"{type(exc).__name__}: {exc}"
+    seconds = time.perf_counter() - started
+    return pdf, error, seconds, instrumentation.drain() if instrumentation.is_enabled() else None
+
+
+async def _write(source, cache, stats):
+    while True:
+        item = await source.get()
+        if item is _DONE:
+            break
+        pdf, result = item
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(_write_pdf, result["output"], pdf)
+        except OSError as exc:  # one unwritable file must not stop the batch
+            result["status"] = "error"
+            result["output"] = None
+            result["errors"] = [f"{type(exc).__name__}: {exc}"]
+            del result["bytes"]
+        stats.items += 1
+        stats.busy += time.perf_counter() - started
+        if cache is not None and result["status"] == "ok":
+            cache.store(result["cache_key"], result["output"])
+
+
+def _write_pdf(path, pdf):
+    with open(path, 'wb') as file:
+        file.write(pdf)
+
+
+def print_stages(summary):
+    """
+    Prints the utilization of each pipeline stage, marking the busiest one as the bottleneck.
+    :param summary: Summary dictionary returned by run_pipeline.
+    """
+    stages = summary["stages"]
+    bottleneck = max(stages, key=lambda name: stages[name]["utilization"])
+    for name in STAGES:
+        entry = stages[name]
+        line = (f"  {name:<9} {entry['utilization']:6.1%} busy across {entry['workers']} worker(s), "
+                f"{entry['items']} items, blocked {entry['blocked']:.2f}s")
+        if name == bottleneck:
+            line += "  <- bottleneck"
+        print(line)
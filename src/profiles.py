@@ -0,0 +1,72 @@
+"""
+Output profiles: named trade-offs between PDF file size and render speed.
+
+    fast      Interactive previews. Page streams are written uncompressed and images are
+              resampled to screen resolution.
+    balanced  The default. reportlab's usual output: Flate-compressed, ASCII85-wrapped streams.
+    archive   Bulk archival. Streams are written as binary Flate without the ASCII85 text
+              wrapping (about a quarter smaller), font subsets are compressed at the highest
+              level, and images use a lower resolution and JPEG quality.
+
+Font subsets are cached compressed per process (see fonts), so compressing them costs nothing
+after the first document and every profile does it. Pick a profile with --profile, or with
+profile= on generate_resume_pdf, render_resume_pdf or run_batch. The reported bytes and render
+times (and the benchmark suite) show what each one costs for a given corpus.
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+
+# page_compression: Flate-compress the page streams. ascii85: wrap binary streams in ASCII85 text.
+# font_compression: zlib level of the embedded font subsets. image_dpi / jpeg_quality: see images.prepare_image.
+OutputProfile = namedtuple("OutputProfile", ["name", "page_compression", "ascii85", "font_compression",
+                                             "image_dpi", "jpeg_quality"])
+
+DEFAULT_PROFILE = "balanced"
+
+PROFILES = {
+    "fast": OutputProfile("fast", page_compression=False, ascii85=False, font_compression=1,
+                          image_dpi=96, jpeg_quality=75),
+    "balanced": OutputProfile("balanced", page_compression=True, ascii85=True, font_compression=6,
+                              image_dpi=150, jpeg_quality=80),
+    "archive": OutputProfile("archive", page_compression=True, ascii85=False, font_compression=9,
+                             image_dpi=120, jpeg_quality=70),
+}
+
+
+def get_profile(profile=DEFAULT_PROFILE):
+    """
+    Looks up an output profile.
+    :param profile: Profile name, or an OutputProfile which is returned unchanged.
+    :return: OutputProfile.
+    """
+    if isinstance(profile, OutputProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown profile '{profile}'. Available profiles: {', '.join(sorted(PROFILES))}") from None
+
+def available_profiles():
+    return sorted(PROFILES)
+
+
+@contextmanager
+def applied(profile):
+    """
+    Applies the process-wide settings of a profile (ASCII85 wrapping and font subset compression)
+    while a document is built and saved.
+    Documents are built one at a time per process, so the previous settings are restored afterwards.
+    :param profile: Profile name or OutputProfile.
+    """
+    from reportlab import rl_config
+    from fonts import set_subset_compression
+
+    profile = get_profile(profile)
+    previous = rl_config.useA85
+    rl_config.useA85 = int(profile.ascii85)
+    previous_fonts = set_subset_compression(profile.font_compression)
+    try:
+        yield profile
+    finally:
+        rl_config.useA85 = previous
+        set_subset_compression(previous_fonts)
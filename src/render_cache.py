@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import time
+
+MANIFEST_NAME = ".render_cache.json"
+MANIFEST_VERSION = 1
+
+class RenderCache:
+    """
+    Small on-disk manifest that maps a content hash of (resume, theme, renderer version)
+    to the PDF already rendered from it, so unchanged resumes can be skipped.
+    The manifest lives next to the PDFs in the output folder.
+    """
+
+    def __init__(self, output_folder, max_entries=50000, max_age=30 * 24 * 3600):
+        """
+        :param output_folder: Folder holding the rendered PDFs and the manifest.
+        :param max_entries: Keep at most this many entries, dropping the least recently used.
+        :param max_age: Drop entries not used for this many seconds.
+        """
+        self.output_folder = output_folder
+        self.manifest_path = os.path.join(output_folder, MANIFEST_NAME)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.entries = self._load()
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r') as file:
+                manifest = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("entries", {})
+
+    @staticmethod
+    def key(data, theme_key, renderer_version):
+        """
+        Canonical hash of a resume plus everything else that changes the rendered output.
+        :param data: Dictionary containing resume information.
+        :param theme_key: String identifying the theme and its metrics.
+        :param renderer_version: Version of the renderer layout.
+        :return: Hex digest.
+        """
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.sha256(canonical.encode("utf-8"))
+        digest.update(f"\0{theme_key}\0{renderer_version}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def lookup(self, key):
+        """
+        :param key: Hash returned by RenderCache.key.
+        :return: Path of the cached PDF, or None if it is unknown or the file changed on disk.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        path = os.path.join(self.output_folder, entry["file"])
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+        entry["last_used"] = time.time()
+        self._dirty = True
+        return path
+
+    def store(self, key, output_path):
+        """
+        Records a freshly rendered PDF.
+        :param key: Hash returned by RenderCache.key.
+        :param output_path: Path of the rendered PDF.
+        """
+        now = time.time()
+        stat = os.stat(output_path)
+        self.entries[key] = {
+            # Stored relative to the output folder so the manifest survives a change of working directory
+            "file": os.path.relpath(output_path, self.output_folder),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "created": now,
+            "last_used": now,
+        }
+        self._dirty = True
+
+    def evict(self, now=None):
+        """
+        Drops entries older than max_age, then the least recently used ones beyond max_entries.
+        The PDFs themselves are left in place; only the manifest forgets them.
+        :return: Number of entries evicted.
+        """
+        now = time.time() if now is None else now
+        before = len(self.entries)
+        entries = {key: entry for key, entry in self.entries.items() if now - entry["last_used"] <= self.max_age}
+        if len(entries) > self.max_entries:
+            newest = sorted(entries.items(), key=lambda item: item[1]["last_used"], reverse=True)
+            entries = dict(newest[:self.max_entries])
+        self.entries = entries
+        evicted = before - len(entries)
+        if evicted:
+            self._dirty = True
+        return evicted
+
+    def save(self):
+        """
+        Evicts stale entries and writes the manifest atomically if anything changed.
+        """
+        self.evict()
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w') as file:
+            json.dump({"version": MANIFEST_VERSION, "entries": self.entries}, file)
+        os.replace(temp_path, self.manifest_path)
+        self._dirty = False
@@ -0,0 +1,109 @@
+"""
+Format-neutral intermediate representation (IR) of a resume.
+
+normalize() walks the raw resume dictionary once: missing fields become empty strings, lists
+that every format prints joined (courses, tech stacks, skills) are joined, and date ranges are
+parsed. Every output format (PDF, HTML, Markdown, text) renders from the IR, so producing several
+formats costs one traversal of the dictionary plus one cheap emit per format.
+"""
+from collections import namedtuple
+
+from date_parser import parse_date_range
+
+Contact = namedtuple("Contact", ["phone", "email", "location", "linkedin"])
+# courses is None when the entry has no relevant_courses key, so formats can leave the line out
+Education = namedtuple("Education", ["institution", "degree", "dates", "period", "courses"])
+# photo and logo are image file paths, or None when the resume has none (see images.py)
+Experience = namedtuple("Experience", ["organization", "role", "dates", "period", "location", "responsibilities",
+                                       "logo"], defaults=(None,))
+Project = namedtuple("Project", ["name", "description", "tech_stack"])
+Resume = namedtuple("Resume", ["name", "contact", "education", "experience", "projects",
+                               "programming_skills", "soft_skills", "photo"], defaults=(None,))
+
+SEPARATOR = ", "
+
+
+def normalize(data):
+    """
+    Builds the IR of a resume.
+    :param data: Dictionary containing resume information.
+    :return: Resume named tuple; nested entries are named tuples as well.
+    """
+    contact = data.get("contact") or {}
+    skills = data.get("skills") or {}
+    return Resume(
+        _text(data.get("name")),
+        Contact(
+            _text(contact.get("phone")),
+            _text(contact.get("email")),
+            _text(contact.get("location", contact.get("Location"))),
+            _text(contact.get("linkedin")),
+        ),
+        tuple(
+            Education(
+                _text(edu.get("institution")),
+                _text(edu.get("degree")),
+                _text(edu.get("dates")),
+                _period(edu.get("dates")),
+                _join(edu.get("relevant_courses")) if "relevant_courses" in edu else None,
+            )
+            for edu in data.get("education") or []
+        ),
+        tuple(
+            Experience(
+                _text(exp.get("organization")),
+                _text(exp.get("role")),
+                _text(exp.get("dates")),
+                _period(exp.get("dates")),
+                _text(exp.get("location")),
+                tuple(_text(item) for item in exp.get("responsibilities") or []),
+                _path(exp.get("logo")),
+            )
+            for exp in data.get("professional_experience") or []
+        ),
+        tuple(
+            Project(_text(proj.get("name")), _text(proj.get("description")), _join(proj.get("tech_stack")))
+            for proj in data.get("projects") or []
+        ),
+        _join(skills.get("programming_languages_and_frameworks")),
+        _join(skills.get("soft_skills")),
+        _path(data.get("photo")),
+    )
+
+
+def as_resume(data):
+    """
+    Returns data unchanged if it is already a Resume, otherwise its IR.
+    """
+    if isinstance(data, Resume):
+        return data
+    return normalize(data)
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _path(value):
+    return value if isinstance(value, str) and value else None
+
+
+def _join(values):
+    if not values:
+        return ""
+    if isinstance(values, str):
+        return values
+    return SEPARATOR.join(map(str, values))
+
+
+def _period(dates):
+    """
+    Parses a date range without resolving "Present", so the IR does not depend on when it was built.
+    :return: DateRange with end None for "... - Present", or None if the text is not a date range.
+    """
+    if not isinstance(dates, str):
+        return None
+    period = parse_date_range(dates)
+    if period is not None and period.present:
+        period = period._replace(end=None)
+    return period
@@ -0,0 +1,203 @@
+"""
+Compact in-memory resume model for large corpora.
+
+A resume loaded with load_user_data is a tree of dicts and lists in which every string is its
+own object, so a skill like "Python" is stored once per resume that lists it. ResumeModel keeps
+the same data in __slots__ records and tuples, and interns the values that repeat across resumes:
+skills, tech stacks, courses, institutions, organizations, roles, locations, dates and logos.
+
+Records are read-only Mappings with the same keys as the JSON, so validate_data, display_resume
+and generate_resume_pdf accept a ResumeModel wherever they accept the dictionary.
+A field that is missing (or null) in the JSON is stored as None and reads as missing.
+"""
+import sys
+from collections.abc import Mapping
+
+from file_handler import load_user_data, iter_user_data
+
+
+def _word(value):
+    # Shared vocabulary: one string object per distinct value across every loaded resume
+    return sys.intern(value) if type(value) is str else value
+
+def _words(value):
+    if isinstance(value, list):
+        return tuple(_word(item) for item in value)
+    return value
+
+def _texts(value):
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class _Record(Mapping):
+    """
+    Fixed-field record stored in __slots__ and read like the dictionary it was built from.
+    Subclasses list their JSON keys in __slots__ and a converter per key in _converters (None keeps the value).
+    Values that do not have the expected type are kept as they are, so validation still reports them.
+    """
+    __slots__ = ()
+    _converters = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        record = cls.__new__(cls)
+        get = data.get
+        for field, convert in cls._converters:
+            value = get(field)
+            setattr(record, field, value if value is None or convert is None else convert(value))
+        return record
+
+    def __getitem__(self, key):
+        if key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        return default
+
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def __iter__(self):
+        return (field for field in self.__slots__ if getattr(self, field) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (_rebuild, (type(self), tuple(getattr(self, field) for field in self.__slots__)))
+
+    def to_dict(self):
+        """
+        :return: The record as plain dicts and lists, ready for json.dump.
+        """
+        return {key: _to_plain(value) for key, value in self.items()}
+
+
+def _rebuild(cls, values):
+    record = cls.__new__(cls)
+    for field, value in zip(cls.__slots__, values):
+        setattr(record, field, value)
+    return record
+
+
+def _to_plain(value):
+    if isinstance(value, (_Record, Skills)):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _object(cls):
+    def convert(value):
+        return cls.from_dict(value) if isinstance(value, dict) else value
+    return convert
+
+def _objects(cls):
+    def convert(value):
+        if not isinstance(value, list):
+            return value
+        return tuple(cls.from_dict(item) if isinstance(item, dict) else item for item in value)
+    return convert
+
+
+class Skills(Mapping):
+    """
+    Skill categories (an open set of keys) mapped to interned tuples of skill names.
+    """
+    __slots__ = ("_items",)
+
+    def __init__(self, data):
+        self._items = tuple((_word(key), _words(value)) for key, value in data.items())
+
+    def __getitem__(self, key):
+        for name, value in self._items:
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (name for name, _ in self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"Skills({dict(self)!r})"
+
+    def __reduce__(self):
+        return (Skills, (dict(self._items),))
+
+    def to_dict(self):
+        return {name: _to_plain(value) for name, value in self._items}
+
+
+class Contact(_Record):
+    __slots__ = ("phone", "email", "location", "linkedin")
+    _converters = (("phone", None), ("email", None), ("location", _word), ("linkedin", None))
+
+
+class Education(_Record):
+    __slots__ = ("institution", "degree", "dates", "relevant_courses")
+    _converters = (("institution", _word), ("degree", _word), ("dates", _word), ("relevant_courses", _words))
+
+
+class Experience(_Record):
+    __slots__ = ("role", "organization", "location", "dates", "responsibilities", "logo")
+    _converters = (("role", _word), ("organization", _word), ("location", _word), ("dates", _word),
+                   ("responsibilities", _texts), ("logo", _word))
+
+
+class Project(_Record):
+    __slots__ = ("name", "description", "tech_stack")
+    _converters = (("name", None), ("description", None), ("tech_stack", _words))
+
+
+class ResumeModel(_Record):
+    __slots__ = ("name", "contact", "education", "professional_experience", "projects", "skills", "photo")
+    _converters = (
+        ("name", None),
+        ("contact", _object(Contact)),
+        ("education", _objects(Education)),
+        ("professional_experience", _objects(Experience)),
+        ("projects", _objects(Project)),
+        ("skills", lambda value: Skills(value) if isinstance(value, dict) else value),
+        ("photo", None),
+    )
+
+
+def to_model(data):
+    """
+    Converts a resume dictionary to a ResumeModel. Keys outside the resume template are dropped.
+    :param data: Dictionary containing resume information.
+    :return: ResumeModel, or None for empty data.
+    """
+    if not data:
+        return None
+    return ResumeModel.from_dict(data)
+
+def load_resume_model(file_path):
+    """
+    Loads one resume JSON file as a ResumeModel.
+    :return: ResumeModel, or None if the file is missing or invalid.
+    """
+    return to_model(load_user_data(file_path))
+
+def iter_resume_models(file_path, on_error=None):
+    """
+    Streams ResumeModels from a JSONL file, a JSON array or a single JSON object; see file_handler.iter_user_data.
+    """
+    for data in iter_user_data(file_path, on_error):
+        yield ResumeModel.from_dict(data)
@@ -0,0 +1,394 @@
+import json
+from array import array
+from bisect import bisect_right
+from collections import Counter, namedtuple
+from collections.abc import Mapping
+from itertools import accumulate, chain, filterfalse, repeat
+from operator import methodcaller
+
+# A single validation failure, e.g. ("professional_experience[3].dates", "format", "Invalid dates ...")
+ValidationError = namedtuple("ValidationError", ["path", "code", "message"])
+
+# Errors of a whole batch as parallel columns (row i is records[i], codes[i], paths[i]), plus
+# counts keyed by (schema path, code), e.g. ("professional_experience[].dates", "format")
+BatchValidation = namedtuple("BatchValidation", ["count", "records", "codes", "paths", "counts"])
+
+DEFAULT_MESSAGES = {
+    "required": "'{path}' is required and cannot be empty.",
+    "type": "'{path}' must be {expected}.",
+    "format": "Invalid format for '{path}'.",
+}
+
+class _Stop(Exception):
+    """Raised internally to end a fail-fast validation at the first error."""
+
+class ValidationPlan:
+    """
+    A validator compiled once from a template and a rule table, reusable for any number of records.
+    """
+
+    def __init__(self, check, check_columns=None):
+        self._check = check
+        self._check_columns = check_columns
+
+    def validate(self, data, fail_fast=False, context=None):
+        """
+        Validates one record.
+        :param data: Dictionary containing resume information.
+        :param fail_fast: Stop at the first error instead of collecting all of them.
+        :param context: Passed through to every format predicate (e.g. the "now" reference for date ranges).
+        :return: List of ValidationError tuples (empty when the record is valid).
+        """
+        errors = []
+        try:
+            self._check(data, "", errors, fail_fast, context)
+        except _Stop:
+            pass
+        return errors
+
+    def is_valid(self, data, context=None):
+        return not self.validate(data, fail_fast=True, context=context)
+
+    def validate_columns(self, records, context=None):
+        """
+        Validates many records at once, one field at a time across all of them.
+        Each field is pulled out of every record into a column and checked in one pass. Type checks
+        first look at the set of types in the column, and each distinct value of a formatted field is
+        checked once. Paths are only built for the values that fail.
+        :param records: List of records.
+        :param context: Passed through to every format predicate.
+        :return: BatchValidation; record numbers are positions in records. Reports the same errors as
+                 validate() on each record, without the messages.
+        """
+        records = list(records)
+        table = _ErrorTable(len(records))
+        self._check_columns(records, range(len(records)), None, "", table, context)
+        return table.result()
+
+def load_template(template_path):
+    with open(template_path, 'r') as file:
+        return json.load(file)
+
+def compile_schema(template, rules=None, formats=None, bulk_formats=None):
+    """
+    Compiles a template document and a rule table into a ValidationPlan.
+    The template supplies the shape and types: strings, lists of strings, lists of objects and objects.
+    Rules are keyed by schema path ("contact.email", "education[].dates", "skills.*") and may set
+    "required", "format" (a key into formats), "open" (an object with arbitrary keys) and "messages".
+    "required" is True for a non-empty value, or "key" when only the key must be there and an empty
+    value is left to the type and format checks (e.g. an empty email is reported as a bad format).
+    :param template: Example resume, e.g. the contents of data/template.json.
+    :param rules: Dictionary of rules keyed by schema path.
+    :param formats: Dictionary mapping format names to predicates(value, context) returning True for valid strings.
+    :param bulk_formats: Optional dictionary mapping format names to functions(values, context) returning the
+                         invalid strings of a set; validate_columns uses them instead of the predicates.
+    :return: ValidationPlan.
+    """
+    rules = rules or {}
+    formats = formats or {}
+    column_formats = {name: _bulk(predicate) for name, predicate in formats.items()}
+    column_formats.update(bulk_formats or {})
+    return ValidationPlan(_compile(template, "", rules, formats), _compile_column(template, "", rules, column_formats))
+
+def _bulk(predicate):
+    def invalid_values(values, context):
+        return {value for value in values if not predicate(value, context)}
+    return invalid_values
+
+def invalid_matches(pattern):
+    """
+    Bulk format for validate_columns: the strings that a compiled regex does not match, found in one C-level pass.
+    """
+    def invalid_values(values, context):
+        return set(filterfalse(pattern.match, values))
+    return invalid_values
+
+def _emit(errors, fail_fast, path, code, messages, **fields):
+    template = messages.get(code) or DEFAULT_MESSAGES[code]
+    key = path.rsplit(".", 1)[-1]
+    errors.append(ValidationError(path, code, template.format(path=path, key=key, **fields)))
+    if fail_fast:
+        raise _Stop
+
+def _join(path, key):
+    return f"{path}.{key}" if path else key
+
+def _compile(node, schema_path, rules, formats):
+    rule = rules.get(schema_path, {})
+    messages = rule.get("messages", {})
+    if isinstance(node, dict):
+        return _compile_object(node, schema_path, rule, messages, rules, formats)
+    if isinstance(node, list):
+        return _compile_list(node, schema_path, messages, rules, formats)
+    return _compile_string(rule, messages, formats)
+
+def _compile_object(node, schema_path, rule, messages, rules, formats):
+    if rule.get("open"):
+        # Arbitrary keys, each shaped like the template's first value (e.g. skill categories)
+        value_path = _join(schema_path, "*")
+        value_rule = rules.get(value_path, {})
+        value_messages = value_rule.get("messages", {})
+        value_check = _compile(next(iter(node.values())), value_path, rules, formats)
+        fields = None
+    else:
+        fields = []
+        for key, child in node.items():
+            child_path = _join(schema_path, key)
+            child_rule = rules.get(child_path, {})
+            required = child_rule.get("required", False)
+            fields.append((key, bool(required), required == "key", child_rule.get("messages", {}),
+                           _compile(child, child_path, rules, formats)))
+
+    def check_object(value, path, errors, fail_fast, context):
+        # Mappings such as resume_model records are checked like dicts
+        if not isinstance(value, Mapping):
+            _emit(errors, fail_fast, path, "type", messages, expected="an object")
+            return
+
+        prefix = f"{path}." if path else ""
+        if fields is None:
+            for key, item in value.items():
+                if item:
+                    value_check(item, prefix + key, errors, fail_fast, context)
+                elif value_rule.get("required"):
+                    _emit(errors, fail_fast, prefix + key, "required", value_messages)
+            return
+
+        for key, required, key_only, field_messages, field_check in fields:
+            item = value.get(key)
+            if item or key_only and key in value:
+                field_check(item, prefix + key, errors, fail_fast, context)
+                continue
+            if required:
+                _emit(errors, fail_fast, prefix + key, "required", field_messages)
+            if isinstance(item, Mapping):
+                # An empty object still reports its own missing fields
+                field_check(item, prefix + key, errors, fail_fast, context)
+
+    return check_object
+
+def _compile_list(node, schema_path, messages, rules, formats):
+    item_path = f"{schema_path}[]"
+    item_template = node[0] if node else ""
+
+    if not isinstance(item_template, (dict, list)):
+        # List of strings: one type check over the whole list, paths only built on failure
+        def check_string_list(value, path, errors, fail_fast, context):
+            if not isinstance(value, (list, tuple)):
+                _emit(errors, fail_fast, path, "type", messages, expected="a list")
+                return
+            for index, item in enumerate(value):
+                if not isinstance(item, str):
+                    _emit(errors, fail_fast, f"{path}[{index}]", "type", {}, expected="a string")
+
+        return check_string_list
+
+    item_check = _compile(item_template, item_path, rules, formats)
+
+    def check_list(value, path, errors, fail_fast, context):
+        if not isinstance(value, (list, tuple)):
+            _emit(errors, fail_fast, path, "type", messages, expected="a list")
+            return
+        for index, item in enumerate(value):
+            item_check(item, f"{path}[{index}]", errors, fail_fast, context)
+
+    return check_list
+
+def _compile_string(rule, messages, formats):
+    format_name = rule.get("format")
+    is_valid_format = formats[format_name] if format_name else None
+
+    def check_string(value, path, errors, fail_fast, context):
+        if not isinstance(value, str):
+            _emit(errors, fail_fast, path, "type", messages, expected="a string")
+        elif is_valid_format is not None and not is_valid_format(value, context):
+            _emit(errors, fail_fast, path, "format", messages, value=value)
+
+    return check_string
+
+
+class _Level:
+    """
+    The items of one list (or open object) column, flattened across all of their containers.
+    Item positions are mapped back to their container and index only when an error needs a path.
+    """
+    __slots__ = ("parent", "locs", "suffix", "containers", "ends")
+
+    def __init__(self, parent, locs, suffix, containers):
+        self.parent = parent          # level of the containers; None for the records themselves
+        self.locs = locs              # position of each container in the parent level
+        self.suffix = suffix          # path from a container's position to the container
+        self.containers = containers
+        self.ends = list(accumulate(map(len, containers)))
+
+    def resolve(self, position):
+        container = bisect_right(self.ends, position)
+        index = position - (self.ends[container - 1] if container else 0)
+        value = self.containers[container]
+        segment = f"[{index}]" if isinstance(value, (list, tuple)) else f".{list(value)[index]}"
+        return self.locs[container], segment
+
+class _ErrorTable:
+    """
+    Errors found by the column checks, each placed by its level, its position in that level and a
+    path suffix. Full paths are only put together for the errors.
+    """
+
+    def __init__(self, count):
+        self.count = count
+        self.rows = []
+        self.counts = Counter()
+
+    def emit(self, level, locs, suffix, code, rule):
+        if locs:
+            self.rows.extend((level, loc, suffix, code) for loc in locs)
+            self.counts[(rule, code)] += len(locs)
+
+    def result(self):
+        rows = sorted((_resolve(level, loc, suffix) + (code,) for level, loc, suffix, code in self.rows),
+                      key=lambda row: row[0])
+        return BatchValidation(self.count, array("q", [row[0] for row in rows]), [row[2] for row in rows],
+                               [row[1] for row in rows], self.counts)
+
+def _resolve(level, loc, suffix):
+    parts = [suffix]
+    while level is not None:
+        loc, segment = level.resolve(loc)
+        parts.append(segment)
+        parts.append(level.suffix)
+        level = level.parent
+    return loc, "".join(reversed(parts)).removeprefix(".")
+
+def _keep_types(values, locs, types, fast_types, level, suffix, table, rule):
+    # One look at the set of types in the column; values are only visited one by one on a mismatch.
+    # Also tells whether every kept value is exactly one of fast_types.
+    if set(map(type, values)) <= fast_types:
+        return values, locs, True
+    kept, kept_locs, bad = [], [], []
+    for value, loc in zip(values, locs):
+        if isinstance(value, types):
+            kept.append(value)
+            kept_locs.append(loc)
+        else:
+            bad.append(loc)
+    table.emit(level, bad, suffix, "type", rule)
+    return kept, kept_locs, False
+
+_VALUES = methodcaller("values")
+_MISSING = object()
+_OBJECT_TYPES = frozenset((dict,))
+_LIST_TYPES = frozenset((list, tuple))
+_STRING_TYPES = frozenset((str,))
+
+def _compile_column(node, schema_path, rules, formats):
+    # Column counterpart of _compile. Checks take (values, locs, level, suffix, table, context):
+    # values[i] sits at position locs[i] of level, below the path suffix, and suffixes start with ".".
+    # formats holds functions(values, context) returning the invalid strings of a set.
+    rule = rules.get(schema_path, {})
+    if isinstance(node, dict):
+        return _column_object(node, schema_path, rule, rules, formats)
+    if isinstance(node, list):
+        return _column_list(node, schema_path, rules, formats)
+    return _column_string(schema_path, rule, formats)
+
+def _column_object(node, schema_path, rule, rules, formats):
+    if rule.get("open"):
+        value_path = _join(schema_path, "*")
+        value_required = rules.get(value_path, {}).get("required", False)
+        value_check = _compile_column(next(iter(node.values())), value_path, rules, formats)
+        fields = None
+    else:
+        fields = []
+        for key, child in node.items():
+            child_path = _join(schema_path, key)
+            required = rules.get(child_path, {}).get("required", False)
+            fields.append((key, "." + key, bool(required), required == "key", child_path,
+                           _compile_column(child, child_path, rules, formats)))
+
+    def check_objects(values, locs, level, suffix, table, context):
+        values, locs, only_dicts = _keep_types(values, locs, Mapping, _OBJECT_TYPES, level, suffix, table,
+                                               schema_path)
+
+        if fields is None:
+            items = list(chain.from_iterable(map(_VALUES, values)))
+            item_level = _Level(level, locs, suffix, values)
+            if all(items):
+                value_check(items, range(len(items)), item_level, "", table, context)
+                return
+            present = [position for position, item in enumerate(items) if item]
+            if value_required:
+                table.emit(item_level, [position for position, item in enumerate(items) if not item], "",
+                           "required", value_path)
+            if present:
+                value_check([items[position] for position in present], present, item_level, "", table, context)
+            return
+
+        for key, field_suffix, required, key_only, child_path, field_check in fields:
+            # Only key-only fields tell a missing key (_MISSING) from an empty value
+            default = _MISSING if key_only else None
+            if only_dicts:
+                column = list(map(dict.get, values, repeat(key), repeat(default)))
+            else:
+                column = [value.get(key, default) for value in values]
+            child_suffix = suffix + field_suffix
+            if _MISSING not in column if key_only else all(column):
+                field_check(column, locs, level, child_suffix, table, context)
+                continue
+            present, present_locs, missing = [], [], []
+            for item, loc in zip(column, locs):
+                if item is not _MISSING if key_only else item:
+                    present.append(item)
+                    present_locs.append(loc)
+                    continue
+                missing.append(loc)
+                if isinstance(item, Mapping):
+                    # An empty object still reports its own missing fields
+                    present.append(item)
+                    present_locs.append(loc)
+            if required:
+                table.emit(level, missing, child_suffix, "required", child_path)
+            if present:
+                field_check(present, present_locs, level, child_suffix, table, context)
+
+    return check_objects
+
+def _column_list(node, schema_path, rules, formats):
+    item_path = f"{schema_path}[]"
+    item_template = node[0] if node else ""
+
+    if not isinstance(item_template, (dict, list)):
+        def check_string_lists(values, locs, level, suffix, table, context):
+            values, locs, _ = _keep_types(values, locs, (list, tuple), _LIST_TYPES, level, suffix, table, schema_path)
+            if set(map(type, chain.from_iterable(values))) <= _STRING_TYPES:
+                return
+            items = list(chain.from_iterable(values))
+            bad = [position for position, item in enumerate(items) if not isinstance(item, str)]
+            table.emit(_Level(level, locs, suffix, values), bad, "", "type", item_path)
+
+        return check_string_lists
+
+    item_check = _compile_column(item_template, item_path, rules, formats)
+
+    def check_lists(values, locs, level, suffix, table, context):
+        values, locs, _ = _keep_types(values, locs, (list, tuple), _LIST_TYPES, level, suffix, table, schema_path)
+        items = list(chain.from_iterable(values))
+        if items:
+            item_check(items, range(len(items)), _Level(level, locs, suffix, values), "", table, context)
+
+    return check_lists
+
+def _column_string(schema_path, rule, formats):
+    format_name = rule.get("format")
+    invalid_values = formats[format_name] if format_name else None
+
+    def check_strings(values, locs, level, suffix, table, context):
+        values, locs, _ = _keep_types(values, locs, str, _STRING_TYPES, level, suffix, table, schema_path)
+        if invalid_values is None or not values:
+            return
+        # Each distinct value is checked once; a corpus repeats dates, degrees and the like
+        invalid = invalid_values(set(values), context)
+        if invalid:
+            table.emit(level, [loc for value, loc in zip(values, locs) if value in invalid], suffix, "format",
+                       schema_path)
+
+    return check_strings
@@ -0,0 +1,338 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import instrumentation
+from instrumentation import stage
+from date_parser import reference_month
+from validator import validate_resume
+
+MAX_BODY_BYTES = 2 * 1024 * 1024
+IDLE_TIMEOUT = 15.0
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 408: "Request Timeout",
+    413: "Payload Too Large", 422: "Unprocessable Entity", 503: "Service Unavailable", 504: "Gateway Timeout",
+    500: "Internal Server Error",
+}
+
+# Per-process state filled in by the pool initializer
+_worker = {}
+
+
+def _init_worker(theme, metrics=False, backend="reportlab", profile="balanced"):
+    """
+    Pool initializer: imports reportlab and builds the theme's styles before the first request arrives.
+    """
+    if metrics:
+        instrumentation.enable()
+    from pdf_generator import render_resume_pdf, get_backend
+    from themes import get_theme
+    default_theme = get_theme(theme)
+    default_theme.styles  # built here rather than on the first request
+    _worker["render"] = render_resume_pdf
+    _worker["theme"] = default_theme
+    _worker["backend"] = get_backend(backend)
+    _worker["profile"] = profile
+
+
+def _warm_up():
+    """
+    :return: Names a request may pick per query parameter, as the workers know them.
+    """
+    from pdf_generator import available_backends
+    from profiles import available_profiles
+    from themes import available_themes
+    return {"theme": available_themes(), "backend": available_backends(), "profile": available_profiles()}
+
+
+def _render(data, theme, backend=None, profile=None):
+    """
+    :return: (pdf bytes, stage timings of this render or None when instrumentation is off).
+    """
+    from themes import get_theme
+    pdf = _worker["render"](data, theme=get_theme(theme) if theme else _worker["theme"],
+                            backend=backend or _worker["backend"], profile=profile or _worker["profile"])
+    return pdf, instrumentation.drain() if instrumentation.is_enabled() else None
+
+
+def _resolve_images(data, image_root):
+    """
+    Maps the photo and logo paths of a request into image_root, so a client cannot make the
+    service read files from anywhere else on its disk.
+    :param data: Validated resume dictionary from the request.
+    :param image_root: Real path of the folder request images are looked up in, or None to refuse images.
+    :return: data, or a copy of it with absolute image paths.
+    :raises HttpError: 400 if the request names an image while image_root is None, or a path outside it.
+    """
+    def resolve(path):
+        if not isinstance(path, str) or not path:
+            return path  # not an image path; the renderer ignores it
+        if image_root is None:
+            raise HttpError(400, "This server does not accept images; start it with --image-root to allow them")
+        # realpath follows symlinks, so a link inside the root cannot point outside it either
+        full_path = os.path.realpath(os.path.join(image_root, path))
+        if os.path.commonpath((image_root, full_path)) != image_root:
+            raise HttpError(400, f"Image path is outside the image root: {path}")
+        return full_path
+
+    if "photo" in data:
+        data = dict(data, photo=resolve(data["photo"]))
+    experiences = data.get("professional_experience")
+    if isinstance(experiences, list) and any(isinstance(exp, dict) and "logo" in exp for exp in experiences):
+        data = dict(data, professional_experience=[
+            dict(exp, logo=resolve(exp["logo"])) if isinstance(exp, dict) and "logo" in exp else exp
+            for exp in experiences
+        ])
+    return data
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class RenderServer:
+    """
+    Minimal HTTP/1.1 render service on asyncio, backed by a pool of warm worker processes.
+
+    POST /render   resume JSON in, PDF out (422 with the validation errors as JSON if invalid)
+    GET  /health   worker and queue status as JSON
+    GET  /metrics  per-stage timing histograms in the Prometheus text format (when metrics are on)
+
+    Image paths in a request ("photo", and "logo" per experience entry) are looked up in image_root;
+    paths outside it, or any image when no image_root is set, get 400.
+    At most max_queue renders are admitted at once; further requests get 503 immediately.
+    A render that exceeds the timeout gets 504. Its worker still finishes the job and the result is discarded;
+    the job keeps its place in the queue until then.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8000, workers=None, max_queue=64, timeout=30.0, theme="default",
+                 metrics=None, backend="reportlab", profile="balanced", image_root=None):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.theme = theme
+        self.backend = backend
+        self.profile = profile
+        self.image_root = os.path.realpath(image_root) if image_root else None
+        self.metrics = instrumentation.is_enabled() if metrics is None else metrics
+        if self.metrics:
+            instrumentation.enable()
+        self.pending = 0
+        self._choices = {}
+        self._pool = None
+        self._server = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.theme, self.metrics, self.backend, self.profile))
+        # Start every worker now so the first requests do not pay for process start-up and imports
+        choices = await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.workers)))
+        self._choices = choices[0]
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), IDLE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HttpError as exc:
+                    await self._send_json(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, content_type, payload = await self._dispatch(method, target, body)
+                except HttpError as exc:
+                    status, content_type, payload = exc.status, "application/json", _json_bytes({"error": str(exc)})
+                await self._send(writer, status, content_type, payload, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial:
+                return None
+            raise
+        except asyncio.LimitOverrunError:
+            raise HttpError(400, "Request headers too large") from None
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "Malformed request line") from None
+
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HttpError(400, "Invalid Content-Length") from None
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/health":
+            if method != "GET":
+                raise HttpError(405, "Use GET for /health")
+            return 200, "application/json", _json_bytes(self.health())
+
+        if url.path == "/metrics":
+            if method != "GET":
+                raise HttpError(405, "Use GET for /metrics")
+            if not self.metrics:
+                raise HttpError(404, "Metrics are disabled")
+            return 200, "text/plain; version=0.0.4", instrumentation.export_prometheus().encode("utf-8")
+
+        if url.path == "/render":
+            if method != "POST":
+                raise HttpError(405, "Use POST for /render")
+            query = parse_qs(url.query)
+            theme = query.get("theme", [None])[0]
+            backend = query.get("backend", [None])[0]
+            profile = query.get("profile", [None])[0]
+            return await self._render(body, theme, backend, profile)
+
+        raise HttpError(404, f"No route for {url.path}")
+
+    async def _render(self, body, theme, backend=None, profile=None):
+        try:
+            data = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise HttpError(400, f"Failed to decode JSON: {exc}") from None
+        if not isinstance(data, dict) or not data:
+            raise HttpError(400, "Expected a non-empty JSON object")
+
+        with stage("validate"):
+            errors = validate_resume(data, now=reference_month())
+        if errors:
+            payload = {
+                "errors": [error.message for error in errors],
+                "details": [error._asdict() for error in errors],
+            }
+            return 422, "application/json", _json_bytes(payload)
+
+        data = _resolve_images(data, self.image_root)
+        for kind, name in (("theme", theme), ("backend", backend), ("profile", profile)):
+            if name is not None and name not in self._choices[kind]:
+                raise HttpError(400, f"Unknown {kind} '{name}'. Available {kind}s: {', '.join(self._choices[kind])}")
+
+        if self.pending >= self.max_queue:
+            raise HttpError(503, "Render queue is full, retry later")
+
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        job = self._pool.submit(_render, data, theme, backend, profile)
+        # The slot is freed when the worker is done with the job, not when the request gives up on it
+        job.add_done_callback(lambda _: self._release(loop))
+        try:
+            with stage("render"):
+                pdf, worker_metrics = await asyncio.wait_for(asyncio.wrap_future(job), self.timeout)
+        except asyncio.TimeoutError:
+            raise HttpError(504, f"Render took longer than {self.timeout}s") from None
+        except Exception as exc:
+            raise HttpError(500, f"Render failed: {type(exc).__name__}: {exc}") from None
+        if worker_metrics:
+            instrumentation.merge(worker_metrics)
+        return 200, "application/pdf", pdf
+
+    def _release(self, loop):
+        # Runs on the pool's management thread; the counter belongs to the event loop
+        try:
+            loop.call_soon_threadsafe(self._release_slot)
+        except RuntimeError:  # the loop is closed, nobody waits for the slot any more
+            pass
+
+    def _release_slot(self):
+        self.pending -= 1
+
+    def health(self):
+        return {"status": "ok", "workers": self.workers, "pending": self.pending, "max_queue": self.max_queue}
+
+    async def _send_json(self, writer, status, payload, keep_alive=True):
+        await self._send(writer, status, "application/json", _json_bytes(payload), keep_alive)
+
+    async def _send(self, writer, status, content_type, payload, keep_alive):
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        )
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + payload)
+        await writer.drain()
+
+
+def _json_bytes(payload):
+    return json.dumps(payload).encode("utf-8")
+
+
+def run_server(host="127.0.0.1", port=8000, workers=None, max_queue=64, timeout=30.0, theme="default",
+               metrics=None, backend="reportlab", profile="balanced", image_root=None):
+    """
+    Runs the render service until interrupted.
+    :param host: Interface to bind.
+    :param port: Port to listen on.
+    :param workers: Number of warm worker processes (default: CPU count).
+    :param max_queue: Maximum number of renders admitted at once.
+    :param timeout: Per-request render timeout in seconds.
+    :param theme: Default theme; a request may override it with ?theme=<name>.
+    :param metrics: Serve per-stage timings on GET /metrics (defaults to whether instrumentation is enabled).
+    :param backend: Default renderer backend; a request may override it with ?backend=<name>.
+    :param profile: Default output profile; a request may override it with ?profile=<name>.
+    :param image_root: Folder the photo and logo paths of requests are looked up in (default: images are refused).
+    """
+    async def serve():
+        server = RenderServer(host, port, workers, max_queue, timeout, theme, metrics, backend, profile, image_root)
+        await server.start()
+        print(f"Serving resumes on http://{server.host}:{server.port} ({server.workers} workers)")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
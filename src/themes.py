@@ -0,0 +1,245 @@
+import copy
+from functools import cached_property
+
+from fonts import DEFAULT_FALLBACK_FONTS, STYLE_SUFFIXES, ensure_font, fallback_markup
+
+# reportlab.lib.pagesizes.letter; the metrics are plain values so the fpdf backend can use them without reportlab
+LETTER = (612.0, 792.0)
+
+class Theme:
+    """
+    Page metrics plus the reportlab styles derived from them.
+    Styles, table styles and section-header flowables are built on first use and then
+    shared by every document rendered with the theme, so a batch pays for them once.
+    Flowables are handed out as shallow copies of the prebuilt prototypes: platypus marks
+    flowables during layout (e.g. _postponed), so one instance must not appear twice.
+    Fonts may be core fonts or TrueType families from fonts.FONT_FAMILIES; characters they lack are
+    printed with the first of fallback_fonts that has them.
+    """
+
+    def __init__(self, name, pagesize=LETTER, margin=36, font_name="Helvetica", bold_font_name="Helvetica-Bold",
+                 heading_font_size=14, name_font_size=24, bullet_font_size=10, bullet_indent=20,
+                 rule_width=1, rule_color="black", section_space=12, entry_space=10, skills_space=6,
+                 fallback_fonts=DEFAULT_FALLBACK_FONTS, photo_size=72, logo_size=22, font_scale=1, space_scale=1):
+        # Everything that changes the rendered output, in constructor order; scaled() builds variants from it
+        self._options = dict(
+            pagesize=tuple(pagesize), margin=margin, font_name=font_name, bold_font_name=bold_font_name,
+            heading_font_size=heading_font_size, name_font_size=name_font_size, bullet_font_size=bullet_font_size,
+            bullet_indent=bullet_indent, rule_width=rule_width, rule_color=rule_color, section_space=section_space,
+            entry_space=entry_space, skills_space=skills_space, fallback_fonts=tuple(fallback_fonts),
+            photo_size=photo_size, logo_size=logo_size,
+        )
+        self.name = name
+        self.pagesize = pagesize
+        self.margin = margin
+        self.font_name = font_name
+        self.bold_font_name = bold_font_name
+        # font_scale multiplies every font size and line height, space_scale every vertical gap (see autofit)
+        self.font_scale = font_scale
+        self.space_scale = space_scale
+        self.heading_font_size = _scaled(heading_font_size, font_scale)
+        self.name_font_size = _scaled(name_font_size, font_scale)
+        self.bullet_font_size = _scaled(bullet_font_size, font_scale)
+        self.bullet_indent = bullet_indent
+        self.rule_width = rule_width
+        self.rule_color = rule_color
+        self.section_space = _scaled(section_space, space_scale)
+        self.entry_space = _scaled(entry_space, space_scale)
+        self.skills_space = _scaled(skills_space, space_scale)
+        self.fallback_fonts = tuple(fallback_fonts)
+        # Side of the square box the profile photo and company logos are printed in, in points
+        self.photo_size = photo_size
+        self.logo_size = logo_size
+        # Identifies everything about the theme that changes the rendered output
+        self.cache_key = repr((name,) + tuple(self._options.values()) + (font_scale, space_scale))
+        self._section_headers = {}
+        self._spacers = {}
+        self._variants = {}
+
+    def scaled(self, font_scale=1, space_scale=1):
+        """
+        Returns this theme with its font sizes and vertical spacing scaled.
+        Variants are kept, so their styles and section headers are built once per process.
+        :param font_scale: Factor for font sizes and line heights.
+        :param space_scale: Factor for the space between sections, entries and headings.
+        :return: Theme instance; this theme itself when both factors are 1.
+        """
+        if font_scale == 1 and space_scale == 1:
+            return self
+        variant = self._variants.get((font_scale, space_scale))
+        if variant is None:
+            variant = self._variants[(font_scale, space_scale)] = Theme(
+                f"{self.name}@{font_scale:g}x{space_scale:g}", **self._options,
+                font_scale=self.font_scale * font_scale, space_scale=self.space_scale * space_scale,
+            )
+        return variant
+
+    @property
+    def frame_width(self):
+        return self.pagesize[0] - 2 * self.margin
+
+    @cached_property
+    def entry_col_widths(self):
+        # Entry tables put the title on the left and the dates on the right
+        return [self.frame_width * 0.7, self.frame_width * 0.3]
+
+    @cached_property
+    def photo_col_widths(self):
+        # The header puts the photo on the left and keeps the name centered on the page
+        side = self.photo_size + 10
+        return [side, self.frame_width - 2 * side, side]
+
+    @cached_property
+    def logo_col_widths(self):
+        # Entry tables with a logo put it in front of the title
+        side = self.logo_size + 10
+        return [side, self.frame_width * 0.7 - side, self.frame_width * 0.3]
+
+    @cached_property
+    def styles(self):
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+        for font_name in (self.font_name, self.bold_font_name):
+            if not ensure_font(font_name):
+                raise ValueError(f"Font '{font_name}' of theme '{self.name}' is not installed")
+        sample = getSampleStyleSheet()
+        font, space = self.font_scale, self.space_scale
+        body = dict(fontSize=_scaled(10, font), leading=_scaled(12, font))
+        return {
+            "title": ParagraphStyle("ThemeTitle", parent=sample['Title'], fontName=self.bold_font_name,
+                                    fontSize=_scaled(18, font), leading=_scaled(22, font), spaceAfter=_scaled(6, space)),
+            "normal": ParagraphStyle("ThemeNormal", parent=sample['Normal'], fontName=self.font_name, **body),
+            "heading": ParagraphStyle(
+                'Heading1', fontName=self.bold_font_name, fontSize=self.heading_font_size,
+                leading=_scaled(12, font), spaceAfter=_scaled(6, space)),
+            "subheading": ParagraphStyle(
+                'Heading2', fontName=self.bold_font_name, fontSize=self.heading_font_size - 2,
+                leading=_scaled(12, font), spaceAfter=_scaled(6, space)),
+            "contact": ParagraphStyle(name="CenterAlign", fontName=self.font_name, alignment=1, **body),
+            "right": ParagraphStyle(name='RightAlign', fontName=self.font_name, alignment=2, **body),
+        }
+
+    @cached_property
+    def rule_table_style(self):
+        from reportlab.lib import colors
+        from reportlab.platypus import TableStyle
+
+        return TableStyle([
+            ('LINEABOVE', (0, 0), (-1, 0), self.rule_width, colors.toColor(self.rule_color)),  # Horizontal line
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ])
+
+    @cached_property
+    def entry_table_style(self):
+        from reportlab.platypus import TableStyle
+
+        return TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 5),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+        ])
+
+    @cached_property
+    def photo_table_style(self):
+        from reportlab.platypus import TableStyle
+
+        return TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ])
+
+    @cached_property
+    def logo_table_style(self):
+        from reportlab.platypus import TableStyle
+
+        return TableStyle([
+            ('SPAN', (0, 0), (0, -1)),  # The logo spans the title and role rows
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 5),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+        ])
+
+    def markup(self, text, bold=False, italic=False):
+        """
+        Prepares resume text for a paragraph in the theme's font, switching to a fallback font for missing glyphs.
+        :param text: Text from the resume.
+        :param bold: Whether the text sits inside <b>.
+        :param italic: Whether the text sits inside <i>.
+        :return: Paragraph markup; ASCII text is returned unchanged.
+        """
+        if text.isascii():
+            return text
+        font_name = self.bold_font_name if bold else self.font_name
+        return fallback_markup(text, font_name, self.fallback_fonts, STYLE_SUFFIXES[bold + 2 * italic])
+
+    def section_header(self, title):
+        """
+        Returns the heading paragraph and full-width rule for a section; the markup is parsed once per title.
+        :param title: Section title, e.g. "EDUCATION".
+        :return: List of flowables to append to the document.
+        """
+        header = self._section_headers.get(title)
+        if header is None:
+            from reportlab.platypus import Paragraph, Table
+
+            rule = Table([[Paragraph("")]], colWidths=[self.frame_width])  # Empty cell for a full-width line
+            rule.setStyle(self.rule_table_style)
+            header = [Paragraph(f"<b>{title}</b>", self.styles["heading"]), rule]
+            self._section_headers[title] = header
+        return [copy.copy(flowable) for flowable in header]
+
+    def spacer(self, height):
+        """
+        Returns a vertical spacer of the given height.
+        :param height: Height in points.
+        """
+        spacer = self._spacers.get(height)
+        if spacer is None:
+            from reportlab.platypus import Spacer
+
+            spacer = self._spacers[height] = Spacer(1, height)
+        return copy.copy(spacer)
+
+
+def _scaled(value, factor):
+    # Unscaled values keep their type, so the default output is unchanged
+    return value if factor == 1 else value * factor
+
+
+_THEMES = {}
+
+def register_theme(theme):
+    """
+    Makes a theme selectable by name.
+    :param theme: Theme instance.
+    :return: The registered theme.
+    """
+    _THEMES[theme.name] = theme
+    return theme
+
+def get_theme(theme="default"):
+    """
+    Looks up a registered theme.
+    :param theme: Theme name, or a Theme instance which is returned unchanged.
+    :return: Theme instance.
+    """
+    if isinstance(theme, Theme):
+        return theme
+    try:
+        return _THEMES[theme]
+    except KeyError:
+        raise ValueError(f"Unknown theme '{theme}'. Available themes: {', '.join(sorted(_THEMES))}") from None
+
+def available_themes():
+    return sorted(_THEMES)
+
+
+register_theme(Theme("default"))
+register_theme(Theme("compact", margin=28, heading_font_size=12, name_font_size=20,
+                     section_space=8, entry_space=6, skills_space=4))
+register_theme(Theme("serif", font_name="Times-Roman", bold_font_name="Times-Bold",
+                     fallback_fonts=("DejaVuSerif",) + DEFAULT_FALLBACK_FONTS))
@@ -1,112 +1,189 @@
+import os
 import re
-from datetime import datetime
+from array import array
+from collections import Counter
+from itertools import islice
+
+from date_parser import parse_date_range, parse_date_ranges, reference_month
+from schema import BatchValidation, compile_schema, invalid_matches, load_template
+
+EMAIL_REGEX = re.compile(r"[^@]+@[^@]+\.[^@]+")
+PHONE_REGEX = re.compile(r"^\+\d{1,3}\s\d{10}$")  # Example: +91 9876543210
+LINKEDIN_REGEX = re.compile(r"^https://(www\.)?linkedin\.com/.*")
+
+# Records validated together by validate_batch. Columns of a few thousand values stay in the CPU
+# caches; much larger chunks were slower, not faster
+BATCH_CHUNK_SIZE = 5000
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "template.json")
+
+# Rules layered on top of the shape of data/template.json, keyed by schema path
+RESUME_RULES = {
+    "name": {"required": True},
+    "contact": {"required": True},
+    "education": {"required": True},
+    "professional_experience": {"required": True},
+    "projects": {"required": True},
+    "skills": {
+        "required": True,
+        "open": True,
+        "messages": {"type": "Skills must be a dictionary with categorized skill lists."},
+    },
+    "skills.*": {
+        "required": True,
+        "messages": {
+            "required": "Skills category '{key}' must be a non-empty list.",
+            "type": "Skills category '{key}' must be a non-empty list.",
+        },
+    },
+    "contact.email": {
+        # Like the original checks: an empty value is a bad format, not a missing one
+        "required": "key", "format": "email",
+        "messages": {"required": "Contact email is required.", "format": "Invalid email format."},
+    },
+    "contact.phone": {
+        "required": "key", "format": "phone",
+        "messages": {
+            "required": "Contact phone number is required.",
+            "format": "Invalid phone number format. Use '+<Country Code> <10 digits>'.",
+        },
+    },
+    "contact.linkedin": {
+        "required": "key", "format": "linkedin",
+        "messages": {"required": "Contact LinkedIn profile is required.", "format": "Invalid LinkedIn URL."},
+    },
+    "education[].institution": {
+        "required": True, "messages": {"required": "Each education entry must have an institution name."},
+    },
+    "education[].degree": {
+        "required": True, "messages": {"required": "Each education entry must have a degree."},
+    },
+    "education[].dates": {
+        "required": True, "format": "date_range",
+        "messages": {
+            "required": "Each education entry must have dates.",
+            "format": "Invalid dates in education: {value}",
+        },
+    },
+    "professional_experience[].role": {
+        "required": True, "messages": {"required": "Each professional experience entry must have a role."},
+    },
+    "professional_experience[].organization": {
+        "required": True, "messages": {"required": "Each professional experience entry must have an organization."},
+    },
+    "professional_experience[].dates": {
+        "required": True, "format": "date_range",
+        "messages": {
+            "required": "Each professional experience entry must have dates.",
+            "format": "Invalid dates in professional experience: {value}",
+        },
+    },
+    "projects[].name": {
+        "required": True, "messages": {"required": "Each project entry must have a name."},
+    },
+    "projects[].description": {
+        "required": True, "messages": {"required": "Each project entry must have a description."},
+    },
+    "projects[].tech_stack": {
+        "required": True,
+        "messages": {
+            "required": "Each project entry must have a tech stack as a list.",
+            "type": "Each project entry must have a tech stack as a list.",
+        },
+    },
+}
+
+_plan = None
+
+def get_validation_plan():
+    """
+    Returns the resume validation plan, compiled from data/template.json on first use.
+    """
+    global _plan
+    if _plan is None:
+        formats = {
+            "email": lambda value, now: EMAIL_REGEX.match(value) is not None,
+            "phone": lambda value, now: PHONE_REGEX.match(value) is not None,
+            "linkedin": lambda value, now: LINKEDIN_REGEX.match(value) is not None,
+            "date_range": validate_date_range,
+        }
+        # validate_batch checks a whole column at a time
+        bulk_formats = {
+            "email": invalid_matches(EMAIL_REGEX),
+            "phone": invalid_matches(PHONE_REGEX),
+            "linkedin": invalid_matches(LINKEDIN_REGEX),
+            "date_range": invalid_date_ranges,
+        }
+        _plan = compile_schema(load_template(TEMPLATE_PATH), RESUME_RULES, formats, bulk_formats)
+    return _plan
 
-def validate_data(data):
+def validate_resume(data, fail_fast=False, now=None):
+    """
+    Validates the input data for the resume and returns structured errors.
+    :param data: Dictionary containing resume information.
+    :param fail_fast: Stop at the first error instead of collecting all of them.
+    :param now: Reference month for "Present" dates; pass one value for a whole batch.
+    :return: List of ValidationError tuples with path, code and message.
+    """
+    return get_validation_plan().validate(data, fail_fast, reference_month(now))
+
+def validate_data(data, now=None):
     """
     Validates the input data for the resume.
     :param data: Dictionary containing resume information.
+    :param now: Reference month for "Present" dates; pass one value for a whole batch.
     :return: Tuple (is_valid, errors). is_valid is a boolean, and errors is a list of issues.
     """
-    errors = []
-
-    # Required top-level fields
-    required_fields = ["name", "contact", "education", "professional_experience", "projects", "skills"]
-    for field in required_fields:
-        if field not in data or not data[field]:
-            errors.append(f"'{field}' is required and cannot be empty.")
-
-    # Validate contact details
-    if "contact" in data:
-        contact = data["contact"]
-        if "email" in contact:
-            email_regex = r"[^@]+@[^@]+\.[^@]+"
-            if not re.match(email_regex, contact["email"]):
-                errors.append("Invalid email format.")
-        else:
-            errors.append("Contact email is required.")
-
-        if "phone" in contact:
-            phone_regex = r"^\+\d{1,3}\s\d{10}$"  # Example: +91 9876543210
-            if not re.match(phone_regex, contact["phone"]):
-                errors.append("Invalid phone number format. Use '+<Country Code> <10 digits>'.")
-        else:
-            errors.append("Contact phone number is required.")
-
-        if "linkedin" in contact:
-            linkedin_regex = r"^https://(www\.)?linkedin\.com/.*"
-            if not re.match(linkedin_regex, contact["linkedin"]):
-                errors.append("Invalid LinkedIn URL.")
-        else:
-            errors.append("Contact LinkedIn profile is required.")
-
-    # Validate education section
-    if "education" in data:
-        for edu in data["education"]:
-            if not edu.get("institution"):
-                errors.append("Each education entry must have an institution name.")
-            if not edu.get("degree"):
-                errors.append("Each education entry must have a degree.")
-            if not edu.get("dates"):
-                errors.append("Each education entry must have dates.")
-            else:
-                if not validate_date_range(edu["dates"]):
-                    errors.append(f"Invalid dates in education: {edu['dates']}")
-
-    # Validate professional experience section
-    if "professional_experience" in data:
-        for exp in data["professional_experience"]:
-            if not exp.get("role"):
-                errors.append("Each professional experience entry must have a role.")
-            if not exp.get("organization"):
-                errors.append("Each professional experience entry must have an organization.")
-            if not exp.get("dates"):
-                errors.append("Each professional experience entry must have dates.")
-            else:
-                if not validate_date_range(exp["dates"]):
-                    errors.append(f"Invalid dates in professional experience: {exp['dates']}")
-
-
-    # Validate projects section
-    if "projects" in data:
-        for project in data["projects"]:
-            if not project.get("name"):
-                errors.append("Each project entry must have a name.")
-            if not project.get("description"):
-                errors.append("Each project entry must have a description.")
-            if not project.get("tech_stack") or not isinstance(project["tech_stack"], list):
-                errors.append("Each project entry must have a tech stack as a list.")
-
-    # Validate skills section
-    if "skills" in data:
-        if not isinstance(data["skills"], dict):
-            errors.append("Skills must be a dictionary with categorized skill lists.")
-        else:
-            for category, skill_list in data["skills"].items():
-                if not isinstance(skill_list, list) or not skill_list:
-                    errors.append(f"Skills category '{category}' must be a non-empty list.")
-
-    return len(errors) == 0, errors
-
-def validate_date_range(date_range):
+    errors = get_validation_plan().validate(data, context=reference_month(now))
+    return len(errors) == 0, [error.message for error in errors]
+
+def validate_batch(records, now=None, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Validates a whole corpus column by column instead of one resume at a time.
+    Finds the same errors as validate_resume, as a compact table instead of messages.
+    :param records: Iterable of resume dictionaries; consumed chunk_size records at a time.
+    :param now: Reference month for "Present" dates, shared by the whole corpus.
+    :param chunk_size: Records validated together.
+    :return: BatchValidation with the errors as parallel columns (records, codes, paths), where
+             records holds each error's position in the input, and the error counts per (schema path, code) rule.
+    """
+    plan = get_validation_plan()
+    now = reference_month(now)
+    records = iter(records)
+    count = 0
+    indices, codes, paths, counts = array("q"), [], [], Counter()
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        result = plan.validate_columns(chunk, now)
+        indices.extend(count + index for index in result.records)
+        codes.extend(result.codes)
+        paths.extend(result.paths)
+        counts.update(result.counts)
+        count += len(chunk)
+    return BatchValidation(count, indices, codes, paths, counts)
+
+def validate_date_range(date_range, now=None):
     """
     Validates date ranges in the format '<Start Month, Year> - <End Month, Year>' or '<Start Month, Year> - Present'.
+    Month names may be abbreviated ('Aug 2023') or numeric ('08/2023').
     :param date_range: String containing the date range.
+    :param now: Reference month for "Present", as accepted by date_parser.reference_month.
     :return: Boolean, True if valid, False otherwise.
     """
-    try:
-        start_date, end_date = date_range.split(" - ")
-        date_format = "%B %Y"  # Example: "August 2023"
-
-        start = datetime.strptime(start_date, date_format)
+    parsed = parse_date_range(date_range, now)
+    return parsed is not None and parsed.start <= parsed.end
 
-        if end_date.lower() == "present":
-            end = datetime.now()
-        else:
-            end = datetime.strptime(end_date, date_format)
 
-        return start <= end
-    except (ValueError, IndexError):
-        return False
+def invalid_date_ranges(date_ranges, now=None):
+    """
+    Bulk counterpart of validate_date_range.
+    :param date_ranges: Iterable of date range strings.
+    :return: Set of the ranges that are invalid.
+    """
+    return {date_range for date_range, parsed in parse_date_ranges(date_ranges, now).items()
+            if parsed is None or parsed.start > parsed.end}
 
 
 if __name__ == "__main__":
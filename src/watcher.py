@@ -0,0 +1,143 @@
+"""
+Watch mode: keeps the process warm and re-renders resume files as they are saved.
+
+The watched files are polled (os.stat only, no extra dependency). A change is acted on once the
+file has been quiet for the debounce period, so an editor that writes a file in several steps
+triggers one render. Only the changed files are loaded, validated and rendered again.
+"""
+import os
+import time
+
+from instrumentation import stage
+from date_parser import reference_month
+from resume_ir import normalize
+from validator import validate_data
+
+# Seconds between polls, and how long a file must stay unchanged before it is rendered
+POLL_INTERVAL = 0.02
+DEBOUNCE = 0.05
+
+
+def iter_changes(source, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+    """
+    Yields the files of a watch source that changed, starting with every existing file.
+    :param source: A resume file, a directory of JSON/JSONL files or a glob pattern.
+    :param interval: Seconds between polls.
+    :param debounce: Seconds a changed file must stay unchanged before it is reported.
+    :return: Iterator of sorted lists of paths; a deleted file is not reported.
+    """
+    from batch import expand_source
+
+    seen = _snapshot(expand_source(source))
+    yield sorted(seen)
+
+    pending = {}  # path -> time its latest change was seen
+    while True:
+        time.sleep(interval)
+        now = time.monotonic()
+        current = _snapshot(expand_source(source))
+        for path, signature in current.items():
+            if seen.get(path) != signature:
+                pending[path] = now
+        seen = current
+
+        ready = sorted(path for path, changed in pending.items() if now - changed >= debounce)
+        for path in ready:
+            del pending[path]
+        ready = [path for path in ready if path in seen]
+        if ready:
+            yield ready
+
+
+def _snapshot(paths):
+    signatures = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signatures[path] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+def render_file(path, output_folder="output", formats=("pdf",), theme="default", cache=None, backend="reportlab",
+                fit_pages=None, profile="balanced", now=None):
+    """
+    Loads, validates and renders every resume in one file, printing a line with the timings per resume.
+    :param path: JSON file with one resume, or a JSONL/JSON-array file with several.
+    :param now: Reference month for "Present" dates, shared by every resume in the file (defaults to this month).
+    :return: Number of resumes rendered.
+    """
+    from batch import iter_resumes
+    from exporters import export_resume
+
+    now = reference_month(now)
+    rendered = 0
+    started = time.perf_counter()
+    with stage("load"):
+        resumes = list(iter_resumes(path))
+    load_ms = (time.perf_counter() - started) * 1000
+
+    for user_data in resumes:
+        if not user_data:
+            print(f"{path}: Error: No user data found.")
+            continue
+        started = time.perf_counter()
+        with stage("validate"):
+            is_valid, errors = validate_data(user_data, now=now)
+        validate_ms = (time.perf_counter() - started) * 1000
+        if not is_valid:
+            print(f"{path}: {len(errors)} validation error(s)")
+            for error in errors:
+                print(f"- {error}")
+            continue
+
+        started = time.perf_counter()
+        with stage("render"):
+            export_resume(normalize(user_data), output_folder, formats, theme=theme, cache=cache, backend=backend,
+                          fit_pages=fit_pages, profile=profile)
+        render_ms = (time.perf_counter() - started) * 1000
+        rendered += 1
+        print(f"{path}: load {load_ms:.1f} ms, validate {validate_ms:.1f} ms, render {render_ms:.1f} ms "
+              f"(total {load_ms + validate_ms + render_ms:.1f} ms)")
+    return rendered
+
+
+def run_watch(source, output_folder="output", formats=("pdf",), theme="default", use_cache=True, backend="reportlab",
+              fit_pages=None, profile="balanced", interval=POLL_INTERVAL, debounce=DEBOUNCE, iterations=None):
+    """
+    Renders every file in source, then re-renders each file whenever it is saved, until interrupted.
+    :param source: A resume file, a directory of JSON/JSONL files or a glob pattern.
+    :param iterations: Stop after this many rounds of changes (the first full render counts as one); None runs forever.
+    :return: Number of rounds run.
+    """
+    cache = None
+    if use_cache and "pdf" in formats:
+        from render_cache import RenderCache
+        cache = RenderCache(output_folder)
+
+    print(f"Watching {source} (Ctrl+C to stop)")
+    rounds = 0
+    try:
+        for changed in iter_changes(source, interval, debounce):
+            started = time.perf_counter()
+            saved_ns = max(_snapshot(changed).values(), default=(0, 0))[0]
+            # One "now" per round so every file of the round is checked against the same month
+            now = reference_month()
+            for path in changed:
+                try:
+                    render_file(path, output_folder, formats, theme, cache, backend, fit_pages, profile, now)
+                except Exception as exc:  # keep watching; the next save may fix it
+                    print(f"{path}: {type(exc).__name__}: {exc}")
+            if cache is not None:
+                cache.save()
+            rounds += 1
+            line = f"Round {rounds}: {len(changed)} file(s) in {(time.perf_counter() - started) * 1000:.1f} ms"
+            if rounds > 1 and saved_ns:
+                line += f", {(time.time_ns() - saved_ns) / 1e6:.0f} ms after the last save"
+            print(line)
+            if iterations is not None and rounds >= iterations:
+                break
+    except KeyboardInterrupt:
+        pass
+    return rounds
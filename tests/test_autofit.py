@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+from unittest.mock import patch
+
+# Add the 'src' and 'benchmarks' directories to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../benchmarks')))
+
+from synthetic import generate_resume
+from autofit import fit_document, estimate_pages
+from themes import get_theme
+from pdf_generator import render_document, render_resume_pdf, generate_resume_pdf
+
+# Two pages at the default size
+LONG_RESUME = generate_resume("small", seed=1, experience=5, bullets=4)
+
+class TestAutofit(unittest.TestCase):
+
+    def test_scaled_theme_is_shared_and_shrinks(self):
+        theme = get_theme("default")
+        self.assertIs(theme.scaled(1, 1), theme)
+        small = theme.scaled(0.9, 0.5)
+        self.assertIs(theme.scaled(0.9, 0.5), small)
+        self.assertEqual(small.styles["normal"].fontSize, 9)
+        self.assertEqual(small.section_space, 6)
+        self.assertNotEqual(small.cache_key, theme.cache_key)
+
+    def test_estimate_matches_the_build(self):
+        theme = get_theme("default")
+        for data in (generate_resume("small"), LONG_RESUME):
+            self.assertEqual(estimate_pages(data, theme), render_document(data, io.BytesIO(), theme))
+
+    def test_fits_long_resume_on_one_page(self):
+        self.assertEqual(render_document(LONG_RESUME, io.BytesIO()), 2)
+        stream = io.BytesIO()
+        fit = fit_document(LONG_RESUME, stream, pages=1)
+        self.assertTrue(fit.fits)
+        self.assertEqual(fit.pages, 1)
+        self.assertLess((fit.font_scale, fit.space_scale), (1, 1))
+        self.assertLessEqual(fit.builds, 2)
+        self.assertEqual(stream.getvalue().count(b"/Type /Page\n"), 1)
+
+    def test_short_resume_keeps_its_size(self):
+        fit = fit_document(generate_resume("small"), io.BytesIO(), pages=1)
+        self.assertEqual((fit.font_scale, fit.space_scale, fit.builds), (1, 1, 1))
+
+    def test_unfittable_resume_uses_the_smallest_size(self):
+        fit = fit_document(generate_resume("large"), io.BytesIO(), pages=1)
+        self.assertFalse(fit.fits)
+        self.assertGreater(fit.pages, 1)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_generate_with_fit_pages(self, mock_stdout):
+        with tempfile.TemporaryDirectory() as folder:
+            path = generate_resume_pdf(LONG_RESUME, folder, fit_pages=1)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read().count(b"/Type /Page\n"), 1)
+        self.assertIn("Fitted to 1 page(s)", mock_stdout.getvalue())
+        with self.assertRaises(ValueError):
+            render_resume_pdf(LONG_RESUME, backend="fpdf", fit_pages=1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import instrumentation
+from batch import collect_inputs, run_batch, _map_bounded
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def _write_json(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        return path
+
+    def test_collect_inputs_from_jsonl(self):
+        """Each non-blank JSONL line becomes one work item tagged with its line number."""
+        path = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(path, 'w') as f:
+            f.write(json.dumps(self.sample) + "\n\n" + json.dumps(self.sample) + "\n")
+
+        items = collect_inputs(path)
+        self.assertEqual([item[0] for item in items], [f"{path}:1", f"{path}:3"])
+        self.assertEqual(items[0][2]["name"], "John Doe")
+
+    def test_records_are_read_only_as_the_pool_takes_them(self):
+        """At most limit items are read ahead of the oldest unfinished one; results keep item order."""
+        read = []
+        def items():
+            for index in range(20):
+                read.append(index)
+                yield index
+        def work(index):
+            # Nothing may have been read more than 3 items past this one
+            return index, len(read) - index
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = _map_bounded(pool, work, items(), 3)
+        self.assertEqual([index for index, _ in results], list(range(20)))
+        self.assertLessEqual(max(ahead for _, ahead in results), 3)
+
+    def test_items_are_pulled_until_the_first_end_only(self):
+        """None is an item like any other, and the exhausted iterator is not timed again."""
+        instrumentation.reset()
+        instrumentation.enable()
+        self.addCleanup(instrumentation.reset)
+        self.addCleanup(instrumentation.disable)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = _map_bounded(pool, lambda item: item, iter([None, 1]), 1)
+        self.assertEqual(results, [None, 1])
+        # One observation per item plus the pull that found the end
+        self.assertEqual(instrumentation.snapshot()["collect"]["count"], 3)
+
+    def test_run_batch_reports_per_item_status(self):
+        """A directory batch renders valid resumes and reports invalid ones without stopping."""
+        inputs = os.path.join(self.tmp.name, "inputs")
+        os.makedirs(inputs)
+        for index in range(2):
+            data = dict(self.sample, name=f"Batch Person {index}")
+            with open(os.path.join(inputs, f"resume_{index}.json"), 'w') as f:
+                json.dump(data, f)
+        with open(os.path.join(inputs, "broken.json"), 'w') as f:
+            json.dump(dict(self.sample, contact={"email": "nope"}), f)
+
+        output = os.path.join(self.tmp.name, "output")
+        summary = run_batch(inputs, output_folder=output, workers=2)
+
+        self.assertEqual(summary["total"], 3)
+        self.assertEqual(summary["succeeded"], 2)
+        self.assertEqual(summary["failed"], 1)
+        statuses = {os.path.basename(item["id"]): item["status"] for item in summary["items"]}
+        self.assertEqual(statuses["broken.json"], "invalid")
+        self.assertTrue(os.path.exists(os.path.join(output, "Batch_Person_0_resume.pdf")))
+        self.assertTrue(os.path.exists(os.path.join(output, "Batch_Person_1_resume.pdf")))
+
+        # A second run over unchanged inputs is served from the render cache
+        rerun = run_batch(inputs, output_folder=output, workers=2)
+        self.assertEqual(rerun["succeeded"], 2)
+        self.assertEqual(rerun["cached"], 2)
+
+    def test_unknown_theme_fails_before_the_pool_starts(self):
+        with self.assertRaisesRegex(ValueError, "Unknown theme 'nope'"):
+            run_batch(self.tmp.name, output_folder=os.path.join(self.tmp.name, "output"), theme="nope")
+
+    def test_resumes_with_the_same_name_get_their_own_files(self):
+        """Same-name resumes are saved side by side instead of overwriting each other, also across reruns."""
+        path = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(path, 'w') as f:
+            for city in ("Oslo", "Lima", "Pune"):
+                f.write(json.dumps(dict(self.sample, contact=dict(self.sample["contact"], location=city))) + "\n")
+        output = os.path.join(self.tmp.name, "output")
+
+        summary = run_batch(path, output_folder=output, workers=2)
+        outputs = [item["output"] for item in summary["items"]]
+        self.assertEqual(summary["succeeded"], 3)
+        self.assertEqual(sorted(os.path.basename(output) for output in outputs),
+                         ["John_Doe_resume.pdf", "John_Doe_resume_2.pdf", "John_Doe_resume_3.pdf"])
+
+        rerun = run_batch(path, output_folder=output, workers=2)
+        self.assertEqual(rerun["cached"], 3)
+        self.assertEqual([item["output"] for item in rerun["items"]], outputs)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+
+# Add the 'src' and 'benchmarks' directories to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../benchmarks')))
+
+from synthetic import SCALES, generate_resume
+from run_benchmarks import run_scale, run_memory, run_corpus_validation, STAGES
+from validator import validate_data
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_synthetic_resumes_are_valid(self):
+        """Every preset produces a resume that passes validation."""
+        for scale in SCALES:
+            self.assertEqual(validate_data(generate_resume(scale, seed=7)), (True, []), scale)
+
+    def test_synthetic_sizes_and_determinism(self):
+        data = generate_resume("small", seed=1, experience=7, bullets=3)
+        self.assertEqual(len(data["professional_experience"]), 7)
+        self.assertEqual(len(data["professional_experience"][0]["responsibilities"]), 3)
+        self.assertEqual(data, generate_resume("small", seed=1, experience=7, bullets=3))
+
+    def test_run_scale_reports_every_stage(self):
+        result = run_scale("tiny", repeat=1, corpus_count=50)
+        self.assertEqual(list(result["stages"]), STAGES)
+        self.assertGreater(result["pdf_bytes"], 0)
+        for numbers in result["stages"].values():
+            self.assertGreaterEqual(numbers["median_ms"], 0)
+            self.assertGreater(numbers["peak_kib"], 0)
+
+    def test_run_memory_compares_dict_and_model(self):
+        result = run_memory("small", count=50)
+        self.assertEqual(result["count"], 50)
+        self.assertLess(result["model_bytes"], result["dict_bytes"])
+        self.assertAlmostEqual(result["ratio"], result["model_bytes"] / result["dict_bytes"])
+
+    def test_run_corpus_validation_compares_both_paths(self):
+        result = run_corpus_validation("tiny", count=50, repeat=1)
+        self.assertEqual(result["count"], 50)
+        self.assertGreater(result["per_record_rate"], 0)
+        self.assertAlmostEqual(result["speedup"], result["batch_rate"] / result["per_record_rate"])
+
+if __name__ == "__main__":
+    unittest.main()
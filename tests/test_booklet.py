@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import io
+import re
+import json
+import tempfile
+from unittest.mock import patch
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import booklet
+from booklet import render_booklet, write_booklet
+from validator import validate_data
+from main import main
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestBooklet(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_each_resume_starts_a_page_with_a_bookmark(self):
+        resumes = [dict(self.sample, name=f"Person {index}") for index in range(3)]
+        stream = io.BytesIO()
+        entries, pages = render_booklet(resumes, stream)
+        pdf = stream.getvalue()
+
+        self.assertEqual([title for title, _ in entries], ["Person 0", "Person 1", "Person 2"])
+        first_pages = [page for _, page in entries]
+        self.assertEqual(first_pages[0], 1)
+        self.assertEqual(len(set(first_pages)), 3)
+        self.assertEqual(pdf.count(b"/Type /Page\n"), pages)
+        self.assertIn(b"/Outlines", pdf)
+        for index in range(3):
+            self.assertIn(f"Person {index}".encode(), pdf)
+
+    def test_fonts_are_written_once(self):
+        stream = io.BytesIO()
+        render_booklet([self.sample] * 4, stream)
+        self.assertEqual(len(re.findall(rb"/BaseFont /Helvetica ", stream.getvalue())), 1)
+
+    def test_resumes_are_read_as_the_layout_reaches_them(self):
+        pulled = []
+        def resumes():
+            for index in range(6):
+                pulled.append(index)
+                yield dict(self.sample, name=f"Person {index}")
+        drawn = []
+        draw = booklet.Bookmark.draw
+        def record(bookmark):
+            drawn.append(len(pulled))
+            draw(bookmark)
+
+        with patch.object(booklet.Bookmark, "draw", record):
+            entries, _ = render_booklet(resumes(), io.BytesIO())
+        self.assertEqual(len(entries), 6)
+        # When a resume's first page is drawn, at most the next one has been read
+        for index, pulled_then in enumerate(drawn):
+            self.assertLessEqual(pulled_then, index + 2)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_write_booklet_validates_against_one_month(self, mock_stdout):
+        source = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(source, 'w') as f:
+            for index in range(3):
+                f.write(json.dumps(dict(self.sample, name=f"Person {index}")) + "\n")
+
+        with patch("booklet.validate_data", wraps=validate_data) as validate:
+            write_booklet(source, os.path.join(self.tmp.name, "booklet.pdf"))
+        months = {call.kwargs["now"] for call in validate.call_args_list}
+        self.assertEqual(len(validate.call_args_list), 3)
+        self.assertEqual(len(months), 1)
+        self.assertIsNotNone(months.pop())
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_write_booklet_skips_invalid_resumes(self, mock_stdout):
+        source = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(source, 'w') as f:
+            f.write(json.dumps(self.sample) + "\n")
+            f.write(json.dumps(dict(self.sample, contact={"email": "nope"})) + "\n")
+        output = os.path.join(self.tmp.name, "out", "booklet.pdf")
+
+        summary = write_booklet(source, output)
+        self.assertEqual(summary["output"], output)
+        self.assertEqual(len(summary["included"]), 1)
+        self.assertEqual(summary["skipped"], 1)
+        self.assertTrue(os.path.exists(output))
+        self.assertIn("[INVALID] Resume 2", mock_stdout.getvalue())
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_main_booklet(self, mock_stdout):
+        source = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(source, 'w') as f:
+            f.write(json.dumps(self.sample) + "\n" + json.dumps(dict(self.sample, name="Jane Doe")) + "\n")
+        output = os.path.join(self.tmp.name, "booklet.pdf")
+
+        self.assertEqual(main(["--batch", source, "--booklet", output]), 0)
+        self.assertIn("2 resumes", mock_stdout.getvalue())
+        self.assertEqual(main(["--batch", source, "--booklet", output, "--backend", "fpdf"]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from io import StringIO
 import sys
 import os
@@ -7,7 +7,7 @@ import os
 # Add the 'src' directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from builder import display_resume  
+from builder import display_resume, display_resumes, render_text
 from file_handler import load_user_data
 
 class TestDisplayResume(unittest.TestCase):
@@ -102,5 +102,36 @@ class TestDisplayResume(unittest.TestCase):
         # Assert that the error message is printed when no data is found
         self.assertIn("Error: No user data found", output)
 
+    def test_display_resume_writes_once(self):
+        """The whole resume goes out in one write, and missing fields no longer crash it."""
+        stream = MagicMock()
+        display_resume({
+            "name": "Jane Roe",
+            "contact": {"location": "Lisbon, Portugal"},
+            "education": [{"institution": "Somewhere University"}],
+            "professional_experience": [{"role": "Engineer"}],
+        }, stream)
+
+        stream.write.assert_called_once()
+        output = stream.write.call_args[0][0]
+        self.assertIn("Location: Lisbon, Portugal", output)
+        self.assertIn("  -  from Somewhere University ()", output)
+        self.assertIn("  Relevant Courses: \n", output)
+        self.assertIn("  - Engineer at  ()", output)
+
+    def test_display_resumes_bounded_buffering(self):
+        """Streaming mode batches several resumes per write but never holds much more than buffer_size."""
+        resumes = ({"name": f"Person {index}"} for index in range(10))
+        single = len(render_text({"name": "Person 0"}))
+        stream = MagicMock()
+
+        count = display_resumes(resumes, stream, buffer_size=single * 3)
+
+        self.assertEqual(count, 10)
+        writes = [call[0][0] for call in stream.write.call_args_list]
+        self.assertEqual(len(writes), 4)
+        self.assertTrue(all(len(chunk) < single * 4 for chunk in writes))
+        self.assertEqual("".join(writes).count("Name: Person"), 10)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+from datetime import datetime
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from date_parser import parse_date_range, parse_date_ranges, parse_month_year, reference_month, format_month
+from validator import validate_date_range
+
+class TestDateParser(unittest.TestCase):
+
+    def test_month_year_variants(self):
+        """Full, abbreviated and numeric month forms all parse to (year, month)."""
+        for text in ["August 2023", "Aug 2023", "aug. 2023", "August, 2023", "08/2023", "8/2023"]:
+            self.assertEqual(parse_month_year(text), (2023, 8), text)
+        self.assertEqual(parse_month_year("Sept 2021"), (2021, 9))
+        self.assertIsNone(parse_month_year("13/2023"))
+        self.assertIsNone(parse_month_year("Augustus 2023"))
+
+    def test_parse_date_range_returns_values(self):
+        """Ranges return their parsed start and end; "Present" resolves against the given reference."""
+        self.assertEqual(parse_date_range("June 2023 - August 2023"), ((2023, 6), (2023, 8), False))
+        self.assertEqual(parse_date_range("Sep 2021 - Present", now=(2024, 5)), ((2021, 9), (2024, 5), True))
+        self.assertEqual(parse_date_range("06/2020 – 07/2021").end, (2021, 7))
+        self.assertIsNone(parse_date_range("2015 - 2019"))
+        self.assertIsNone(parse_date_range("August 2023"))
+
+    def test_validate_date_range_ordering(self):
+        """A range is valid only when the start is not after the end."""
+        self.assertTrue(validate_date_range("September 2020 - May 2024"))
+        self.assertFalse(validate_date_range("June 2024 - May 2020"))
+        self.assertTrue(validate_date_range("May 2024 - Present", now=datetime(2024, 5, 31)))
+        self.assertFalse(validate_date_range("June 2024 - Present", now=(2024, 5)))
+
+    def test_parse_date_ranges_matches_parse_date_range(self):
+        """Bulk parsing gives the same result as parsing each range on its own."""
+        ranges = ["June 2023 - August 2023", "Sep 2021 - Present", "06/2020 – 07/2021", "2015 - 2019",
+                  "August 2023", "Aug 2023 to Sept 2024", "Foo 2020 - Present", "Jan 2020 - 13/2020"]
+        parsed = parse_date_ranges(ranges, now=(2024, 5))
+        self.assertEqual(list(parsed), ranges)
+        for text in ranges:
+            self.assertEqual(parsed[text], parse_date_range(text, now=(2024, 5)), text)
+
+    def test_helpers(self):
+        self.assertEqual(reference_month(datetime(2022, 3, 4)), (2022, 3))
+        self.assertEqual(format_month((2023, 8)), "August 2023")
+        self.assertEqual(format_month((2023, 8), abbreviate=True), "Aug 2023")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import sys
+import os
+import json
+import tempfile
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import resume_ir
+from exporters import to_html, to_markdown, render_formats, export_resume
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestExporters(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_html_escapes_and_carries_parsed_dates(self):
+        data = dict(self.sample, name="Jane <Roe> & Co")
+        page = to_html(data)
+        self.assertIn("<h1>Jane &lt;Roe&gt; &amp; Co</h1>", page)
+        self.assertIn('data-start="2023-06" data-end="2023-08">June 2023 - August 2023</span>', page)
+        self.assertIn('data-start="2021-09" data-end="present"', page)
+
+    def test_markdown_escapes_special_characters(self):
+        data = dict(self.sample, name="Jane_Roe *")
+        text = to_markdown(data)
+        self.assertTrue(text.startswith("# Jane\\_Roe \\*\n"))
+        self.assertIn("## Professional Experience", text)
+        self.assertIn("- Tech Stack: React.js, Node.js, MongoDB", text)
+
+    def test_render_formats_normalizes_once(self):
+        with patch("resume_ir.normalize", wraps=resume_ir.normalize) as mock_normalize:
+            outputs = render_formats(self.sample, ["pdf", "html", "markdown", "text"])
+        self.assertEqual(mock_normalize.call_count, 1)
+        self.assertTrue(outputs["pdf"].startswith(b"%PDF"))
+        self.assertIn("Name: John Doe", outputs["text"])
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_export_resume_writes_each_format(self, mock_stdout):
+        with tempfile.TemporaryDirectory() as output:
+            paths = export_resume(self.sample, output, ["html", "markdown", "text"])
+            self.assertEqual(sorted(os.listdir(output)),
+                             ["John_Doe_resume.html", "John_Doe_resume.md", "John_Doe_resume.txt"])
+            with open(paths["markdown"], 'r', encoding="utf-8") as f:
+                self.assertIn("# John Doe", f.read())
+
+if __name__ == "__main__":
+    unittest.main()
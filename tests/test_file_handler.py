@@ -2,11 +2,17 @@ import unittest
 import sys
 import os
 import json
+import tempfile
+import tracemalloc
+from unittest.mock import patch
 
 # Add the 'src' directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from file_handler import load_user_data
+import file_handler
+import instrumentation
+from file_handler import load_user_data, iter_user_data, iter_user_records, detect_encoding, clear_encoding_cache
+from batch import iter_resumes
 
 class TestFileHandler(unittest.TestCase):
 
@@ -38,5 +44,115 @@ class TestFileHandler(unittest.TestCase):
         # Clean up the invalid file
         os.remove(invalid_json_path)
 
+class TestStreamingLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_jsonl_reports_bad_records_and_continues(self):
+        """A malformed JSONL line is reported with its offset and line number; the rest still load."""
+        path = self._write("resumes.jsonl", '{"name": "A"}\n\n{"name": oops}\n{"name": "C"}\n')
+        errors = []
+        names = [record["name"] for record in iter_user_data(path, on_error=errors.append)]
+
+        self.assertEqual(names, ["A", "C"])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].line, 3)
+        self.assertEqual(errors[0].offset, len('{"name": "A"}\n\n'))
+
+    def test_json_array_streams_records_with_positions(self):
+        """Elements of a top-level array are yielded one by one; non-object elements are reported."""
+        path = self._write("resumes.json", '[\n  {"name": "A", "skills": {"x": ["[", "}"]}},\n  42,\n  {"name": "B \\" ]"}\n]')
+        errors = []
+        records = list(iter_user_records(path, on_error=errors.append))
+
+        self.assertEqual([r.data["name"] for r in records], ["A", 'B " ]'])
+        self.assertEqual([r.line for r in records], [2, 4])
+        self.assertEqual(records[0].offset, 4)
+        self.assertEqual([e.line for e in errors], [3])
+
+    def test_json_array_memory_stays_flat(self):
+        """Streaming a large array keeps peak memory far below the file size."""
+        record = json.dumps({"name": "John Doe", "projects": [{"description": "x" * 500}]})
+        path = os.path.join(self.tmp.name, "large.json")
+        with open(path, 'w') as f:
+            f.write("[" + ",\n".join([record] * 5000) + "]")
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_user_data(path))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(count, 5000)
+        self.assertLess(peak, os.path.getsize(path) // 20)
+
+class TestEncodings(unittest.TestCase):
+
+    def setUp(self):
+        clear_encoding_cache()
+        self.addCleanup(clear_encoding_cache)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.resume = {"name": "José “Pepe” Müller", "contact": {"city": "Málaga"}}
+
+    def _write(self, name, content, encoding):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding=encoding) as f:
+            f.write(content)
+        return path
+
+    def test_byte_order_marks_and_bare_utf16(self):
+        text = json.dumps(self.resume, ensure_ascii=False)
+        for encoding, expected in (("utf-8-sig", ("utf-8", 3)), ("utf-16", ("utf-16-le", 2)),
+                                   ("utf-32", ("utf-32-le", 4)), ("utf-16-be", ("utf-16-be", 0))):
+            path = self._write(f"{encoding}.json", text, encoding)
+            self.assertEqual(tuple(detect_encoding(path)), expected)
+            self.assertEqual(load_user_data(path), self.resume)
+
+    def test_windows_1252_upload(self):
+        path = self._write("latin.json", json.dumps(self.resume, ensure_ascii=False), "cp1252")
+        self.assertEqual(detect_encoding(path).name, "cp1252")
+        self.assertEqual(load_user_data(path), self.resume)
+
+    def test_chardet_sees_a_bounded_sample(self):
+        record = json.dumps(dict(self.resume, summary="x" * 2000), ensure_ascii=False)
+        path = self._write("large.jsonl", "\n".join([record] * 500) + "\n", "cp1252")
+        import chardet
+        with patch("chardet.detect", wraps=chardet.detect) as detect:
+            names = [data["name"] for data in iter_user_data(path)]
+        self.assertEqual(names, [self.resume["name"]] * 500)
+        self.assertEqual(detect.call_count, 1)
+        self.assertLessEqual(len(detect.call_args.args[0]), file_handler.CHARDET_BYTES)
+
+    def test_utf16_records_keep_their_source_offsets(self):
+        first = json.dumps({"name": "Zoë"}, ensure_ascii=False) + "\n"
+        path = self._write("resumes.jsonl", first + '{"name": oops}\n{"name": "B"}\n', "utf-16")
+        errors = []
+        records = list(iter_user_records(path, on_error=errors.append))
+
+        self.assertEqual([r.data["name"] for r in records], ["Zoë", "B"])
+        self.assertEqual(records[0].offset, 2)
+        self.assertEqual(errors[0].offset, 2 + len(first.encode("utf-16-le")))
+        self.assertEqual([r.line for r in records], [1, 3])
+
+    def test_encoding_is_sniffed_once_per_source(self):
+        path = self._write("resumes.json", json.dumps([self.resume] * 3, ensure_ascii=False), "utf-16")
+        instrumentation.enable()
+        self.addCleanup(instrumentation.disable)
+        self.addCleanup(instrumentation.reset)
+        with patch("file_handler._sniff", wraps=file_handler._sniff) as sniff:
+            self.assertEqual(list(iter_resumes(path)), [self.resume] * 3)
+            self.assertEqual(load_user_data(path), [self.resume] * 3)
+        self.assertEqual(sniff.call_count, 1)
+        # Sniffing a multi-record source is timed as loading
+        self.assertEqual(instrumentation.snapshot()["load"]["count"], 1)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
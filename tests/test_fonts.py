@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+import re
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from fonts import fallback_markup, ensure_font, coverage, find_font_file, register_family, _cache_subsets
+from themes import Theme, get_theme
+from pdf_generator import render_resume_pdf
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+HAS_DEJAVU = find_font_file("DejaVuSans.ttf") is not None
+
+class TestFonts(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_core_fonts_cover_cp1252(self):
+        self.assertIn(ord("é"), coverage("Helvetica"))
+        self.assertIn(ord("€"), coverage("Helvetica"))
+        self.assertNotIn(ord("И"), coverage("Helvetica"))
+        self.assertEqual(fallback_markup("José Müller", "Helvetica"), "José Müller")
+
+    def test_ascii_markup_is_unchanged(self):
+        text = "John Doe"
+        self.assertIs(get_theme("default").markup(text), text)
+
+    def test_unknown_or_missing_fonts(self):
+        self.assertTrue(ensure_font("Helvetica-Bold"))
+        self.assertFalse(ensure_font("NoSuchFont"))
+        register_family("TestMissingFamily", "does-not-exist.ttf")
+        self.assertFalse(ensure_font("TestMissingFamily"))
+        self.assertEqual(coverage("TestMissingFamily"), frozenset())
+        with self.assertRaises(ValueError):
+            Theme("test-missing-font", font_name="TestMissingFamily").styles
+
+    def test_truetype_theme_font(self):
+        """Vera ships with reportlab, so a TrueType theme always works."""
+        theme = Theme("test-vera", font_name="Vera", bold_font_name="Vera-Bold")
+        pdf = render_resume_pdf(self.sample, theme=theme)
+        self.assertIn(b"AAAAAA+BitstreamVeraSans-Roman", pdf)
+
+    @unittest.skipUnless(HAS_DEJAVU, "DejaVu Sans is not installed")
+    def test_missing_glyphs_use_the_fallback_font(self):
+        self.assertEqual(fallback_markup("Иван Petrov", "Helvetica", ("DejaVuSans",)),
+                         '<font face="DejaVuSans">Иван</font> Petrov')
+        # A face attribute resets <b>, so bold text falls back to the bold face
+        self.assertEqual(fallback_markup("Иван", "Helvetica-Bold", ("DejaVuSans",), "-Bold"),
+                         '<font face="DejaVuSans-Bold">Иван</font>')
+
+    @unittest.skipUnless(HAS_DEJAVU, "DejaVu Sans is not installed")
+    def test_fallback_fonts_are_embedded_once_per_style(self):
+        self.sample["name"] = "Иван Петров"
+        self.sample["projects"][0]["description"] = "Καλημέρα κόσμε"
+        first = render_resume_pdf(self.sample)
+        second = render_resume_pdf(self.sample)
+        fonts = re.findall(rb"/BaseFont /(\S+)", first)
+        self.assertIn(b"AAAAAA+DejaVuSans-Bold", fonts)
+        self.assertIn(b"AAAAAA+DejaVuSans", fonts)
+        # The cached subset gives the same document; only the timestamps and the time-based /ID differ
+        strip_time = lambda pdf: re.sub(rb"/ID \n\[<\w+><\w+>\]|\(D:[^)]*\)", b"", pdf)
+        self.assertEqual(strip_time(first), strip_time(second))
+
+class _Face:
+    """Stands in for a reportlab TTFontFace."""
+    filename = "face.ttf"
+
+    def makeSubset(self, subset):
+        return bytes(subset)
+
+    def addSubsetObjects(self, doc, fontname, subset):
+        return "reference"
+
+class TestSubsetCache(unittest.TestCase):
+
+    def test_other_reportlab_versions_keep_the_stock_subsetting(self):
+        face = _Face()
+        with patch("reportlab.Version", "5.0.0"):
+            self.assertFalse(_cache_subsets(face))
+        self.assertNotIn("makeSubset", vars(face))
+        self.assertNotIn("addSubsetObjects", vars(face))
+
+    def test_faces_without_the_subset_methods_are_left_alone(self):
+        face = SimpleNamespace(filename="face.ttf")
+        self.assertFalse(_cache_subsets(face))
+        self.assertEqual(vars(face), {"filename": "face.ttf"})
+
+    def test_a_missing_font_stream_falls_back_to_the_stock_stream(self):
+        face = _Face()
+        self.assertTrue(_cache_subsets(face))
+        self.assertEqual(face.makeSubset([65, 66]), b"AB")
+        doc = SimpleNamespace(compression=1, idToObject={})
+        self.assertEqual(face.addSubsetObjects(doc, "F1+0", [65, 66]), "reference")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+from io import StringIO
+import sys
+import os
+import json
+import re
+import subprocess
+import tempfile
+import zlib
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from pdf_generator import generate_resume_pdf, render_resume_pdf, render_cache_key, get_backend
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+def page_text(pdf):
+    """Decompresses the page content streams of an fpdf document."""
+    streams = re.findall(rb'stream\r?\n(.*?)endstream', pdf, re.S)
+    return b"".join(zlib.decompress(stream.strip()) for stream in streams).decode("latin-1")
+
+class TestFpdfBackend(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_render_draws_every_section(self):
+        text = page_text(render_resume_pdf(self.sample, backend="fpdf"))
+        for heading in ("EDUCATION", "PROFESSIONAL EXPERIENCE", "PROJECTS", "SKILLS"):
+            self.assertIn(f"({heading})", text)
+        self.assertIn("(John Doe)", text)
+        self.assertIn("(Tech Stack: React.js, Node.js, MongoDB)", text)
+
+    def test_backend_does_not_load_reportlab(self):
+        """Themes, profiles and the rule color are resolved without importing reportlab."""
+        code = (
+            "import sys, io, json; sys.path.insert(0, sys.argv[1]); import fpdf_renderer; "
+            "fpdf_renderer.render_document(json.load(open(sys.argv[2])), io.BytesIO(), 'compact', 'archive'); "
+            "print(sorted(name for name in sys.modules if name.startswith('reportlab')))"
+        )
+        src = os.path.join(os.path.dirname(__file__), '../src')
+        result = subprocess.run([sys.executable, "-c", code, src, SAMPLE_PATH], capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), "[]", result.stderr)
+
+    def test_text_outside_the_core_fonts_is_replaced(self):
+        """Curly quotes are kept in the WinAnsi encoding; characters the core fonts lack become '?'."""
+        data = dict(self.sample, name="Zoë 李")
+        text = page_text(render_resume_pdf(data, backend="fpdf"))
+        self.assertIn("(Zo\xeb ?)", text)
+        self.assertIn("Bachelor\x92s", text)
+
+    def test_missing_sections_render(self):
+        pdf = render_resume_pdf({"name": "Jane Roe", "contact": {}}, backend="fpdf")
+        self.assertTrue(pdf.startswith(b"%PDF"))
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_generate_resume_pdf_with_backend(self, mock_stdout):
+        with tempfile.TemporaryDirectory() as output:
+            path = generate_resume_pdf(self.sample, output, backend="fpdf")
+            with open(path, 'rb') as f:
+                self.assertTrue(f.read().startswith(b"%PDF"))
+
+    def test_backends_have_separate_cache_keys(self):
+        self.assertNotEqual(render_cache_key(self.sample, backend="reportlab"),
+                            render_cache_key(self.sample, backend="fpdf"))
+        with self.assertRaises(ValueError) as ctx:
+            get_backend("nope")
+        self.assertIn("fpdf", str(ctx.exception))
+
+if __name__ == "__main__":
+    unittest.main()
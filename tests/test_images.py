@@ -0,0 +1,97 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+from PIL import Image
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import images
+from images import prepare_image, clear_cache
+from pdf_generator import render_resume_pdf, render_cache_key
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestImages(unittest.TestCase):
+
+    def setUp(self):
+        clear_cache()
+        self.addCleanup(clear_cache)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # A phone-sized photo, stored sideways with an EXIF orientation like cameras do
+        self.photo = os.path.join(self.tmp.name, "photo.jpg")
+        photo = Image.linear_gradient("L").resize((4000, 3000)).convert("RGB")
+        exif = photo.getexif()
+        exif[0x0112] = 6
+        photo.save(self.photo, quality=92, exif=exif)
+        self.logo = os.path.join(self.tmp.name, "logo.png")
+        logo = Image.new("RGBA", (600, 300), (0, 0, 0, 0))
+        logo.paste((20, 60, 200, 255), (50, 50, 550, 250))
+        logo.save(self.logo)
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_photo_is_downsampled_and_cropped_to_its_box(self):
+        image = prepare_image(self.photo, 72, 36, crop=True)
+        self.assertEqual(image.format, "JPEG")
+        self.assertEqual(image.pixels, (150, 75))
+        self.assertEqual((image.width, image.height), (72, 36))
+        self.assertLess(len(image.data), os.path.getsize(self.photo) / 20)
+
+    def test_jpeg_is_decoded_at_reduced_scale(self):
+        with patch.object(Image.Image, "resize", wraps=Image.Image.resize, autospec=True) as resize:
+            prepare_image(self.photo, 72, 72, crop=True)
+        # Draft mode decodes the 4000 x 3000 photo at 1/8 scale; the EXIF rotation swaps the sides
+        self.assertEqual(resize.call_args.args[0].size, (375, 500))
+
+    def test_logo_keeps_its_aspect_ratio_and_transparency(self):
+        image = prepare_image(self.logo, 30, 30)
+        self.assertEqual(image.format, "PNG")
+        self.assertEqual(image.pixels, (63, 32))
+        self.assertAlmostEqual(image.width, 30.24)
+        self.assertEqual(Image.open(io.BytesIO(image.data)).mode, "RGBA")
+
+    def test_processed_images_are_cached_by_content_and_size(self):
+        copy_path = os.path.join(self.tmp.name, "same_logo.png")
+        with open(self.logo, 'rb') as source, open(copy_path, 'wb') as target:
+            target.write(source.read())
+        with patch("images._process", wraps=images._process) as process:
+            first = prepare_image(self.logo, 30, 30)
+            self.assertIs(prepare_image(copy_path, 30, 30), first)
+            prepare_image(self.logo, 60, 60)
+        self.assertEqual(process.call_count, 2)
+
+    def test_resume_with_photo_and_logos(self):
+        plain = render_resume_pdf(self.sample)
+        data = dict(self.sample, photo=self.photo)
+        data["professional_experience"] = [dict(exp, logo=self.logo) for exp in self.sample["professional_experience"]]
+        pdf = render_resume_pdf(data)
+
+        # The photo plus one logo and its transparency mask; the second logo reuses the first
+        self.assertEqual(pdf.count(b"/Subtype /Image"), 3)
+        self.assertLess(len(pdf) - len(plain), 20000)
+
+    def test_unreadable_image_is_left_out(self):
+        data = dict(self.sample, photo=os.path.join(self.tmp.name, "missing.jpg"))
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            pdf = render_resume_pdf(data)
+        self.assertNotIn(b"/Subtype /Image", pdf)
+        self.assertIn("Warning: image left out", errors.getvalue())
+
+    def test_replacing_an_image_changes_the_render_cache_key(self):
+        data = dict(self.sample, photo=self.logo)
+        before = render_cache_key(data)
+        Image.new("RGB", (10, 10), "red").save(self.logo)
+        os.utime(self.logo, ns=(0, 0))
+        self.assertNotEqual(render_cache_key(data), before)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import instrumentation
+from instrumentation import stage
+from batch import run_batch
+from pdf_generator import render_resume_pdf
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.reset)
+        self.addCleanup(instrumentation.disable)
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_disabled_hooks_record_nothing(self):
+        """While disabled every stage shares one no-op context manager."""
+        self.assertIs(stage("a"), stage("b"))
+        with stage("a"):
+            pass
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_render_records_each_section(self):
+        instrumentation.enable()
+        render_resume_pdf(self.sample)
+        stages = instrumentation.snapshot()
+        for name in ("render.header", "render.education", "render.experience", "render.projects",
+                     "render.skills", "render.build"):
+            self.assertEqual(stages[name]["count"], 1, name)
+
+    def test_merge_and_prometheus_export(self):
+        """Worker snapshots add up, and the Prometheus buckets are cumulative."""
+        instrumentation.observe("validate", 0.0002)
+        worker = instrumentation.drain()
+        instrumentation.observe("validate", 0.02)
+        instrumentation.merge(worker)
+
+        text = instrumentation.export_prometheus()
+        self.assertIn('resume_stage_seconds_bucket{stage="validate",le="0.00025"} 1', text)
+        self.assertIn('resume_stage_seconds_bucket{stage="validate",le="+Inf"} 2', text)
+        self.assertIn('resume_stage_seconds_count{stage="validate"} 2', text)
+
+    def test_batch_collects_worker_timings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            inputs = os.path.join(tmp, "inputs")
+            os.makedirs(inputs)
+            for index in range(2):
+                with open(os.path.join(inputs, f"resume_{index}.json"), 'w') as f:
+                    json.dump(dict(self.sample, name=f"Metrics Person {index}"), f)
+
+            instrumentation.enable()
+            summary = run_batch(inputs, output_folder=os.path.join(tmp, "out"), workers=1, use_cache=False)
+            metrics_path = os.path.join(tmp, "metrics.json")
+            instrumentation.write_metrics(metrics_path)
+            with open(metrics_path, 'r') as f:
+                exported = json.load(f)
+
+        self.assertNotIn("metrics", summary["items"][0])
+        self.assertEqual(exported["stages"]["render.build"]["count"], 2)
+        self.assertEqual(exported["stages"]["validate"]["count"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
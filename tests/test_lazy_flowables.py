@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import io
+import re
+import json
+import tracemalloc
+from unittest.mock import patch
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from lazy_flowables import LazyFlowables
+from pdf_generator import render_document, render_resume_pdf
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), '../data/template.json')
+
+# Object IDs and timestamps differ between any two builds
+VOLATILE = re.compile(rb"/ID \n\[<\w+><\w+>\]|\(D:[^)]*\)")
+
+def scaled_template(factor):
+    with open(TEMPLATE_PATH, 'r') as f:
+        data = json.load(f)
+    for key in ("education", "professional_experience", "projects"):
+        data[key] = data[key] * factor
+    return data
+
+def render_peak(data, lazy):
+    tracemalloc.start()
+    try:
+        pages = render_document(data, io.BytesIO(), lazy=lazy)
+        return tracemalloc.get_traced_memory()[1], pages
+    finally:
+        tracemalloc.stop()
+
+class TestLazyFlowables(unittest.TestCase):
+
+    def test_pulls_items_only_as_far_as_they_are_used(self):
+        pulled = []
+        def source():
+            for index in range(20):
+                pulled.append(index)
+                yield index
+        items = LazyFlowables(source(), lookahead=3)
+
+        self.assertEqual(items[0], 0)
+        self.assertEqual(pulled, [0])
+        self.assertEqual(len(items), 3)
+        del items[0]
+        items[0:0] = ["a", "b"]
+        items.insert(0, "c")
+        self.assertEqual(items[:4], ["c", "a", "b", 1])
+        self.assertEqual(items.buffered(), 5)
+        self.assertEqual(items[5], 3)
+        self.assertEqual(len(pulled), 4)
+        self.assertEqual(items[-1], 19)
+        self.assertEqual(len(items), 22)
+
+    def test_empty_source(self):
+        items = LazyFlowables(iter(()))
+        self.assertFalse(items)
+        self.assertEqual(len(items), 0)
+
+    def test_lazy_build_matches_eager_build(self):
+        data = scaled_template(10)
+        eager, lazy = io.BytesIO(), io.BytesIO()
+        self.assertEqual(render_document(data, eager, lazy=False), render_document(data, lazy, lazy=True))
+        self.assertEqual(VOLATILE.sub(b"", eager.getvalue()), VOLATILE.sub(b"", lazy.getvalue()))
+
+    def test_only_long_resumes_are_built_lazily_by_default(self):
+        with patch("pdf_generator.LazyFlowables", wraps=LazyFlowables) as lazy:
+            render_resume_pdf(scaled_template(1))
+            self.assertFalse(lazy.called)
+            render_resume_pdf(scaled_template(100))
+            self.assertTrue(lazy.called)
+
+    def test_peak_memory_stays_bounded(self):
+        lazy_10, _ = render_peak(scaled_template(10), lazy=True)
+        lazy_100, pages = render_peak(scaled_template(100), lazy=True)
+        eager_100, _ = render_peak(scaled_template(100), lazy=False)
+
+        self.assertGreater(pages, 10)
+        # reportlab still holds each finished page until the document is saved, so the peak grows
+        # with the page count, but far less than with every flowable built up front
+        self.assertLess(lazy_100, eager_100 * 0.6)
+        self.assertLess(lazy_100 - lazy_10, (eager_100 - lazy_10) * 0.4)
+
+if __name__ == "__main__":
+    unittest.main()
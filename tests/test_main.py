@@ -0,0 +1,95 @@
+import unittest
+import subprocess
+import sys
+import os
+import json
+import tempfile
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+SAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../data/user_data.json'))
+
+def run_main(*args):
+    """Runs main.main() in a fresh interpreter and reports whether reportlab was imported."""
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import main; "
+        "status = main.main(sys.argv[2:]); "
+        "print('REPORTLAB_LOADED' if 'reportlab' in sys.modules else 'REPORTLAB_SKIPPED'); "
+        "sys.exit(status)"
+    )
+    return subprocess.run([sys.executable, "-c", code, SRC_DIR, *args], capture_output=True, text=True)
+
+class TestMainFastPaths(unittest.TestCase):
+
+    def test_validate_only_skips_reportlab(self):
+        result = run_main("--validate-only", SAMPLE_PATH)
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Data is valid.", result.stdout)
+        self.assertIn("REPORTLAB_SKIPPED", result.stdout)
+
+    def test_validate_only_reports_errors(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            data = json.load(f)
+        data["contact"]["phone"] = "12345"
+        with tempfile.NamedTemporaryFile('w', suffix=".json", delete=False) as f:
+            json.dump(data, f)
+        self.addCleanup(os.remove, f.name)
+
+        result = run_main("--validate-only", f.name)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Invalid phone number format", result.stdout)
+
+    def test_display_only_skips_reportlab(self):
+        with tempfile.TemporaryDirectory() as output:
+            result = run_main("--display-only", "--output", output, SAMPLE_PATH)
+            self.assertEqual(os.listdir(output), [])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Name: John Doe", result.stdout)
+        self.assertIn("REPORTLAB_SKIPPED", result.stdout)
+
+    def test_text_formats_skip_reportlab(self):
+        with tempfile.TemporaryDirectory() as output:
+            result = run_main("--formats", "html", "markdown", "--output", output, SAMPLE_PATH)
+            self.assertEqual(sorted(os.listdir(output)), ["John_Doe_resume.html", "John_Doe_resume.md"])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("REPORTLAB_SKIPPED", result.stdout)
+
+    def test_unknown_theme_is_rejected_before_any_work(self):
+        result = run_main("--theme", "nope", SAMPLE_PATH)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("invalid choice: 'nope'", result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+        self.assertNotIn("John Doe", result.stdout)
+
+    def test_unknown_backend_is_rejected_before_any_work(self):
+        with tempfile.TemporaryDirectory() as output:
+            result = run_main("--backend", "nope", "--output", output, SAMPLE_PATH)
+            self.assertEqual(os.listdir(output), [])
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Error: unknown backend 'nope'. Available backends: fpdf, reportlab.", result.stdout)
+        self.assertNotIn("John Doe", result.stdout)
+        self.assertNotIn("Traceback", result.stderr)
+
+    def test_unknown_backend_fails_a_batch_without_starting_workers(self):
+        with tempfile.TemporaryDirectory() as output:
+            result = run_main("--batch", SAMPLE_PATH, "--backend", "nope", "--output", output)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Error: unknown backend 'nope'", result.stdout)
+        self.assertNotIn("BrokenProcessPool", result.stderr)
+
+    def test_unknown_profile_is_rejected_before_any_work(self):
+        result = run_main("--profile", "nope", SAMPLE_PATH)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("invalid choice: 'nope'", result.stderr)
+        self.assertNotIn("John Doe", result.stdout)
+
+    def test_fit_pages_with_fpdf_is_rejected_before_any_work(self):
+        for mode in ([SAMPLE_PATH], ["--batch", SAMPLE_PATH], ["--batch", SAMPLE_PATH, "--pipeline"]):
+            with self.subTest(mode=mode), tempfile.TemporaryDirectory() as output:
+                result = run_main("--fit-pages", "1", "--backend", "fpdf", "--output", output, *mode)
+                self.assertEqual(os.listdir(output), [])
+                self.assertEqual(result.returncode, 1)
+                self.assertIn("Error: --fit-pages is only supported by the reportlab backend.", result.stdout)
+                self.assertNotIn("John Doe", result.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
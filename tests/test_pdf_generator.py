@@ -3,11 +3,13 @@ import unittest
 from unittest.mock import patch, MagicMock
 import os
 import json
+import tempfile
 
 # Add the 'src' directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 from file_handler import load_user_data
-from pdf_generator import generate_resume_pdf
+from pdf_generator import generate_resume_pdf, render_resume_pdf
+from io import BytesIO, StringIO
 
 class TestResumeGeneration(unittest.TestCase):
 
@@ -73,14 +75,17 @@ class TestResumeGeneration(unittest.TestCase):
         # Check if the build method was called to create the PDF
         mock_doc.build.assert_called_once()
 
-    @patch("builtins.open", new_callable=unittest.mock.mock_open, read_data='{"name": "Jane Doe"}')
-    def test_load_user_data(self, mock_file):
+    def test_load_user_data(self):
         # Assuming the file contains valid JSON
-        file_path = "mock_user_data.json"
-        result = load_user_data(file_path)
+        with tempfile.TemporaryDirectory() as folder:
+            file_path = os.path.join(folder, "mock_user_data.json")
+            with open(file_path, 'w') as f:
+                f.write('{"name": "Jane Doe"}')
+            with patch("builtins.open", wraps=open) as mock_file:
+                result = load_user_data(file_path)
 
-        # Test if the file was opened correctly
-        mock_file.assert_called_once_with(file_path, 'r')
+        # Test if the file was opened correctly: once, as bytes, so its encoding can be sniffed
+        mock_file.assert_called_once_with(file_path, 'rb')
 
         # Test if the loaded data is correct
         self.assertEqual(result, {"name": "Jane Doe"})
@@ -105,5 +110,27 @@ class TestResumeGeneration(unittest.TestCase):
         # Test if empty dictionary is returned on JSONDecodeError
         self.assertEqual(result, {})
 
+class TestInMemoryRender(unittest.TestCase):
+
+    def setUp(self):
+        data_path = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+        with open(data_path, 'r') as f:
+            self.data = json.load(f)
+
+    @patch("sys.stdout", new_callable=StringIO)
+    @patch("os.makedirs")
+    def test_render_returns_bytes_quietly(self, mock_makedirs, mock_stdout):
+        """Without a stream the PDF comes back as bytes; nothing is printed and no folder is created."""
+        pdf = render_resume_pdf(self.data)
+        self.assertTrue(pdf.startswith(b"%PDF"))
+        self.assertEqual(mock_stdout.getvalue(), "")
+        mock_makedirs.assert_not_called()
+
+    def test_render_into_stream(self):
+        """With a stream the PDF is written into it and nothing is returned."""
+        stream = BytesIO()
+        self.assertIsNone(render_resume_pdf(self.data, stream, theme="compact"))
+        self.assertTrue(stream.getvalue().startswith(b"%PDF"))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
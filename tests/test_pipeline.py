@@ -0,0 +1,116 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from pipeline import run_pipeline, print_stages, STAGES
+from main import main
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+        self.output = os.path.join(self.tmp.name, "output")
+
+    def _write_jsonl(self, records):
+        path = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(path, 'w') as f:
+            for record in records:
+                f.write((record if isinstance(record, str) else json.dumps(record)) + "\n")
+        return path
+
+    def test_renders_valid_resumes_and_reports_the_rest_in_order(self):
+        source = self._write_jsonl([
+            dict(self.sample, name="Pipe Zero"),
+            dict(self.sample, contact={"email": "nope"}),
+            "{not json",
+            dict(self.sample, name="Pipe Three"),
+        ])
+        summary = run_pipeline(source, output_folder=self.output, workers=2)
+
+        self.assertEqual([item["status"] for item in summary["items"]], ["ok", "invalid", "error", "ok"])
+        self.assertEqual(summary["succeeded"], 2)
+        self.assertEqual(summary["items"][0]["output"], os.path.join(self.output, "Pipe_Zero_resume.pdf"))
+        with open(summary["items"][3]["output"], 'rb') as f:
+            self.assertTrue(f.read().startswith(b"%PDF"))
+
+    def test_stage_utilization_is_reported(self):
+        source = self._write_jsonl([dict(self.sample, name=f"Pipe {index}") for index in range(6)])
+        summary = run_pipeline(source, output_folder=self.output, workers=1)
+
+        self.assertEqual(list(summary["stages"]), list(STAGES))
+        for name in STAGES:
+            entry = summary["stages"][name]
+            self.assertEqual(entry["items"], 6)
+            self.assertGreaterEqual(entry["utilization"], 0.0)
+            self.assertLessEqual(entry["utilization"], 1.0)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_stages(summary)
+        self.assertEqual(output.getvalue().count("<- bottleneck"), 1)
+
+    def test_unchanged_resumes_come_from_the_render_cache(self):
+        source = self._write_jsonl([dict(self.sample, name=f"Pipe {index}") for index in range(3)])
+        run_pipeline(source, output_folder=self.output, workers=1)
+        rerun = run_pipeline(source, output_folder=self.output, workers=1)
+
+        self.assertEqual(rerun["cached"], 3)
+        self.assertEqual(rerun["stages"]["render"]["items"], 0)
+
+    def test_resumes_with_the_same_name_get_their_own_files(self):
+        source = self._write_jsonl([dict(self.sample, contact=dict(self.sample["contact"], location=f"Office {index}")) for index in range(3)])
+        summary = run_pipeline(source, output_folder=self.output, workers=2)
+        self.assertEqual([os.path.basename(item["output"]) for item in summary["items"]],
+                         ["John_Doe_resume.pdf", "John_Doe_resume_2.pdf", "John_Doe_resume_3.pdf"])
+
+        # The second version changed: it cannot take a name the unchanged ones still hold
+        source = self._write_jsonl([dict(self.sample, contact=dict(self.sample["contact"], location=f"Office {index}")) for index in (0, 9, 2)])
+        rerun = run_pipeline(source, output_folder=self.output, workers=2)
+        self.assertEqual(rerun["cached"], 2)
+        outputs = [os.path.basename(item["output"]) for item in rerun["items"]]
+        self.assertEqual(len(set(outputs)), 3)
+        self.assertEqual(outputs[0], "John_Doe_resume.pdf")
+        self.assertEqual(outputs[2], "John_Doe_resume_3.pdf")
+
+    def test_a_failed_write_is_reported_on_its_item(self):
+        source = self._write_jsonl([dict(self.sample, name="Pipe Zero"), dict(self.sample, name="Pipe One")])
+        # A directory where the first PDF should go makes opening it fail
+        os.makedirs(os.path.join(self.output, "Pipe_Zero_resume.pdf"))
+        summary = run_pipeline(source, output_folder=self.output, workers=1)
+
+        self.assertEqual([item["status"] for item in summary["items"]], ["error", "ok"])
+        self.assertIsNone(summary["items"][0]["output"])
+        self.assertIn("IsADirectoryError", summary["items"][0]["errors"][0])
+        self.assertNotIn("bytes", summary["items"][0])
+        self.assertEqual(summary["failed"], 1)
+        self.assertTrue(os.path.isfile(os.path.join(self.output, "Pipe_One_resume.pdf")))
+
+        # The failed item is not recorded in the render cache, so the next run renders it again
+        os.rmdir(os.path.join(self.output, "Pipe_Zero_resume.pdf"))
+        rerun = run_pipeline(source, output_folder=self.output, workers=1)
+        self.assertEqual([item.get("cached", False) for item in rerun["items"]], [False, True])
+
+    def test_cli_pipeline_flag(self):
+        source = self._write_jsonl([self.sample])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(["--batch", source, "--pipeline", "--output", self.output, "--workers", "1"])
+
+        self.assertEqual(status, 0)
+        self.assertIn("Rendered 1/1 resumes", output.getvalue())
+        self.assertIn("render", output.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import io
+import re
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+from PIL import Image
+from reportlab import rl_config
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from profiles import get_profile, available_profiles
+from pdf_generator import render_resume_pdf, render_cache_key
+from batch import run_batch, print_summary
+from themes import Theme
+from main import main
+import images
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+# Object IDs and timestamps differ between any two builds
+VOLATILE = re.compile(rb"/ID \n\[<\w+><\w+>\]|\(D:[^)]*\)")
+
+class TestProfiles(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_profiles_trade_size_for_speed(self):
+        pdfs = {profile: render_resume_pdf(self.sample, profile=profile) for profile in available_profiles()}
+
+        # balanced is reportlab's usual output
+        self.assertEqual(VOLATILE.sub(b"", pdfs["balanced"]), VOLATILE.sub(b"", render_resume_pdf(self.sample)))
+        self.assertLess(len(pdfs["archive"]), len(pdfs["balanced"]))
+        self.assertLess(len(pdfs["balanced"]), len(pdfs["fast"]))
+        self.assertIn(b"ASCII85Decode", pdfs["balanced"])
+        self.assertNotIn(b"ASCII85Decode", pdfs["archive"])
+        self.assertNotIn(b"FlateDecode", pdfs["fast"])
+        # The process-wide reportlab setting is restored after each build
+        self.assertEqual(rl_config.useA85, 1)
+
+    def test_font_subsets_are_compressed_in_every_profile(self):
+        vera = Theme("vera-profiles", font_name="Vera", bold_font_name="Vera-Bold")
+        sizes = {}
+        for profile in ("fast", "balanced", "archive"):
+            pdf = render_resume_pdf(self.sample, theme=vera, profile=profile)
+            font_files = re.findall(rb"/Filter \[ /FlateDecode \] /Length (\d+) /Length1 (\d+)", pdf)
+            self.assertTrue(font_files, profile)
+            for compressed, original in font_files:
+                self.assertLess(int(compressed), int(original))
+            sizes[profile] = sum(int(compressed) for compressed, _ in font_files)
+        self.assertLessEqual(sizes["archive"], sizes["balanced"])
+
+    def test_image_quality_follows_the_profile(self):
+        images.clear_cache()
+        self.addCleanup(images.clear_cache)
+        photo = os.path.join(self.tmp.name, "photo.jpg")
+        Image.radial_gradient("L").resize((2000, 2000)).convert("RGB").save(photo)
+        data = dict(self.sample, photo=photo)
+
+        # The photo is printed one inch wide
+        self.assertIn(b"/Width 96", render_resume_pdf(data, profile="fast"))
+        self.assertIn(b"/Width 150", render_resume_pdf(data, profile="balanced"))
+        self.assertIn(b"/Width 120", render_resume_pdf(data, profile="archive"))
+
+    def test_profile_is_part_of_the_render_cache_key(self):
+        self.assertEqual(render_cache_key(self.sample), render_cache_key(self.sample, profile="balanced"))
+        self.assertNotEqual(render_cache_key(self.sample), render_cache_key(self.sample, profile="archive"))
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            get_profile("tiny")
+
+    def test_batch_reports_bytes_per_profile(self):
+        source = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(source, 'w') as f:
+            for index in range(2):
+                f.write(json.dumps(dict(self.sample, name=f"Profile {index}")) + "\n")
+        output_folder = os.path.join(self.tmp.name, "output")
+        with redirect_stdout(io.StringIO()):
+            summary = run_batch(source, output_folder=output_folder, workers=1, profile="archive")
+
+        self.assertEqual(summary["profile"], "archive")
+        self.assertEqual(summary["bytes"], sum(os.path.getsize(item["output"]) for item in summary["items"]))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_summary(summary)
+        self.assertIn(f"Wrote {summary['bytes']:,} bytes", output.getvalue())
+        self.assertIn("archive profile", output.getvalue())
+
+    def test_cli_reports_size_and_time(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main([SAMPLE_PATH, "--output", self.tmp.name, "--profile", "fast", "--no-cache"])
+        self.assertEqual(status, 0)
+        self.assertRegex(output.getvalue(), r"Resume saved to: .*John_Doe_resume\.pdf \([\d,]+ bytes in \d+ ms, fast profile\)")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from render_cache import RenderCache
+
+class TestRenderCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.pdf_path = os.path.join(self.tmp.name, "John_Doe_resume.pdf")
+        with open(self.pdf_path, 'wb') as f:
+            f.write(b"%PDF-1.4 test")
+
+    def test_key_is_canonical(self):
+        """Key order does not matter; content, theme and renderer version do."""
+        a = RenderCache.key({"name": "A", "skills": {"x": ["1"]}}, "default", 1)
+        b = RenderCache.key({"skills": {"x": ["1"]}, "name": "A"}, "default", 1)
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, RenderCache.key({"name": "B", "skills": {"x": ["1"]}}, "default", 1))
+        self.assertNotEqual(a, RenderCache.key({"name": "A", "skills": {"x": ["1"]}}, "compact", 1))
+        self.assertNotEqual(a, RenderCache.key({"name": "A", "skills": {"x": ["1"]}}, "default", 2))
+
+    def test_store_save_and_lookup(self):
+        """Saved entries are found by a new cache instance until the PDF changes on disk."""
+        cache = RenderCache(self.tmp.name)
+        cache.store("abc", self.pdf_path)
+        cache.save()
+
+        reloaded = RenderCache(self.tmp.name)
+        self.assertEqual(reloaded.lookup("abc"), self.pdf_path)
+        self.assertIsNone(reloaded.lookup("missing"))
+
+        with open(self.pdf_path, 'wb') as f:
+            f.write(b"%PDF-1.4 overwritten by another render")
+        self.assertIsNone(reloaded.lookup("abc"))
+
+    def test_evict_by_age_and_count(self):
+        """Entries past max_age go first, then the least recently used beyond max_entries."""
+        cache = RenderCache(self.tmp.name, max_entries=2, max_age=100)
+        for key in ("old", "a", "b", "c"):
+            cache.store(key, self.pdf_path)
+        now = time.time()
+        cache.entries["old"]["last_used"] = now - 1000
+        cache.entries["a"]["last_used"] = now - 50
+
+        self.assertEqual(cache.evict(now), 2)
+        self.assertEqual(set(cache.entries), {"b", "c"})
+
+if __name__ == "__main__":
+    unittest.main()
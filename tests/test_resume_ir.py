@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+import json
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from resume_ir import normalize, as_resume
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestResumeIR(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_lists_are_joined_and_dates_parsed(self):
+        resume = normalize(self.sample)
+        self.assertEqual(resume.name, "John Doe")
+        self.assertEqual(resume.projects[0].tech_stack, "React.js, Node.js, MongoDB")
+        self.assertTrue(resume.education[0].courses.startswith("Linear Algebra and Calculus, "))
+        self.assertEqual(resume.experience[0].period.start, (2023, 6))
+        self.assertEqual(resume.experience[0].period.end, (2023, 8))
+
+    def test_present_is_left_unresolved(self):
+        """'Present' keeps end None, so the IR of a resume never changes with the calendar."""
+        period = normalize(self.sample).experience[1].period
+        self.assertTrue(period.present)
+        self.assertIsNone(period.end)
+
+    def test_missing_fields_become_empty(self):
+        resume = normalize({"contact": {"Location": "Lisbon"}, "education": [{"degree": "BSc"}]})
+        self.assertEqual(resume.name, "")
+        self.assertEqual(resume.contact.location, "Lisbon")
+        self.assertIsNone(resume.education[0].courses)
+        self.assertIsNone(resume.education[0].period)
+        self.assertEqual(resume.soft_skills, "")
+
+    def test_as_resume_passes_ir_through(self):
+        resume = normalize(self.sample)
+        self.assertIs(as_resume(resume), resume)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import json
+import pickle
+import tempfile
+from io import StringIO
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from resume_model import to_model, iter_resume_models, ResumeModel
+from validator import validate_data
+from builder import render_text, display_resume
+from pdf_generator import render_resume_pdf
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestResumeModel(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    def test_reads_like_the_dictionary(self):
+        model = to_model(self.sample)
+        self.assertEqual(model["name"], "John Doe")
+        self.assertEqual(model["contact"]["email"], self.sample["contact"]["email"])
+        self.assertEqual(list(model["skills"]), list(self.sample["skills"]))
+        self.assertEqual(model.to_dict(), self.sample)
+
+    def test_missing_fields_read_as_missing(self):
+        model = to_model({"name": "Jane Doe", "contact": {"email": "jane@example.com"}})
+        self.assertNotIn("projects", model)
+        self.assertIsNone(model.get("projects"))
+        self.assertEqual(model["contact"].get("phone", ""), "")
+        with self.assertRaises(KeyError):
+            model["education"]
+        self.assertEqual(dict(model["contact"]), {"email": "jane@example.com"})
+
+    def test_shared_vocabulary_is_interned(self):
+        first = to_model(json.loads(json.dumps(self.sample)))
+        second = to_model(json.loads(json.dumps(self.sample)))
+        self.assertIs(first["projects"][0]["tech_stack"][0], second["projects"][0]["tech_stack"][0])
+        self.assertIs(first["education"][0]["institution"], second["education"][0]["institution"])
+        self.assertIs(first["skills"]["soft_skills"][0], second["skills"]["soft_skills"][0])
+
+    def test_accepted_by_validate_display_and_render(self):
+        model = to_model(self.sample)
+        self.assertEqual(validate_data(model), validate_data(self.sample))
+        self.assertEqual(render_text(model), render_text(self.sample))
+        stream = StringIO()
+        display_resume(model, stream)
+        self.assertIn("Name: John Doe", stream.getvalue())
+        self.assertTrue(render_resume_pdf(model).startswith(b"%PDF"))
+
+    def test_validation_errors_match_the_dictionary(self):
+        self.sample["contact"]["email"] = "not-an-email"
+        self.sample["skills"]["soft_skills"] = "Leadership"
+        del self.sample["education"][0]["degree"]
+        self.assertEqual(validate_data(to_model(self.sample)), validate_data(self.sample))
+
+    def test_pickles_for_worker_processes(self):
+        model = to_model(self.sample)
+        self.assertEqual(pickle.loads(pickle.dumps(model)).to_dict(), self.sample)
+
+    def test_iter_resume_models(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "resumes.jsonl")
+            with open(path, 'w') as f:
+                f.write(json.dumps(self.sample) + "\n" + json.dumps(dict(self.sample, name="Jane Doe")) + "\n")
+            models = list(iter_resume_models(path))
+        self.assertTrue(all(isinstance(model, ResumeModel) for model in models))
+        self.assertEqual([model["name"] for model in models], ["John Doe", "Jane Doe"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import unittest
+import asyncio
+import sys
+import os
+import json
+import tempfile
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from server import RenderServer
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+async def request(port, method, path, body=b""):
+    """Sends one HTTP request and returns (status, headers, body)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), headers, payload
+
+class TestRenderServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = RenderServer(port=0, workers=1, timeout=30.0)
+        await self.server.start()
+        with open(SAMPLE_PATH, 'rb') as f:
+            self.sample = f.read()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_health(self):
+        status, _, payload = await request(self.server.port, "GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(payload)["workers"], 1)
+
+    async def test_render_returns_pdf(self):
+        status, headers, payload = await request(self.server.port, "POST", "/render", self.sample)
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Type"], "application/pdf")
+        self.assertTrue(payload.startswith(b"%PDF"))
+
+    async def test_render_rejects_invalid_resume(self):
+        """Invalid resumes get 422 with the validate_data messages and their field paths."""
+        data = json.loads(self.sample)
+        data["contact"]["email"] = "nope"
+        status, _, payload = await request(self.server.port, "POST", "/render", json.dumps(data).encode())
+        self.assertEqual(status, 422)
+        body = json.loads(payload)
+        self.assertEqual(body["errors"], ["Invalid email format."])
+        self.assertEqual(body["details"][0]["path"], "contact.email")
+
+    async def test_bad_requests(self):
+        status, _, _ = await request(self.server.port, "POST", "/render", b"{not json")
+        self.assertEqual(status, 400)
+        status, _, _ = await request(self.server.port, "GET", "/render")
+        self.assertEqual(status, 405)
+        status, _, _ = await request(self.server.port, "GET", "/nowhere")
+        self.assertEqual(status, 404)
+
+    async def test_full_queue_returns_503(self):
+        self.server.max_queue = 0
+        status, headers, _ = await request(self.server.port, "POST", "/render", self.sample)
+        self.assertEqual(status, 503)
+        self.assertEqual(headers["Retry-After"], "1")
+
+    async def test_unknown_names_are_rejected_before_rendering(self):
+        for query in ("theme=nope", "backend=nope", "profile=nope"):
+            status, _, payload = await request(self.server.port, "POST", f"/render?{query}", self.sample)
+            self.assertEqual(status, 400)
+            self.assertIn("Unknown", json.loads(payload)["error"])
+        self.assertEqual(self.server.pending, 0)
+
+    async def test_timed_out_render_keeps_its_slot_until_done(self):
+        """A 504 does not free the queue slot while the worker is still busy with the job."""
+        self.server.max_queue = 1
+        self.server.timeout = 0.001
+        # Long enough that the worker is still busy with it when the second request arrives
+        data = json.loads(self.sample)
+        data["professional_experience"] = data["professional_experience"] * 30
+        status, _, _ = await request(self.server.port, "POST", "/render", json.dumps(data).encode())
+        self.assertEqual(status, 504)
+        self.assertEqual(self.server.pending, 1)
+        status, _, _ = await request(self.server.port, "POST", "/render", self.sample)
+        self.assertEqual(status, 503)
+
+        for _ in range(200):
+            if not self.server.pending:
+                break
+            await asyncio.sleep(0.05)
+        self.assertEqual(self.server.pending, 0)
+
+    async def test_metrics_disabled_by_default(self):
+        status, _, _ = await request(self.server.port, "GET", "/metrics")
+        self.assertEqual(status, 404)
+
+class TestRenderServerImages(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        from PIL import Image
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, "images")
+        os.makedirs(self.root)
+        Image.new("RGB", (40, 40), "blue").save(os.path.join(self.root, "photo.png"))
+        # A file the service can read but a client must not reach
+        self.secret = os.path.join(self.tmp.name, "secret.png")
+        Image.new("RGB", (40, 40), "red").save(self.secret)
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+
+    async def _post(self, server, photo=None, logo=None):
+        data = dict(self.sample, photo=photo) if photo else dict(self.sample)
+        if logo:
+            data["professional_experience"] = [dict(exp, logo=logo) for exp in data["professional_experience"]]
+        return await request(server.port, "POST", "/render", json.dumps(data).encode())
+
+    async def _start(self, **options):
+        server = RenderServer(port=0, workers=1, timeout=30.0, **options)
+        await server.start()
+        self.addAsyncCleanup(server.close)
+        return server
+
+    async def test_images_are_refused_without_an_image_root(self):
+        server = await self._start()
+        for options in ({"photo": self.secret}, {"logo": self.secret}):
+            status, _, payload = await self._post(server, **options)
+            self.assertEqual(status, 400)
+            self.assertIn("--image-root", json.loads(payload)["error"])
+        status, _, _ = await self._post(server)
+        self.assertEqual(status, 200)
+
+    async def test_images_are_read_from_the_image_root_only(self):
+        server = await self._start(image_root=self.root)
+        status, _, payload = await self._post(server, photo="photo.png")
+        self.assertEqual(status, 200)
+        self.assertIn(b"/Subtype /Image", payload)
+
+        os.symlink(self.secret, os.path.join(self.root, "link.png"))
+        for path in (self.secret, "../secret.png", "link.png"):
+            for options in ({"photo": path}, {"logo": path}):
+                status, _, payload = await self._post(server, **options)
+                self.assertEqual(status, 400, path)
+                self.assertIn("outside the image root", json.loads(payload)["error"])
+
+class TestRenderServerMetrics(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        import instrumentation
+        self.addCleanup(instrumentation.reset)
+        self.addCleanup(instrumentation.disable)
+        self.server = RenderServer(port=0, workers=1, timeout=30.0, metrics=True)
+        await self.server.start()
+        with open(SAMPLE_PATH, 'rb') as f:
+            self.sample = f.read()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_metrics_include_worker_stages(self):
+        """Timings recorded inside the worker are merged into GET /metrics."""
+        await request(self.server.port, "POST", "/render", self.sample)
+        status, headers, payload = await request(self.server.port, "GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertTrue(headers["Content-Type"].startswith("text/plain"))
+        self.assertIn(b'resume_stage_seconds_count{stage="render.education"} 1', payload)
+        self.assertIn(b'resume_stage_seconds_count{stage="validate"} 1', payload)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import json
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from themes import Theme, get_theme, register_theme
+from pdf_generator import generate_resume_pdf
+
+class TestThemes(unittest.TestCase):
+
+    def test_get_theme_by_name(self):
+        """Themes are looked up by name and instances pass through unchanged."""
+        theme = get_theme("compact")
+        self.assertEqual(theme.name, "compact")
+        self.assertIs(get_theme(theme), theme)
+
+    def test_get_theme_unknown_name(self):
+        """An unknown theme name raises a ValueError listing the available themes."""
+        with self.assertRaises(ValueError) as ctx:
+            get_theme("does-not-exist")
+        self.assertIn("default", str(ctx.exception))
+
+    def test_styles_and_headers_are_built_once(self):
+        """Styles are shared; flowables are copies of one prebuilt prototype so layout state never leaks."""
+        theme = register_theme(Theme("test-cached", margin=50))
+        self.assertIs(theme.styles, theme.styles)
+        first, second = theme.section_header("EDUCATION"), theme.section_header("EDUCATION")
+        self.assertIsNot(first[0], second[0])
+        self.assertIs(first[0].frags, second[0].frags)
+        self.assertIsNot(theme.spacer(12), theme.spacer(12))
+        self.assertEqual(theme.frame_width, 612.0 - 100)
+
+    @patch("pdf_generator.SimpleDocTemplate")
+    def test_generate_resume_pdf_uses_theme_metrics(self, MockSimpleDocTemplate):
+        """The document template is created from the selected theme's page metrics."""
+        MockSimpleDocTemplate.return_value = MagicMock()
+        data_path = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+        with open(data_path, 'r') as f:
+            data = json.load(f)
+
+        with patch("os.makedirs"):
+            generate_resume_pdf(data, output_folder="mock_output", theme="compact")
+
+        _, kwargs = MockSimpleDocTemplate.call_args
+        self.assertEqual(kwargs["topMargin"], 28)
+        self.assertEqual(kwargs["leftMargin"], 28)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import sys
+import os
+import json
+import copy
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from validator import validate_data, validate_resume, validate_batch, get_validation_plan
+from resume_model import to_model
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestValidator(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.data = json.load(f)
+
+    def test_valid_sample(self):
+        """The bundled sample resume passes validation."""
+        self.assertEqual(validate_data(self.data), (True, []))
+
+    def test_missing_top_level_fields(self):
+        """Empty input reports every required top-level field."""
+        is_valid, errors = validate_data({})
+        self.assertFalse(is_valid)
+        self.assertIn("'name' is required and cannot be empty.", errors)
+        self.assertIn("'skills' is required and cannot be empty.", errors)
+
+    def test_structured_error_paths(self):
+        """Errors carry the path of the offending field, including list indexes."""
+        data = copy.deepcopy(self.data)
+        data["professional_experience"][1]["dates"] = "June 2024 - May 2020"
+        data["contact"]["email"] = "not-an-email"
+
+        errors = validate_resume(data)
+        self.assertIn(("contact.email", "format", "Invalid email format."), errors)
+        self.assertIn("professional_experience[1].dates", [error.path for error in errors])
+
+    def test_type_errors_are_reported(self):
+        """Values of the wrong type are reported instead of crashing the validator."""
+        data = copy.deepcopy(self.data)
+        data["contact"]["phone"] = 1234567890
+        data["projects"][0]["tech_stack"] = "Python"
+        data["skills"]["soft_skills"] = []
+
+        is_valid, errors = validate_data(data)
+        self.assertFalse(is_valid)
+        self.assertIn("'contact.phone' must be a string.", errors)
+        self.assertIn("Each project entry must have a tech stack as a list.", errors)
+        self.assertIn("Skills category 'soft_skills' must be a non-empty list.", errors)
+
+    def test_empty_contact_fields_are_bad_formats(self):
+        """As before the schema: an empty email, phone or LinkedIn URL fails its format, a missing one is required."""
+        data = copy.deepcopy(self.data)
+        data["contact"]["email"] = ""
+        data["contact"]["phone"] = ""
+        del data["contact"]["linkedin"]
+
+        is_valid, errors = validate_data(data)
+        self.assertFalse(is_valid)
+        self.assertIn("Invalid email format.", errors)
+        self.assertIn("Invalid phone number format. Use '+<Country Code> <10 digits>'.", errors)
+        self.assertIn("Contact LinkedIn profile is required.", errors)
+        self.assertNotIn("Contact email is required.", errors)
+
+    def test_fail_fast_stops_at_first_error(self):
+        """Fail-fast mode returns a single error; the plan is compiled once and reused."""
+        self.assertEqual(len(validate_resume({}, fail_fast=True)), 1)
+        self.assertIs(get_validation_plan(), get_validation_plan())
+        self.assertTrue(get_validation_plan().is_valid(self.data))
+
+    def _broken_corpus(self):
+        corpus = []
+        for index in range(12):
+            data = copy.deepcopy(self.data)
+            data["name"] = f"Person {index}"
+            corpus.append(data)
+        corpus[1]["contact"]["email"] = "not-an-email"
+        corpus[2]["professional_experience"][1]["dates"] = "June 2024 - May 2020"
+        corpus[3]["skills"] = {"languages": [], "tools": ["git", 3]}
+        corpus[4]["education"] = [{}, "MIT"]
+        corpus[5]["contact"] = {}
+        corpus[6] = []
+        corpus[7]["projects"][0]["tech_stack"] = "Python"
+        del corpus[8]["name"]
+        corpus[9]["professional_experience"][0]["dates"] = "Someday - Present"
+        corpus[10]["contact"]["phone"] = ""
+        del corpus[11]["contact"]["linkedin"]
+        return corpus
+
+    def test_batch_finds_the_same_errors_as_per_record(self):
+        """Column-wise validation reports each record's errors as (record, code, path) rows."""
+        corpus = self._broken_corpus()
+        result = validate_batch(corpus, now=(2024, 9), chunk_size=5)
+
+        self.assertEqual(result.count, len(corpus))
+        self.assertEqual(list(result.records), sorted(result.records))
+        found = [[] for _ in corpus]
+        for record, code, path in zip(result.records, result.codes, result.paths):
+            found[record].append((path, code))
+        for index, data in enumerate(corpus):
+            expected = [(error.path, error.code) for error in validate_resume(data, now=(2024, 9))]
+            self.assertEqual(sorted(found[index]), sorted(expected), index)
+
+    def test_batch_counts_errors_per_rule(self):
+        result = validate_batch(self._broken_corpus(), now=(2024, 9))
+
+        self.assertEqual(result.counts[("contact.email", "format")], 1)
+        self.assertEqual(result.counts[("contact.phone", "format")], 1)
+        self.assertEqual(result.counts[("contact.linkedin", "required")], 2)
+        self.assertEqual(result.counts[("professional_experience[].dates", "format")], 2)
+        self.assertEqual(result.counts[("skills.*", "required")], 1)
+        self.assertEqual(result.counts[("skills.*[]", "type")], 1)
+        self.assertEqual(result.counts[("", "type")], 1)
+        self.assertEqual(sum(result.counts.values()), len(result.codes))
+
+    def test_batch_accepts_models_and_valid_corpora(self):
+        corpus = [to_model(self.data)] * 3 + [self.data]
+        result = validate_batch(iter(corpus))
+        self.assertEqual((result.count, len(result.codes)), (4, 0))
+
+if __name__ == "__main__":
+    unittest.main()
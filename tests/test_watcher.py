@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the 'src' directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from watcher import iter_changes, render_file, run_watch
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '../data/user_data.json')
+
+class TestWatcher(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_PATH, 'r') as f:
+            self.sample = json.load(f)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output = os.path.join(self.tmp.name, "out")
+
+    def _write(self, name, data, mtime=None):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def test_first_round_has_every_file_then_only_changed_ones(self):
+        first = self._write("a.json", self.sample, mtime=1_000_000)
+        second = self._write("b.json", self.sample, mtime=1_000_000)
+        changes = iter_changes(self.tmp.name, interval=0.001, debounce=0.01)
+
+        self.assertEqual(next(changes), [first, second])
+        self._write("b.json", dict(self.sample, name="Changed"))
+        self.assertEqual(next(changes), [second])
+
+    def test_rapid_saves_are_debounced_into_one_change(self):
+        path = self._write("a.json", self.sample, mtime=1_000_000)
+        changes = iter_changes(path, interval=0.001, debounce=0.2)
+        next(changes)
+
+        for index in range(3):
+            self._write("a.json", dict(self.sample, name=f"Save {index}"), mtime=1_000_001 + index)
+        self.assertEqual(next(changes), [path])
+        with open(path, 'r') as f:
+            self.assertEqual(json.load(f)["name"], "Save 2")
+
+    def test_render_file_reports_timings(self):
+        path = self._write("a.json", self.sample)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rendered = render_file(path, self.output)
+
+        self.assertEqual(rendered, 1)
+        self.assertTrue(os.path.exists(os.path.join(self.output, "John_Doe_resume.pdf")))
+        self.assertRegex(output.getvalue(), r"load [\d.]+ ms, validate [\d.]+ ms, render [\d.]+ ms")
+
+    def test_invalid_file_is_reported_and_not_rendered(self):
+        contact = dict(self.sample["contact"], email="not-an-email")
+        path = self._write("a.json", dict(self.sample, contact=contact))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rendered = render_file(path, self.output)
+
+        self.assertEqual(rendered, 0)
+        self.assertIn("validation error(s)", output.getvalue())
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_render_file_checks_every_resume_against_one_month(self):
+        path = os.path.join(self.tmp.name, "resumes.jsonl")
+        with open(path, 'w') as f:
+            for index in range(2):
+                f.write(json.dumps(dict(self.sample, name=f"Person {index}")) + "\n")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            # "September 2021 - Present" ends before it starts when now is January 2020
+            rendered = render_file(path, self.output, now=(2020, 1))
+
+        self.assertEqual(rendered, 0)
+        self.assertEqual(output.getvalue().count("Invalid dates in professional experience"), 2)
+
+    def test_run_watch_stops_after_iterations(self):
+        self._write("a.json", self.sample)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rounds = run_watch(self.tmp.name, self.output, iterations=1, interval=0.001, debounce=0.01)
+
+        self.assertEqual(rounds, 1)
+        self.assertIn("Round 1: 1 file(s)", output.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.output, "John_Doe_resume.pdf")))
+
+if __name__ == '__main__':
+    unittest.main()